@@ -1,8 +1,14 @@
 import redis
 import json
+import logging
+import threading
+import time
+import uuid
 from functools import wraps
 from app.core.config import Config
 
+logger = logging.getLogger(__name__)
+
 # Initialize Redis/Valkey client
 redis_client = None
 
@@ -61,6 +67,36 @@ def cache_set(key, value, ttl=None):
     except Exception:
         return False
 
+def cache_get_many(keys):
+    """Get several values from cache in one round trip (missing keys map to None)"""
+    try:
+        client = get_cache()
+        if not client or not keys:
+            return {}
+        
+        values = client.mget(keys)
+        return {key: json.loads(value) if value else None for key, value in zip(keys, values)}
+    except Exception:
+        return {}
+
+def cache_set_many(mapping, ttl=None):
+    """Set several values in cache with the same TTL in one round trip"""
+    if ttl is None:
+        from app.core.config import Config
+        ttl = Config.CACHE_TTL
+    try:
+        client = get_cache()
+        if not client:
+            return False
+        
+        pipe = client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.setex(key, ttl, json.dumps(value))
+        pipe.execute()
+        return True
+    except Exception:
+        return False
+
 def cache_delete(key):
     """Delete key from cache"""
     try:
@@ -73,6 +109,56 @@ def cache_delete(key):
     except Exception:
         return False
 
+def cache_incr(key):
+    """Atomically increment an integer counter (created at 1, never expires)"""
+    try:
+        client = get_cache()
+        if not client:
+            return None
+        
+        return client.incr(key)
+    except Exception:
+        return None
+
+# Delete the lock only if it still holds our token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+def cache_acquire_lock(key, ttl):
+    """
+    Acquire a cross-process lock (SET NX EX)
+    
+    Without a reachable cache there is nothing to coordinate with, so the
+    lock is always granted.
+    
+    Returns:
+        Lock token, or None if another process holds the lock
+    """
+    token = uuid.uuid4().hex
+    try:
+        client = get_cache()
+        if not client:
+            return token
+        
+        return token if client.set(key, token, nx=True, ex=ttl) else None
+    except Exception:
+        return token
+
+def cache_release_lock(key, token):
+    """Release a lock acquired with cache_acquire_lock"""
+    try:
+        client = get_cache()
+        if not client:
+            return False
+        
+        return bool(client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token))
+    except Exception:
+        return False
+
 def cached(ttl=None, key_prefix=''):
     """Decorator to cache function results"""
     if ttl is None:
@@ -100,3 +186,66 @@ def cached(ttl=None, key_prefix=''):
         
         return wrapper
     return decorator
+
+class VersionedLocalCache:
+    """
+    Process-local value rebuilt when a shared version counter is bumped
+    
+    The value is loaded once and rebuilt only when the counter changes (a
+    counter nobody has bumped yet is a valid version), when this process
+    invalidates it or when the last load failed. The counter is checked at
+    most every check_interval seconds; without a reachable cache only local
+    invalidations are seen.
+    """
+    
+    def __init__(self, version_key, load, empty, check_interval):
+        """
+        Args:
+            version_key: Cache key of the shared version counter
+            load: Callable building the value (gets the arguments passed to get)
+            empty: Callable giving a stand-in value when the first load fails
+            check_interval: Seconds between version checks
+        """
+        self.version_key = version_key
+        self._load = load
+        self._empty = empty
+        self._check_interval = check_interval
+        self._value = None
+        self._version = None
+        self._loaded = False
+        self._checked_at = None
+        self._lock = threading.Lock()
+    
+    def _fresh(self, now):
+        return self._checked_at is not None and now - self._checked_at < self._check_interval
+    
+    def get(self, *args):
+        """Get the value, rebuilding it if the shared version changed"""
+        now = time.monotonic()
+        if self._fresh(now):
+            return self._value
+        
+        with self._lock:
+            if self._fresh(now):
+                return self._value
+            
+            version = cache_get(self.version_key)
+            if not self._loaded or version != self._version:
+                try:
+                    self._value = self._load(*args)
+                    self._version = version
+                    self._loaded = True
+                except Exception as e:
+                    logger.warning(f'Could not load {self.version_key}: {str(e)}')
+                    self._loaded = False
+                    if self._value is None:
+                        self._value = self._empty()
+            
+            self._checked_at = now
+            return self._value
+    
+    def invalidate(self):
+        """Make every process rebuild the value on its next check, this one right away"""
+        cache_incr(self.version_key)
+        self._loaded = False
+        self._checked_at = None
@@ -35,12 +35,75 @@ class Config:
         if url.strip()
     ]
     
+    # Maximum number of sources fetched at the same time
+    FETCH_CONCURRENCY = int(os.getenv('FETCH_CONCURRENCY', '20'))
+    
+    # Per-source connect/read timeouts and overall crawl deadline (seconds)
+    FETCH_CONNECT_TIMEOUT = float(os.getenv('FETCH_CONNECT_TIMEOUT', '5'))
+    FETCH_READ_TIMEOUT = float(os.getenv('FETCH_READ_TIMEOUT', '15'))
+    CRAWL_DEADLINE = float(os.getenv('CRAWL_DEADLINE', '45'))
+    
+    # Parse process pool (0 parses on the fetch threads) and batching of downloads sent to it
+    PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', str(os.cpu_count() or 1)))
+    PARSE_BATCH_SIZE = int(os.getenv('PARSE_BATCH_SIZE', '8'))
+    PARSE_BATCH_DELAY = float(os.getenv('PARSE_BATCH_DELAY', '0.05'))  # Seconds to wait to fill a batch
+    
+    # Streaming feed parser limits
+    FEED_MAX_BYTES = int(os.getenv('FEED_MAX_BYTES', str(5 * 1024 * 1024)))  # Bytes of a feed body parsed
+    FEED_SUMMARY_BUDGET = int(os.getenv('FEED_SUMMARY_BUDGET', '8192'))  # Characters of entry HTML kept
+    
+    # Content-addressed archive of fetched bodies (opt-in; never pruned, so
+    # only enable it while collecting a replay corpus)
+    FEED_ARCHIVE_DIR = os.getenv('FEED_ARCHIVE_DIR', '')
+    
+    # Shared HTTP connection pool for source fetchers
+    HTTP_POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', '50'))  # Hosts kept in the keep-alive connection pool
+    DNS_CACHE_TTL = int(os.getenv('DNS_CACHE_TTL', '300'))  # Seconds to cache DNS lookups (0 disables)
+    
+    # Adaptive per-source scheduling (seconds)
+    SCHEDULER_TICK = int(os.getenv('SCHEDULER_TICK', '60'))
+    SOURCE_MIN_INTERVAL = int(os.getenv('SOURCE_MIN_INTERVAL', '300'))
+    SOURCE_MAX_INTERVAL = int(os.getenv('SOURCE_MAX_INTERVAL', '21600'))
+    SOURCE_INTERVAL_JITTER = float(os.getenv('SOURCE_INTERVAL_JITTER', '0.1'))
+    
+    # Per-source circuit breaker (failures before opening, backoff in seconds)
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '3'))
+    CIRCUIT_BASE_BACKOFF = int(os.getenv('CIRCUIT_BASE_BACKOFF', '300'))
+    CIRCUIT_MAX_BACKOFF = int(os.getenv('CIRCUIT_MAX_BACKOFF', '86400'))
+    
+    # Trigram language identification (texts shorter than the minimum are kept;
+    # another language must beat English by the margin, in log-likelihood per trigram)
+    LANGUAGE_MIN_TRIGRAMS = int(os.getenv('LANGUAGE_MIN_TRIGRAMS', '30'))
+    LANGUAGE_MIN_MARGIN = float(os.getenv('LANGUAGE_MIN_MARGIN', '0.25'))
+    
+    # Seconds between checks of the shared Source registry version
+    SOURCE_REGISTRY_CHECK_INTERVAL = int(os.getenv('SOURCE_REGISTRY_CHECK_INTERVAL', '30'))
+    
+    # Seconds between checks of the shared tag catalog version
+    TAG_CATALOG_CHECK_INTERVAL = int(os.getenv('TAG_CATALOG_CHECK_INTERVAL', '30'))
+    
+    # Engagement (reads, bookmarks, feedback) added on top of article quality scores
+    ENGAGEMENT_WEIGHT = float(os.getenv('ENGAGEMENT_WEIGHT', '0.1'))
+    
+    # Near-duplicate story clustering (max differing SimHash bits, -1 disables;
+    # catches near-identical text, not the same story under a new headline)
+    NEAR_DUPLICATE_DISTANCE = int(os.getenv('NEAR_DUPLICATE_DISTANCE', '3'))
+    
     # Database settings
     DATABASE_URL = os.getenv('DATABASE_URL', '')
     
     # Redis/Valkey settings
     REDIS_URL = os.getenv('REDIS_URL', '')
     CACHE_TTL = int(os.getenv('CACHE_TTL' ''))  # Default 15 minutes
+    CACHE_STALE_GRACE = int(os.getenv('CACHE_STALE_GRACE', '600'))  # Serve expired feeds for up to 10 minutes while refreshing
+    CACHE_LOCK_TTL = int(os.getenv('CACHE_LOCK_TTL', '120'))  # Max seconds a feed refresh holds its lock
+    CACHE_LOCK_WAIT = int(os.getenv('CACHE_LOCK_WAIT', '30'))  # Seconds to wait for another process's refresh
+    FEED_VALIDATOR_TTL = int(os.getenv('FEED_VALIDATOR_TTL', '86400'))  # Keep ETag/Last-Modified for 24 hours
+    SEEN_ENTRY_TTL = int(os.getenv('SEEN_ENTRY_TTL', '604800'))  # Keep processed entry results for 7 days
+    
+    # Feed snapshots built from the articles table
+    FEED_WINDOW_DAYS = int(os.getenv('FEED_WINDOW_DAYS', '7'))  # Serve articles published in the last 7 days
+    FEED_SNAPSHOT_LIMIT = int(os.getenv('FEED_SNAPSHOT_LIMIT', '2000'))  # Newest articles per snapshot
     
     # Social media sources
     REDDIT_SUBREDDITS = [
@@ -65,6 +128,15 @@ class Config:
     RESEND_FROM_EMAIL = os.getenv('RESEND_FROM_EMAIL', 'noreply@yourdomain.com')
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
     
+    # Gemini categorization queue (quota is per process)
+    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+    GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.0-flash')
+    GEMINI_BATCH_SIZE = int(os.getenv('GEMINI_BATCH_SIZE', '20'))  # Articles per request
+    GEMINI_BATCH_DELAY = float(os.getenv('GEMINI_BATCH_DELAY', '2'))  # Seconds to wait to fill a batch
+    GEMINI_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '12'))
+    GEMINI_BURST = int(os.getenv('GEMINI_BURST', '1'))  # Requests allowed back to back
+    GEMINI_QUEUE_SIZE = int(os.getenv('GEMINI_QUEUE_SIZE', '2000'))  # Articles waiting; extra keep keyword categories
+    
     # Google OAuth settings
     GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID', '')
     GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET', '')
@@ -1,17 +1,29 @@
 """Background task scheduler for periodic feed fetching"""
 from apscheduler.schedulers.background import BackgroundScheduler
-from app.services.feed_service import get_all_feeds
+from app.services.feed_service import get_all_feeds, crawl_sources, refresh_feeds_from_sources, CANONICAL_FEEDS_KEY
+from app.services.source_service import (
+    sync_config_sources, get_due_sources, job_for_source,
+    count_new_entries, schedule_next_fetch
+)
+from app.core.cache import cache_get
+from app.utils.source_registry import bump_source_registry
 from app.core.config import Config
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 scheduler = None
 
+# Monotonic time of the last full crawl, used when per-source scheduling is unavailable
+_last_full_crawl = None
+
 def fetch_feeds_job():
     """Background job to fetch and cache feeds"""
     from app.core.database import cleanup_connections
     try:
+        global _last_full_crawl
         logger.info('Background job: Fetching feeds...')
+        _last_full_crawl = time.monotonic()
         articles = get_all_feeds()
         logger.info(f'Background job: Cached {len(articles)} articles')
     except Exception as e:
@@ -20,6 +32,69 @@ def fetch_feeds_job():
         # Cleanup all database connections after background job
         cleanup_connections()
 
+def _fetch_due_sources():
+    """Fetch due sources, reschedule them and rebuild the feed cache"""
+    from app.core.database import get_db
+    from app.models.source import Source
+    
+    # Load the due jobs, then release the session for the length of the crawl
+    with get_db() as db:
+        created = sync_config_sources(db)
+        source_ids_by_job = {job_for_source(source): source.id for source in get_due_sources(db)}
+    
+    # New Source rows are committed now, so other processes can load them
+    if created:
+        bump_source_registry()
+    
+    results = {}
+    if source_ids_by_job:
+        def on_result(job, articles, elapsed, error):
+            # Count before the crawl replaces the source's stored articles
+            results[job] = (count_new_entries(job, articles), elapsed, error is None)
+        
+        crawl_sources(list(source_ids_by_job), on_result=on_result)
+    
+    with get_db() as db:
+        if source_ids_by_job:
+            sources = db.query(Source).filter(Source.id.in_(source_ids_by_job.values())).all()
+            sources_by_id = {source.id: source for source in sources}
+            for job, source_id in source_ids_by_job.items():
+                source = sources_by_id.get(source_id)
+                if source is None:
+                    continue
+                # Errors and sources that missed the crawl deadline count as
+                # failures and feed the circuit breaker
+                new_entries, elapsed, succeeded = results.get(job, (0, None, False))
+                schedule_next_fetch(source, new_entries, elapsed, succeeded=succeeded)
+        
+        # Nothing changed and the feed cache is still warm
+        if not source_ids_by_job and cache_get(CANONICAL_FEEDS_KEY) is not None:
+            active_jobs = None
+        else:
+            active_jobs = [job_for_source(source) for source in db.query(Source).filter(Source.is_active).all()]
+    
+    if active_jobs is None:
+        return 0, 0
+    
+    articles = refresh_feeds_from_sources(active_jobs)
+    return len(source_ids_by_job), len(articles)
+
+def fetch_due_sources_job():
+    """Background job to fetch only the sources whose adaptive interval has passed"""
+    from app.core.database import cleanup_connections
+    try:
+        due_count, article_count = _fetch_due_sources()
+        if due_count:
+            logger.info(f'Background job: Fetched {due_count} due sources, cached {article_count} articles')
+    except Exception as e:
+        logger.error(f'Per-source fetch failed: {str(e)}')
+        
+        # Without the sources table fall back to a full crawl every CACHE_TTL
+        if _last_full_crawl is None or time.monotonic() - _last_full_crawl >= Config.CACHE_TTL:
+            fetch_feeds_job()
+    finally:
+        cleanup_connections()
+
 def init_scheduler():
     """Initialize and start the background scheduler"""
     global scheduler
@@ -29,10 +104,10 @@ def init_scheduler():
     
     scheduler = BackgroundScheduler()
     
-    # Schedule feed fetching based on CACHE_TTL
-    interval_seconds = Config.CACHE_TTL
+    # Check for due sources every SCHEDULER_TICK; each source runs on its own interval
+    interval_seconds = Config.SCHEDULER_TICK
     scheduler.add_job(
-        fetch_feeds_job,
+        fetch_due_sources_job,
         'interval',
         seconds=interval_seconds,
         id='fetch_feeds',
@@ -49,7 +124,7 @@ def init_scheduler():
     )
     
     scheduler.start()
-    logger.info(f'Scheduler started: fetching feeds every {interval_seconds} seconds')
+    logger.info(f'Scheduler started: checking for due sources every {interval_seconds} seconds')
     
     return scheduler
 
@@ -9,6 +9,7 @@ from app.core.oauth import init_oauth
 from app.core.cache import init_cache
 from app.core.scheduler import init_scheduler, shutdown_scheduler
 import atexit
+import multiprocessing
 
 # import blueprints
 from app.routes import rss, scrape, feeds, users, social, auth, bookmarks, read_history, trending, stats, popular, onboarding, tags, feedback
@@ -34,11 +35,13 @@ init_oauth(app)
 # Initialize cache
 init_cache()
 
-# Initialize background scheduler
-init_scheduler()
-
-# Shutdown scheduler on app exit
-atexit.register(shutdown_scheduler)
+# Initialize background scheduler (spawned parse workers re-import the
+# entry point and must not start their own)
+if multiprocessing.current_process().name == 'MainProcess':
+    init_scheduler()
+    
+    # Shutdown scheduler on app exit
+    atexit.register(shutdown_scheduler)
 
 # Register error handlers
 register_error_handlers(app)
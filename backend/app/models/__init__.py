@@ -8,6 +8,8 @@ from app.models.tag import Tag
 from app.models.user_tag import UserTag
 from app.models.source import Source
 from app.models.article_feedback import ArticleFeedback
+from app.models.article import Article
+from app.models.article_engagement import ArticleEngagement
 
 __all__ = [
     'User', 
@@ -18,5 +20,7 @@ __all__ = [
     'Tag',
     'UserTag',
     'Source',
-    'ArticleFeedback'
+    'ArticleFeedback',
+    'Article',
+    'ArticleEngagement'
 ]
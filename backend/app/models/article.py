@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class Article(Base):
+    """Ingested article, the source of truth for feed snapshots"""
+    __tablename__ = 'articles'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    link = Column(String, nullable=False, unique=True)
+    title = Column(String, nullable=False)
+    source = Column(String)
+    type = Column(String(20))  # rss, scrape, reddit, youtube
+    source_key = Column(String)  # Fetch job the article came from, e.g. rss:<feed url>
+    published_at = Column(DateTime(timezone=True))
+    categories = Column(JSONB, default=list)
+    content_score = Column(Float)
+    data = Column(JSONB, nullable=False)  # Normalized article as served, including source-specific fields
+    first_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index('idx_article_published', 'published_at'),
+        Index('idx_article_source', 'source'),
+        Index('idx_article_type_published', 'type', 'published_at'),
+        Index('idx_article_categories', 'categories', postgresql_using='gin'),
+    )
+    
+    def to_dict(self):
+        """Convert model to the article dict served by the feed endpoints"""
+        article = dict(self.data)
+        article['categories'] = self.categories or []
+        if 'published_ts' not in article:
+            # Rows stored before ingest-time date stamping
+            article['published_ts'] = int(self.published_at.timestamp()) if self.published_at else None
+        return article
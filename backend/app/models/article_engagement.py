@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class ArticleEngagement(Base):
+    """Running engagement counts per article, updated alongside reads, bookmarks and feedback"""
+    __tablename__ = 'article_engagement'
+    
+    article_url = Column(String, primary_key=True)
+    reads = Column(Integer, nullable=False, default=0, server_default='0')
+    bookmarks = Column(Integer, nullable=False, default=0, server_default='0')
+    helpful = Column(Integer, nullable=False, default=0, server_default='0')
+    negative = Column(Integer, nullable=False, default=0, server_default='0')  # not_helpful, spam, low_quality
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            'article_url': self.article_url,
+            'reads': self.reads,
+            'bookmarks': self.bookmarks,
+            'helpful': self.helpful,
+            'negative': self.negative
+        }
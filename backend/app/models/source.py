@@ -1,5 +1,7 @@
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ARRAY
 from sqlalchemy.sql import func
+from app.core.config import Config
 from app.core.database import Base
 
 class Source(Base):
@@ -17,12 +19,17 @@ class Source(Base):
     
     # Performance metrics
     last_fetched_at = Column(DateTime(timezone=True))
-    fetch_frequency = Column(Integer, default=900)  # seconds
+    next_fetch_at = Column(DateTime(timezone=True), index=True)  # Adaptive per-source schedule
+    fetch_frequency = Column(Integer, default=900)  # seconds, learned from new-entry rate
     error_count = Column(Integer, default=0)
     success_count = Column(Integer, default=0)
     success_rate = Column(Float, default=1.0)
     avg_fetch_time = Column(Float, default=0.0)  # seconds
     
+    # Circuit breaker: opens after CIRCUIT_FAILURE_THRESHOLD consecutive failures
+    consecutive_failures = Column(Integer, default=0)
+    circuit_open_until = Column(DateTime(timezone=True))
+    
     # Metadata
     description = Column(String(500))
     added_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -40,9 +47,12 @@ class Source(Base):
             'quality_tier': self.quality_tier,
             'is_active': self.is_active,
             'last_fetched_at': self.last_fetched_at.isoformat() if self.last_fetched_at else None,
+            'next_fetch_at': self.next_fetch_at.isoformat() if self.next_fetch_at else None,
             'fetch_frequency': self.fetch_frequency,
             'success_rate': self.success_rate,
             'avg_fetch_time': self.avg_fetch_time,
+            'circuit_state': self.circuit_state(),
+            'circuit_open_until': self.circuit_open_until.isoformat() if self.circuit_open_until else None,
             'description': self.description,
             'added_at': self.added_at.isoformat() if self.added_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
@@ -61,12 +71,37 @@ class Source(Base):
         # Update success rate
         self.success_rate = self.success_count / total_fetches if total_fetches > 0 else 1.0
     
-    def record_error(self):
-        """Record failed fetch"""
+        # Close the circuit
+        self.consecutive_failures = 0
+        self.circuit_open_until = None
+    
+    def record_error(self, now=None):
+        """Record failed fetch, opening the circuit after repeated failures"""
         self.error_count += 1
         total_fetches = self.success_count + self.error_count
         self.success_rate = self.success_count / total_fetches if total_fetches > 0 else 0.0
         
-        # Disable source if error rate is too high
-        if self.error_count >= 10 and self.success_rate < 0.3:
-            self.is_active = False
+        # Open (or re-open after a failed half-open trial) with exponential backoff
+        self.consecutive_failures = (self.consecutive_failures or 0) + 1
+        if self.consecutive_failures >= Config.CIRCUIT_FAILURE_THRESHOLD:
+            trips = self.consecutive_failures - Config.CIRCUIT_FAILURE_THRESHOLD
+            backoff = min(Config.CIRCUIT_BASE_BACKOFF * (2 ** trips), Config.CIRCUIT_MAX_BACKOFF)
+            self.circuit_open_until = (now or datetime.now(timezone.utc)) + timedelta(seconds=backoff)
+    
+    def circuit_state(self, now=None):
+        """
+        Get the circuit breaker state
+        
+        Returns:
+            'closed', 'open' (fetches skipped until circuit_open_until) or
+            'half-open' (the next fetch is a trial)
+        """
+        if (self.consecutive_failures or 0) < Config.CIRCUIT_FAILURE_THRESHOLD or self.circuit_open_until is None:
+            return 'closed'
+        
+        open_until = self.circuit_open_until
+        if open_until.tzinfo is None:
+            open_until = open_until.replace(tzinfo=timezone.utc)
+        if open_until > (now or datetime.now(timezone.utc)):
+            return 'open'
+        return 'half-open'
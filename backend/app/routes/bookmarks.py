@@ -4,6 +4,8 @@ from app.models.bookmark import Bookmark
 from app.schemas.bookmark import BookmarkCreate
 from app.core.auth import require_auth
 from app.core.errors import BadRequestError, NotFoundError, InternalServerError
+from app.services.engagement_service import record_engagement
+from app.utils.url_canonical import canonicalize_url
 from pydantic import ValidationError
 
 bp = Blueprint('bookmarks', __name__, url_prefix='/api/bookmarks')
@@ -20,10 +22,12 @@ def create_bookmark():
         except ValidationError as e:
             raise BadRequestError(str(e))
         
+        article_url = canonicalize_url(bookmark_data.article_url)
+        
         with get_db() as db:
             existing = db.query(Bookmark).filter(
                 Bookmark.user_id == g.user_id,
-                Bookmark.article_url == bookmark_data.article_url
+                Bookmark.article_url == article_url
             ).first()
             
             if existing:
@@ -31,11 +35,12 @@ def create_bookmark():
             
             bookmark = Bookmark(
                 user_id=g.user_id,
-                article_url=bookmark_data.article_url,
+                article_url=article_url,
                 title=bookmark_data.title,
                 source=bookmark_data.source
             )
             db.add(bookmark)
+            record_engagement(db, article_url, bookmarks=1)
             db.flush()
             
             return jsonify(bookmark.to_dict()), 201
@@ -90,6 +95,7 @@ def delete_bookmark(bookmark_id):
                 raise NotFoundError('Bookmark not found')
             
             db.delete(bookmark)
+            record_engagement(db, bookmark.article_url, bookmarks=-1)
             db.flush()
             
             return jsonify({'message': 'Bookmark deleted'})
@@ -5,6 +5,8 @@ from app.core.auth import require_auth
 from app.core.errors import BadRequestError, InternalServerError
 from app.models.article_feedback import ArticleFeedback
 from app.schemas.feedback import ArticleFeedbackRequest
+from app.services.engagement_service import record_feedback_change
+from app.utils.url_canonical import canonicalize_url
 from pydantic import ValidationError
 
 bp = Blueprint('feedback', __name__, url_prefix='/api/feedback')
@@ -23,15 +25,18 @@ def submit_feedback():
         except ValidationError as e:
             raise BadRequestError(str(e))
         
+        article_url = canonicalize_url(feedback_data.article_url)
+        
         with get_db() as db:
             # Check if user already gave feedback for this article
             existing = db.query(ArticleFeedback).filter(
                 ArticleFeedback.user_id == user_id,
-                ArticleFeedback.article_url == feedback_data.article_url
+                ArticleFeedback.article_url == article_url
             ).first()
             
             if existing:
                 # Update existing feedback
+                record_feedback_change(db, article_url, existing.feedback_type, feedback_data.feedback_type)
                 existing.feedback_type = feedback_data.feedback_type
                 existing.reason = feedback_data.reason
                 feedback = existing
@@ -39,11 +44,12 @@ def submit_feedback():
                 # Create new feedback
                 feedback = ArticleFeedback(
                     user_id=user_id,
-                    article_url=feedback_data.article_url,
+                    article_url=article_url,
                     feedback_type=feedback_data.feedback_type,
                     reason=feedback_data.reason
                 )
                 db.add(feedback)
+                record_feedback_change(db, article_url, None, feedback_data.feedback_type)
             
             db.flush()
             
@@ -68,6 +74,7 @@ def get_article_feedback():
         article_url = request.args.get('url')
         if not article_url:
             raise BadRequestError('Article URL is required')
+        article_url = canonicalize_url(article_url)
         
         user_id = g.user_id
         
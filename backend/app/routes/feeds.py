@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request, current_app, g
 from app.services.feed_service import get_all_feeds
 from app.utils.pagination import paginate
 from app.utils.search_filter import search_articles, filter_by_source, filter_by_date_range
+from app.utils.url_canonical import canonicalize_url
 from app.core.errors import InternalServerError
 from app.core.database import get_db
 from app.models.preferences import UserFeedPreferences
@@ -72,7 +73,7 @@ def get_unified_feeds():
                 ).first()
                 
                 if preferences and not preferences.show_read_articles:
-                    read_urls = {h.article_url for h in db.query(ReadHistory).filter(
+                    read_urls = {canonicalize_url(h.article_url) for h in db.query(ReadHistory).filter(
                         ReadHistory.user_id == user_id
                     ).all()}
                     articles = [a for a in articles if a.get('link') not in read_urls]
@@ -5,6 +5,8 @@ from app.schemas.read_history import ReadHistoryCreate
 from app.core.auth import require_auth
 from app.core.cache import cache_delete
 from app.core.errors import BadRequestError, InternalServerError
+from app.services.engagement_service import record_engagement
+from app.utils.url_canonical import canonicalize_url
 from pydantic import ValidationError
 
 bp = Blueprint('read_history', __name__, url_prefix='/api/read-history')
@@ -21,10 +23,12 @@ def mark_as_read():
         except ValidationError as e:
             raise BadRequestError(str(e))
         
+        article_url = canonicalize_url(read_data.article_url)
+        
         with get_db() as db:
             existing = db.query(ReadHistory).filter(
                 ReadHistory.user_id == g.user_id,
-                ReadHistory.article_url == read_data.article_url
+                ReadHistory.article_url == article_url
             ).first()
             
             if existing:
@@ -32,12 +36,13 @@ def mark_as_read():
             
             history = ReadHistory(
                 user_id=g.user_id,
-                article_url=read_data.article_url,
+                article_url=article_url,
                 article_title=read_data.article_title,
                 article_source=read_data.article_source,
                 article_category=read_data.article_category
             )
             db.add(history)
+            record_engagement(db, article_url, reads=1)
             db.flush()
             
             # Invalidate read URLs cache
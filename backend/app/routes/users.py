@@ -6,6 +6,7 @@ from app.schemas.user import PreferencesUpdate, UserProfileUpdate, DeleteAccount
 from app.core.auth import require_auth
 from app.core.errors import BadRequestError, NotFoundError, InternalServerError
 from app.services.feed_service import get_personalized_feeds
+from app.services.engagement_service import remove_user_engagement
 from app.utils.pagination import paginate
 from app.utils.search_filter import search_articles, filter_by_source, filter_by_date_range
 from pydantic import ValidationError
@@ -303,7 +304,10 @@ def delete_account():
             if preferences:
                 db.delete(preferences)
             
-            # Delete user (cascade will delete refresh tokens)
+            # Their reads, bookmarks and feedback no longer count towards articles
+            remove_user_engagement(db, user_id)
+            
+            # Delete user (cascade will delete refresh tokens, bookmarks, read history and feedback)
             db.delete(user)
             db.flush()
             
@@ -0,0 +1,16 @@
+"""Migration script to add the article engagement table and fill it from existing activity"""
+from app.core.database import get_db, get_engine
+from app.models.article_engagement import ArticleEngagement
+from app.services.engagement_service import rebuild_engagement
+
+def migrate():
+    ArticleEngagement.__table__.create(bind=get_engine(), checkfirst=True)
+    print("✓ Created article_engagement table")
+    
+    # Safe to rerun; recounts from scratch if the counts ever drift
+    with get_db() as db:
+        articles = rebuild_engagement(db)
+    print(f"✓ Counted engagement for {articles} articles")
+
+if __name__ == '__main__':
+    migrate()
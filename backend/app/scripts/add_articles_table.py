@@ -0,0 +1,11 @@
+"""Migration script to add the articles table used as the feed source of truth"""
+from app.core.database import get_engine
+from app.models.article import Article
+
+def migrate():
+    # Creates the table and its published/source/type/categories indexes
+    Article.__table__.create(bind=get_engine(), checkfirst=True)
+    print("✓ Created articles table")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,19 @@
+"""Migration script to add circuit breaker columns to sources table"""
+from sqlalchemy import text
+from app.core.database import get_db
+
+def migrate():
+    with get_db() as db:
+        db.execute(text("""
+            ALTER TABLE sources 
+            ADD COLUMN IF NOT EXISTS consecutive_failures INTEGER DEFAULT 0
+        """))
+        db.execute(text("""
+            ALTER TABLE sources 
+            ADD COLUMN IF NOT EXISTS circuit_open_until TIMESTAMP WITH TIME ZONE
+        """))
+        db.commit()
+        print("✓ Added circuit breaker columns to sources")
+
+if __name__ == '__main__':
+    migrate()
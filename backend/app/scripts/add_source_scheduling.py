@@ -0,0 +1,18 @@
+"""Migration script to add adaptive scheduling column to sources table"""
+from sqlalchemy import text
+from app.core.database import get_db
+
+def migrate():
+    with get_db() as db:
+        db.execute(text("""
+            ALTER TABLE sources 
+            ADD COLUMN IF NOT EXISTS next_fetch_at TIMESTAMP WITH TIME ZONE
+        """))
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_sources_next_fetch_at ON sources(next_fetch_at)
+        """))
+        db.commit()
+        print("✓ Added next_fetch_at column to sources")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,62 @@
+"""Migration script to rewrite stored article URLs to their canonical form"""
+from app.core.database import get_db
+from app.models.article import Article
+from app.models.article_feedback import ArticleFeedback
+from app.models.bookmark import Bookmark
+from app.models.read_history import ReadHistory
+from app.utils.url_canonical import canonicalize_url
+
+def backfill_articles(db):
+    """Canonicalize article links, dropping rows whose canonical link is already stored"""
+    rows = db.query(Article).all()
+    links = {row.link for row in rows if canonicalize_url(row.link) == row.link}
+    
+    updated = deleted = 0
+    for row in rows:
+        canonical = canonicalize_url(row.link)
+        if canonical == row.link:
+            continue
+        if canonical in links:
+            db.delete(row)
+            deleted += 1
+        else:
+            row.link = canonical
+            row.data = {**row.data, 'link': canonical}
+            links.add(canonical)
+            updated += 1
+    
+    db.flush()
+    return updated, deleted
+
+def backfill_user_urls(db, model):
+    """Canonicalize a per-user article_url column, merging rows that collapse to the same URL"""
+    rows = db.query(model).order_by(model.id).all()
+    keys = {(row.user_id, row.article_url) for row in rows if canonicalize_url(row.article_url) == row.article_url}
+    
+    updated = deleted = 0
+    for row in rows:
+        canonical = canonicalize_url(row.article_url)
+        if canonical == row.article_url:
+            continue
+        if (row.user_id, canonical) in keys:
+            db.delete(row)
+            deleted += 1
+        else:
+            row.article_url = canonical
+            keys.add((row.user_id, canonical))
+            updated += 1
+    
+    db.flush()
+    return updated, deleted
+
+def migrate():
+    with get_db() as db:
+        updated, deleted = backfill_articles(db)
+        print(f"✓ articles: {updated} links canonicalized, {deleted} duplicates removed")
+        
+        for model in (ReadHistory, Bookmark, ArticleFeedback):
+            updated, deleted = backfill_user_urls(db, model)
+            print(f"✓ {model.__tablename__}: {updated} URLs canonicalized, {deleted} duplicates removed")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,85 @@
+"""
+Build the character trigram language model used by the content filter
+
+Reads either raw text corpora (<lang>.txt files) or langdetect-format
+n-gram profiles (JSON files named by language with a 'freq' table, such as
+the Wikipedia profiles in the langdetect package) and writes the top
+trigrams of each language with their log-probabilities.
+
+Usage:
+    python -m app.scripts.build_language_model --profiles DIR [--languages en,es,...] [--top N]
+    python -m app.scripts.build_language_model --corpus DIR [--languages en,es,...] [--top N]
+"""
+import argparse
+import json
+import math
+import os
+from collections import Counter
+from app.utils.language_id import MODEL_PATH, text_trigrams
+
+# Latin-script languages; other scripts are caught by the script rule
+DEFAULT_LANGUAGES = ['en', 'es', 'pt', 'fr', 'de', 'it', 'nl', 'ca', 'ro', 'sv', 'da', 'no', 'pl', 'tr', 'id', 'vi']
+
+def counts_from_corpus(path):
+    """Count trigrams in a raw text file"""
+    with open(path, encoding='utf-8') as f:
+        return Counter(text_trigrams(f.read()))
+
+def counts_from_profile(path):
+    """Read trigram counts from a langdetect-format profile"""
+    with open(path, encoding='utf-8') as f:
+        profile = json.load(f)
+    
+    counts = Counter()
+    for gram, count in profile['freq'].items():
+        if len(gram) == 3:
+            # Trigrams are keyed lowercased with single-space word padding
+            counts[gram.lower()] += count
+    return counts
+
+def build_profile(counts, top):
+    """Keep the top trigrams as rounded log-probabilities, plus a floor for the rest"""
+    total = sum(counts.values())
+    common = counts.most_common(top)
+    
+    profile = {gram: round(math.log(count / total), 3) for gram, count in common}
+    floor = round(math.log(common[-1][1] / total) - math.log(2), 3)
+    return profile, floor
+
+def build_model(source_dir, languages, top, from_profiles):
+    """Build the model dict for the given languages"""
+    profiles = {}
+    floors = {}
+    for language in languages:
+        if from_profiles:
+            counts = counts_from_profile(os.path.join(source_dir, language))
+        else:
+            counts = counts_from_corpus(os.path.join(source_dir, f'{language}.txt'))
+        profiles[language], floors[language] = build_profile(counts, top)
+    
+    return {
+        'languages': languages,
+        'floors': floors,
+        'profiles': profiles
+    }
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = arg_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--profiles', help='Directory of langdetect-format n-gram profiles')
+    source.add_argument('--corpus', help='Directory of <lang>.txt corpora')
+    arg_parser.add_argument('--languages', default=','.join(DEFAULT_LANGUAGES), help='Comma separated language codes')
+    arg_parser.add_argument('--top', type=int, default=400, help='Trigrams kept per language')
+    arg_parser.add_argument('--out', default=MODEL_PATH, help='Output model path')
+    args = arg_parser.parse_args()
+    
+    languages = [language.strip() for language in args.languages.split(',') if language.strip()]
+    model = build_model(args.profiles or args.corpus, languages, args.top, from_profiles=bool(args.profiles))
+    
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(model, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    
+    print(f"✓ Wrote {len(languages)} language profiles to {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
 from app.core.cache import cache_delete
+from app.services.feed_service import CANONICAL_FEEDS_KEY
 
-cache_delete('feeds:all')
+cache_delete(CANONICAL_FEEDS_KEY)
+cache_delete(f'{CANONICAL_FEEDS_KEY}:stale')
 print('Cache cleared successfully')
@@ -7,6 +7,7 @@ Run this script to create all tables in the database:
 
 from app.core.database import create_tables, get_db
 from app.models import Tag
+from app.utils.tag_catalog import invalidate_tag_catalog
 import sys
 
 def seed_tags():
@@ -61,6 +62,7 @@ def seed_tags():
                 db.add(tag)
             
             db.commit()
+            invalidate_tag_catalog()
             print(f"  ✓ Seeded {len(tags_data)} tags")
     except Exception as e:
         print(f"  ✗ Error seeding tags: {str(e)}")
@@ -84,6 +86,8 @@ def main():
         print("    - user_tags")
         print("    - sources")
         print("    - article_feedback")
+        print("    - articles")
+        print("    - article_engagement")
         
         # Seed tags
         print("\n2. Seeding initial data...")
@@ -0,0 +1,83 @@
+"""
+Replay archived source bodies through the parsers for offline benchmarking
+
+Reads the feed archive index and parses every archived body without any
+network access, reporting parse throughput.
+
+Usage:
+    python -m app.scripts.replay_feed_archive [--workers N] [--batch-size N] [--limit N]
+"""
+import argparse
+import concurrent.futures
+import multiprocessing
+import sys
+import time
+from app.utils.feed_archive import iter_archive, load_body
+from app.utils.fetch_engine import RawPayload, parse_batch
+
+def load_items(limit=None):
+    """Load archived bodies as parse_batch items"""
+    items = []
+    for record in iter_archive():
+        try:
+            content = load_body(record['hash'])
+        except OSError:
+            continue
+        
+        payload = RawPayload(
+            url=record['url'],
+            status=200,
+            content=content,
+            headers={'Content-Type': record.get('content_type', '')},
+            body_hash=record['hash']
+        )
+        items.append((record['kind'], record['target'], payload))
+        
+        if limit and len(items) >= limit:
+            break
+    return items
+
+def replay(items, workers=0, batch_size=8):
+    """
+    Parse items inline or on a process pool
+    
+    Returns:
+        Tuple of (articles parsed, bodies that failed to parse, seconds taken)
+    """
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    
+    start = time.perf_counter()
+    if workers > 0:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            results = [articles for batch in executor.map(parse_batch, batches) for articles in batch]
+    else:
+        results = [articles for batch in batches for articles in parse_batch(batch)]
+    elapsed = time.perf_counter() - start
+    
+    # parse_batch yields None for bodies that failed to parse
+    parsed = [articles for articles in results if articles is not None]
+    return sum(len(articles) for articles in parsed), len(results) - len(parsed), elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay the feed archive through the parsers')
+    parser.add_argument('--workers', type=int, default=0, help='Parse processes (0 parses inline)')
+    parser.add_argument('--batch-size', type=int, default=8, help='Bodies per parse batch')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum bodies to replay')
+    args = parser.parse_args()
+    
+    items = load_items(args.limit)
+    if not items:
+        print("No archived bodies found - check FEED_ARCHIVE_DIR")
+        return 1
+    
+    article_count, failed, elapsed = replay(items, args.workers, args.batch_size)
+    
+    print(f"Replayed {len(items)} bodies ({article_count} articles, {failed} failed) in {elapsed:.2f}s")
+    print(f"  {len(items) / elapsed:.1f} bodies/s, {article_count / elapsed:.1f} articles/s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
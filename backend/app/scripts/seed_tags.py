@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from app.core.database import get_db
 from app.models.tag import Tag
+from app.utils.tag_catalog import invalidate_tag_catalog
 
 # Tag definitions grouped by category
 TAG_DEFINITIONS = {
@@ -146,6 +147,7 @@ def seed_tags():
                 total_tags += 1
         
         db.commit()
+        invalidate_tag_catalog()
         print(f"✓ Successfully seeded {total_tags} tags across {len(TAG_DEFINITIONS)} categories")
 
 if __name__ == '__main__':
@@ -0,0 +1,206 @@
+"""Article service for persisting ingested articles and reading feed snapshots"""
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import bindparam, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import func
+from app.core.config import Config
+from app.models.article import Article
+from app.utils.dates import article_timestamp, parse_timestamp
+from app.utils.near_duplicates import collapse_near_duplicates
+from app.utils.quality_scorer import filter_by_quality, score_articles
+from app.utils.source_registry import get_source_registry
+from app.services.engagement_service import get_engagement_scores
+
+# Rows per INSERT ... ON CONFLICT statement
+UPSERT_BATCH_SIZE = 500
+
+def parse_published(published):
+    """
+    Parse a source's published string into an aware datetime
+    
+    Args:
+        published: Published date string as reported by the source
+    
+    Returns:
+        UTC datetime, or None if missing or unparseable
+    """
+    return _from_timestamp(parse_timestamp(published))
+
+def _from_timestamp(published_ts):
+    if published_ts is None:
+        return None
+    return datetime.fromtimestamp(published_ts, tz=timezone.utc)
+
+def _article_row(article, content_score=None, source_key=None):
+    return {
+        'link': article['link'],
+        'title': article.get('title') or 'No Title',
+        'source': article.get('source'),
+        'type': article.get('type'),
+        'source_key': source_key,
+        'published_at': _from_timestamp(article_timestamp(article)),
+        'categories': article.get('categories', []),
+        'content_score': content_score,
+        'data': article,
+    }
+
+def upsert_articles(db, articles, content_scores=None, source_keys=None):
+    """
+    Insert or update articles in bulk
+    
+    Args:
+        db: Database session
+        articles: Processed articles (with categories)
+        content_scores: Content scores keyed by article link
+        source_keys: Fetch job keys keyed by article link
+    
+    Returns:
+        Number of rows written
+    """
+    content_scores = content_scores or {}
+    source_keys = source_keys or {}
+    
+    # A statement may only touch each conflicting row once, so dedupe by link
+    rows = {}
+    for article in articles:
+        link = article.get('link')
+        if link:
+            rows[link] = _article_row(article, content_scores.get(link), source_keys.get(link))
+    rows = list(rows.values())
+    
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = insert(Article).values(rows[start:start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Article.link],
+            set_={
+                'title': stmt.excluded.title,
+                'source': stmt.excluded.source,
+                'type': stmt.excluded.type,
+                # Keep the original source when only this fetch has no key for it
+                'source_key': func.coalesce(stmt.excluded.source_key, Article.source_key),
+                'published_at': stmt.excluded.published_at,
+                'categories': stmt.excluded.categories,
+                'content_score': stmt.excluded.content_score,
+                'data': stmt.excluded.data,
+                'updated_at': func.now(),
+            }
+        )
+        db.execute(stmt)
+    
+    return len(rows)
+
+def update_article_categories(db, categories_by_link):
+    """
+    Overwrite the categories of stored articles
+    
+    Args:
+        db: Database session
+        categories_by_link: Dict mapping article link to its new categories
+    
+    Returns:
+        Number of links written
+    """
+    if not categories_by_link:
+        return 0
+    
+    stmt = (
+        Article.__table__.update()
+        .where(Article.__table__.c.link == bindparam('row_link'))
+        .values(categories=bindparam('row_categories'), updated_at=func.now())
+    )
+    db.execute(stmt, [
+        {'row_link': link, 'row_categories': categories}
+        for link, categories in categories_by_link.items()
+    ])
+    return len(categories_by_link)
+
+def query_articles(db, since=None, source_filter=None, links=None, limit=None):
+    """
+    Query stored articles, newest first
+    
+    Args:
+        db: Database session
+        since: Only articles published after this time (undated articles are kept)
+        source_filter: Only articles of this type
+        links: Only articles with these links
+        limit: Maximum number of rows
+    
+    Returns:
+        List of Article rows
+    """
+    query = db.query(Article)
+    
+    if since is not None:
+        query = query.filter(or_(Article.published_at >= since, Article.published_at.is_(None)))
+    if source_filter:
+        query = query.filter(Article.type == source_filter)
+    if links is not None:
+        query = query.filter(Article.link.in_(links))
+    
+    query = query.order_by(Article.published_at.desc().nullslast())
+    if limit:
+        query = query.limit(limit)
+    
+    return query.all()
+
+def rows_to_articles(rows, apply_quality_filter=True, min_quality_score=0.4, db=None):
+    """
+    Convert Article rows to article dicts, rescoring quality for the current time
+    
+    Args:
+        rows: Article rows
+        apply_quality_filter: Whether to apply quality filtering
+        min_quality_score: Minimum quality score threshold (0.0-1.0)
+        db: Database session to load engagement with, so scores match the
+            canonical snapshot (optional)
+    
+    Returns:
+        List of article dicts
+    """
+    articles = [row.to_dict() for row in rows]
+    
+    if apply_quality_filter:
+        content_scores = {row.link: row.content_score for row in rows if row.content_score is not None}
+        source_keys = {row.link: row.source_key for row in rows if row.source_key}
+        articles = filter_by_quality(
+            articles,
+            min_score=min_quality_score,
+            source_tier='standard',
+            user_tag_ids=None,
+            db=db,
+            content_scores=content_scores,
+            source_tiers=get_source_registry(db).tiers_by_link(articles, source_keys=source_keys)
+        )
+    
+    return articles
+
+def get_canonical_articles(db):
+    """
+    Build the canonical feed snapshot from the articles table
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Articles published in the last FEED_WINDOW_DAYS, newest first, each
+        with a quality score for the current time (including engagement) and
+        near-duplicates folded into its alternates
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=Config.FEED_WINDOW_DAYS)
+    rows = query_articles(db, since=since, limit=Config.FEED_SNAPSHOT_LIMIT)
+    
+    articles = [row.to_dict() for row in rows]
+    content_scores = {row.link: row.content_score for row in rows if row.content_score is not None}
+    engagement_scores = get_engagement_scores(db, [row.link for row in rows])
+    source_keys = {row.link: row.source_key for row in rows if row.source_key}
+    source_tiers = get_source_registry(db).tiers_by_link(articles, source_keys=source_keys)
+    scores = score_articles(
+        articles,
+        content_scores=content_scores,
+        engagement_scores=engagement_scores,
+        source_tiers=source_tiers
+    )
+    for article, score in zip(articles, scores):
+        article['quality_score'] = score
+    
+    return collapse_near_duplicates(articles)
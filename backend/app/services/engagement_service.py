@@ -0,0 +1,159 @@
+"""Engagement service for per-article read, bookmark and feedback counts"""
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from app.models.article_engagement import ArticleEngagement
+from app.models.article_feedback import ArticleFeedback
+from app.models.bookmark import Bookmark
+from app.models.read_history import ReadHistory
+from app.utils.quality_scorer import engagement_from_counts
+
+ENGAGEMENT_COUNTS = ('reads', 'bookmarks', 'helpful', 'negative')
+
+# Feedback types counted against an article's engagement
+NEGATIVE_FEEDBACK_TYPES = ('not_helpful', 'spam', 'low_quality')
+
+def feedback_count(feedback_type):
+    """Get the engagement count a feedback type is tallied under (None if not counted)"""
+    if feedback_type == 'helpful':
+        return 'helpful'
+    if feedback_type in NEGATIVE_FEEDBACK_TYPES:
+        return 'negative'
+    return None
+
+def record_engagement(db, article_url, **deltas):
+    """
+    Add to an article's engagement counts in the current transaction
+    
+    Counts are upserted in one statement, so concurrent requests for the
+    same article do not lose updates. Counts never drop below zero.
+    
+    Args:
+        db: Database session
+        article_url: Canonical article URL
+        **deltas: Change per count, e.g. reads=1 or bookmarks=-1
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    
+    stmt = insert(ArticleEngagement).values(
+        article_url=article_url,
+        **{name: max(delta, 0) for name, delta in deltas.items()}
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ArticleEngagement.article_url],
+        set_={
+            **{
+                name: func.greatest(getattr(ArticleEngagement, name) + delta, 0)
+                for name, delta in deltas.items()
+            },
+            'updated_at': func.now(),
+        }
+    )
+    db.execute(stmt)
+
+def record_feedback_change(db, article_url, old_type, new_type):
+    """
+    Move an article's feedback tally when a user gives or changes feedback
+    
+    Args:
+        db: Database session
+        article_url: Canonical article URL
+        old_type: User's previous feedback type (None for new feedback)
+        new_type: User's new feedback type
+    """
+    old_count, new_count = feedback_count(old_type), feedback_count(new_type)
+    if old_count == new_count:
+        return
+    
+    deltas = {}
+    if old_count:
+        deltas[old_count] = -1
+    if new_count:
+        deltas[new_count] = 1
+    record_engagement(db, article_url, **deltas)
+
+def remove_user_engagement(db, user_id):
+    """
+    Take a user's reads, bookmarks and feedback out of the engagement counts
+    
+    Call in the same transaction that deletes the user, before the rows
+    are removed by the cascade.
+    
+    Args:
+        db: Database session
+        user_id: User whose activity is removed
+    """
+    deltas = {}
+    
+    def tally(query, name):
+        for article_url, count in query:
+            deltas.setdefault(article_url, {})[name] = -count
+    
+    tally(db.query(ReadHistory.article_url, func.count()).filter(
+        ReadHistory.user_id == user_id
+    ).group_by(ReadHistory.article_url), 'reads')
+    tally(db.query(Bookmark.article_url, func.count()).filter(
+        Bookmark.user_id == user_id
+    ).group_by(Bookmark.article_url), 'bookmarks')
+    tally(db.query(ArticleFeedback.article_url, func.count()).filter(
+        ArticleFeedback.user_id == user_id, ArticleFeedback.feedback_type == 'helpful'
+    ).group_by(ArticleFeedback.article_url), 'helpful')
+    tally(db.query(ArticleFeedback.article_url, func.count()).filter(
+        ArticleFeedback.user_id == user_id, ArticleFeedback.feedback_type.in_(NEGATIVE_FEEDBACK_TYPES)
+    ).group_by(ArticleFeedback.article_url), 'negative')
+    
+    for article_url, counts in deltas.items():
+        record_engagement(db, article_url, **counts)
+
+def get_engagement_scores(db, links):
+    """
+    Load engagement scores for many articles in one query
+    
+    Args:
+        db: Database session
+        links: Article links
+    
+    Returns:
+        Dict mapping link to engagement score (articles without engagement omitted)
+    """
+    links = [link for link in set(links) if link]
+    if not links:
+        return {}
+    
+    rows = db.query(ArticleEngagement).filter(ArticleEngagement.article_url.in_(links)).all()
+    return {
+        row.article_url: engagement_from_counts(row.reads, row.bookmarks, row.helpful, row.negative)
+        for row in rows
+    }
+
+def rebuild_engagement(db):
+    """
+    Recount every article's engagement from read history, bookmarks and feedback
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of articles with engagement
+    """
+    counts = {}
+    
+    def tally(query, name):
+        for article_url, count in query:
+            counts.setdefault(article_url, dict.fromkeys(ENGAGEMENT_COUNTS, 0))[name] += count
+    
+    tally(db.query(ReadHistory.article_url, func.count()).group_by(ReadHistory.article_url), 'reads')
+    tally(db.query(Bookmark.article_url, func.count()).group_by(Bookmark.article_url), 'bookmarks')
+    tally(db.query(ArticleFeedback.article_url, func.count()).filter(
+        ArticleFeedback.feedback_type == 'helpful'
+    ).group_by(ArticleFeedback.article_url), 'helpful')
+    tally(db.query(ArticleFeedback.article_url, func.count()).filter(
+        ArticleFeedback.feedback_type.in_(NEGATIVE_FEEDBACK_TYPES)
+    ).group_by(ArticleFeedback.article_url), 'negative')
+    
+    db.query(ArticleEngagement).delete(synchronize_session=False)
+    db.add_all(ArticleEngagement(article_url=article_url, **row) for article_url, row in counts.items())
+    db.flush()
+    
+    return len(counts)
@@ -1,74 +1,432 @@
 """Feed service layer for centralized feed fetching logic"""
-from app.utils.rss_parser import fetch_rss_feeds
-from app.utils.scraper import scrape_websites
-from app.utils.social_scrapers import scrape_social_media
+from app.utils.fetch_engine import run_fetch_jobs
 from app.utils.feed_aggregator import aggregate_feeds
+from app.utils.dates import stamp_published_ts
+from app.utils.near_duplicates import find_clusters, collapse_clusters
+from app.utils.url_canonical import canonicalize_url, canonicalize_links
 from app.utils.categorizer import add_categories_to_articles
-from app.utils.gemini_categorizer import batch_categorize
+from app.utils.gemini_categorizer import batch_categorize, CategorizationQueue
 from app.utils.personalization import filter_by_user_preferences
 from app.utils.content_filter import filter_articles
-from app.utils.quality_scorer import filter_by_quality
-from app.core.cache import cache_get, cache_set
+from app.utils.quality_scorer import score_articles, batch_content_scores
+from app.utils.source_registry import get_source_registry
+from app.utils.seen_entries import get_seen_entries, split_changed, save_seen_entries, update_seen_categories, entry_hash
+from app.core.cache import cache_get, cache_set, cache_acquire_lock, cache_release_lock
 from app.core.config import Config
 from app.core.database import get_db
 from app.models.read_history import ReadHistory
-import os
+from app.services.source_service import get_config_jobs, save_source_articles, load_source_articles, source_key, feed_list_for_job, skip_open_circuits
+from app.services.article_service import upsert_articles, update_article_categories, get_canonical_articles
+import logging
+import threading
+import time
 
-def get_all_feeds(source_filter=None, limit=None, apply_quality_filter=True, min_quality_score=0.4, content_preference='both'):
+logger = logging.getLogger(__name__)
+
+# One snapshot of every source; all feed variants are derived from it
+CANONICAL_FEEDS_KEY = 'feeds:canonical'
+
+def store_articles(articles, content_scores=None, source_jobs=None):
     """
-    Get all feeds from cache or fetch from sources with quality scoring
+    Persist processed articles to the articles table
+    
+    Args:
+        articles: Processed articles (with categories)
+        content_scores: Content scores keyed by article link
+        source_jobs: FetchJob keyed by article link
+    
+    Returns:
+        True if stored
+    """
+    if not articles:
+        return True
+    
+    source_keys = {link: source_key(job) for link, job in (source_jobs or {}).items()}
+    try:
+        with get_db() as db:
+            upsert_articles(db, articles, content_scores, source_keys)
+        return True
+    except Exception as e:
+        logger.error(f'Failed to store articles: {str(e)}')
+        return False
+
+def save_ai_categories(results):
+    """
+    Write Gemini categories back to stored articles as they arrive
+    
+    Only articles whose seen entry still has the categorized content hash
+    are written, so a late result never overwrites a newer version.
+    
+    Args:
+        results: List of (link, content hash, categories) from the
+            categorization queue
+    """
+    current = update_seen_categories(results)
+    if not current:
+        return
+    with get_db() as db:
+        update_article_categories(db, current)
+
+_categorizer = None
+_categorizer_lock = threading.Lock()
+
+def get_categorizer():
+    """Get this process's Gemini categorization queue"""
+    global _categorizer
+    with _categorizer_lock:
+        if _categorizer is None:
+            _categorizer = CategorizationQueue(on_result=save_ai_categories)
+        return _categorizer
+
+def load_canonical_snapshot():
+    """
+    Build the canonical snapshot from the articles table
+    
+    Returns:
+        List of articles, or None if the table is unavailable
+    """
+    try:
+        with get_db() as db:
+            return get_canonical_articles(db)
+    except Exception as e:
+        logger.error(f'Failed to load feed snapshot: {str(e)}')
+        return None
+
+def crawl_sources(jobs, on_result=None):
+    """
+    Fetch sources concurrently and store each source's latest articles
+    
+    Args:
+        jobs: List of FetchJob
+        on_result: Optional callback(job, articles, seconds taken, error
+            message or None), called before the source's stored articles are
+            replaced
+    
+    Returns:
+        Combined list of fetched articles
+    """
+    def handle_result(job, articles, elapsed, error):
+        if on_result:
+            on_result(job, articles, elapsed, error)
+        # Keep the previous articles when a source came back empty
+        if articles:
+            save_source_articles(job, articles)
+    
+    return run_fetch_jobs(jobs, on_result=handle_result)
+
+def _jobs_by_link(articles_by_job):
+    """Map each article link to the fetch job it came from"""
+    return {
+        canonicalize_url(article.get('link')): job
+        for job, articles in articles_by_job.items()
+        for article in articles
+    }
+
+def _content_scores(articles):
+    """Content scores for articles, computed in one batch"""
+    titles = [article.get('title', '') for article in articles]
+    summaries = [article.get('summary', '') for article in articles]
+    return batch_content_scores(titles, summaries).tolist()
+
+def _process_changed(articles):
+    """
+    Run the expensive per-entry stages on new or changed articles
     
     Args:
+        articles: Articles not yet processed in their current form
+    
+    Returns:
+        Dict mapping link to its seen-entry record
+    """
+    # Filter out explicit and non-English content
+    kept = filter_articles(articles)
+    
+    # Add categories (Gemini results already cached, keywords for the rest)
+    if Config.GEMINI_API_KEY:
+        kept = batch_categorize(kept)
+    else:
+        kept = add_categories_to_articles(kept)
+    
+    kept_ids = {id(article) for article in kept}
+    records = {}
+    for article, content_score in zip(articles, _content_scores(articles)):
+        keep = id(article) in kept_ids
+        records[article.get('link')] = {
+            'hash': entry_hash(article),
+            'keep': keep,
+            'categories': article.get('categories', []) if keep else [],
+            'content_score': content_score
+        }
+    
+    return records
+
+def _process_clustered(changed, seen, clusters):
+    """
+    Process new or changed articles once per near-duplicate cluster
+    
+    Only one changed article per cluster goes through filtering and
+    categorization; the rest reuse its result, or that of an already
+    processed member of the cluster.
+    
+    Args:
+        changed: New or changed articles
+        seen: Stored seen-entry records keyed by link
+        clusters: Clusters from find_clusters over all articles
+    
+    Returns:
+        Dict mapping link to its seen-entry record
+    """
+    cluster_of = {id(article): index for index, cluster in enumerate(clusters) for article in cluster}
+    changed_ids = {id(article) for article in changed}
+    
+    known = {}
+    for index, cluster in enumerate(clusters):
+        for article in cluster:
+            if id(article) not in changed_ids and article.get('link') in seen:
+                known[index] = seen[article.get('link')]
+                break
+    
+    leaders = {}
+    for article in changed:
+        index = cluster_of[id(article)]
+        if index not in known and index not in leaders:
+            leaders[index] = article
+    
+    records = _process_changed(list(leaders.values()))
+    for index, leader in leaders.items():
+        known[index] = records[leader.get('link')]
+    
+    followers = [article for article in changed if article.get('link') not in records]
+    for article, content_score in zip(followers, _content_scores(followers)):
+        records[article.get('link')] = {
+            **known[cluster_of[id(article)]],
+            'hash': entry_hash(article),
+            'content_score': content_score
+        }
+    
+    return records
+
+def process_articles(all_articles, source_jobs=None):
+    """
+    Build the canonical snapshot from raw articles
+    
+    Filter and category results are kept per entry, so articles already
+    processed in an earlier cycle only get their quality score refreshed.
+    
+    Args:
+        all_articles: Raw articles from all sources
+        source_jobs: FetchJob keyed by article link
+    
+    Returns:
+        Articles newest first, each with categories, a quality score, the
+        RSS feed list ('tech' / 'general') it came from and the alternates
+        it was chosen over
+    """
+    source_jobs = source_jobs or {}
+    
+    # Articles stored before ingest-time normalization have raw links and no published_ts yet
+    articles = aggregate_feeds(stamp_published_ts(canonicalize_links(all_articles)))
+    
+    for article in articles:
+        job = source_jobs.get(article.get('link'))
+        article['feed_list'] = feed_list_for_job(job) if job else None
+    
+    # Only new or changed entries go through filtering and categorization,
+    # once per near-duplicate cluster
+    clusters = find_clusters(articles)
+    seen = get_seen_entries(articles)
+    changed, _ = split_changed(articles, seen)
+    records = _process_clustered(changed, seen, clusters)
+    
+    # Persist new or changed entries; if that fails they are reprocessed next cycle
+    kept = [article for article in changed if records[article.get('link')]['keep']]
+    for article in kept:
+        # Cluster followers only have their leader's categories in their record
+        article['categories'] = records[article.get('link')]['categories']
+    content_scores = {link: record['content_score'] for link, record in records.items()}
+    if store_articles(kept, content_scores, source_jobs):
+        save_seen_entries(records)
+        # Gemini categories replace the keyword ones in the background once
+        # stored, so a late result is never overwritten by this cycle
+        if Config.GEMINI_API_KEY:
+            get_categorizer().submit(kept)
+    seen.update(records)
+    
+    # Merge stored results back onto the full article set
+    processed_clusters = []
+    for cluster in clusters:
+        processed = []
+        for article in cluster:
+            record = seen.get(article.get('link'))
+            if not record or not record['keep']:
+                continue
+            article['categories'] = record['categories']
+            processed.append(article)
+        if processed:
+            processed_clusters.append(processed)
+    
+    # Score WITHOUT database connection in one batch (freshness changes every run)
+    scored = [article for cluster in processed_clusters for article in cluster]
+    content_scores = {article.get('link'): seen[article.get('link')]['content_score'] for article in scored}
+    source_keys = {link: source_key(job) for link, job in source_jobs.items()}
+    source_tiers = get_source_registry().tiers_by_link(scored, source_keys=source_keys)
+    for article, score in zip(scored, score_articles(scored, content_scores=content_scores, source_tiers=source_tiers)):
+        article['quality_score'] = score
+    
+    return collapse_clusters(processed_clusters)
+
+def _matches_preference(article, content_preference):
+    """Check if an article belongs to the feeds selected by a content preference"""
+    if article.get('type') != 'rss' or content_preference == 'both':
+        return True
+    return article.get('feed_list') in (content_preference, 'both')
+
+def derive_feeds(snapshot, source_filter=None, limit=None, apply_quality_filter=True, min_quality_score=0.4, content_preference='both'):
+    """
+    Derive a feed variant from the canonical snapshot without fetching
+    
+    Args:
+        snapshot: Canonical snapshot (newest first, quality scored)
         source_filter: Filter by 'rss' or 'scrape'
         limit: Maximum number of articles
         apply_quality_filter: Whether to apply quality filtering
         min_quality_score: Minimum quality score threshold (0.0-1.0)
         content_preference: 'tech', 'general', or 'both'
-        
+    
     Returns:
-        List of articles with categories and quality scores
+        List of articles, by quality when filtered, otherwise newest first
     """
-    cache_key = f'feeds:all:{source_filter}:{apply_quality_filter}:{content_preference}'
-    articles = cache_get(cache_key)
+    articles = [
+        article for article in snapshot
+        if _matches_preference(article, content_preference)
+        and (not source_filter or article.get('type') == source_filter)
+    ]
     
-    if articles is None:
-        # Select RSS feeds based on content preference
-        rss_feeds = []
-        if content_preference in ['tech', 'both']:
-            rss_feeds.extend(Config.RSS_FEEDS_TECH)
-        if content_preference in ['general', 'both']:
-            rss_feeds.extend(Config.RSS_FEEDS_GENERAL)
-        
-        # Fetch from sources
-        rss_articles = fetch_rss_feeds(rss_feeds) if rss_feeds else []
-        scraped_articles = scrape_websites(Config.SCRAPE_URLS) if Config.SCRAPE_URLS else []
-        social_articles = scrape_social_media(Config.REDDIT_SUBREDDITS, Config.YOUTUBE_CHANNELS) if (Config.REDDIT_SUBREDDITS or Config.YOUTUBE_CHANNELS) else []
-        
-        # Combine all sources
-        all_articles = rss_articles + scraped_articles + social_articles
-        articles = aggregate_feeds(all_articles, [], source_filter, limit)
-        
-        # Filter out explicit and non-English content
-        articles = filter_articles(articles)
+    if limit:
+        articles = articles[:limit]
+    
+    if apply_quality_filter:
+        articles = [article for article in articles if article.get('quality_score', 0) >= min_quality_score]
+        # Sort by quality score (highest first)
+        articles.sort(key=lambda x: x['quality_score'], reverse=True)
+    
+    return articles
+
+def cache_snapshot(cache_key, articles):
+    """Cache a feed snapshot, keeping a stale copy for the grace window"""
+    cache_set(cache_key, articles)
+    cache_set(f'{cache_key}:stale', articles, ttl=Config.CACHE_TTL + Config.CACHE_STALE_GRACE)
+
+def build_canonical_snapshot():
+    """Build the canonical snapshot from stored articles, crawling only when nothing has been ingested yet"""
+    articles = load_canonical_snapshot()
+    
+    if not articles:
+        # Fetch every RSS list, scrape and social source concurrently in one crawl
+        fetched = {}
         
-        # Add categories (use Gemini if available, fallback to keyword)
-        if os.getenv('GEMINI_API_KEY'):
-            articles = batch_categorize(articles)
-        else:
-            articles = add_categories_to_articles(articles)
+        def on_result(job, job_articles, elapsed, error):
+            fetched[job] = job_articles
         
-        # Apply quality scoring WITHOUT database connection
-        if apply_quality_filter:
-            articles = filter_by_quality(
-                articles,
-                min_score=min_quality_score,
-                source_tier='standard',
-                user_tag_ids=None,
-                db=None  # Don't pass db to avoid connection timeout
-            )
+        all_articles = crawl_sources(skip_open_circuits(get_config_jobs()), on_result=on_result)
+        articles = process_articles(all_articles, source_jobs=_jobs_by_link(fetched))
+    
+    return articles
+
+def _refresh_snapshot(lock_token):
+    """Build and cache the canonical snapshot, then release the refresh lock"""
+    try:
+        articles = build_canonical_snapshot()
+        cache_snapshot(CANONICAL_FEEDS_KEY, articles)
+        return articles
+    finally:
+        cache_release_lock(f'{CANONICAL_FEEDS_KEY}:lock', lock_token)
+
+def _wait_for_snapshot(cache_key):
+    """Poll for a snapshot another process is building, up to CACHE_LOCK_WAIT seconds"""
+    deadline = time.monotonic() + Config.CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.5)
+        articles = cache_get(cache_key)
+        if articles is not None:
+            return articles
+    return None
+
+def get_canonical_snapshot():
+    """
+    Get the canonical snapshot from cache or build it
+    
+    Only one process rebuilds an expired snapshot (single-flight via a Redis
+    lock). Everyone else gets the previous snapshot for up to
+    CACHE_STALE_GRACE seconds, or waits for the refresh if there is none.
+    
+    Returns:
+        Canonical snapshot
+    """
+    articles = cache_get(CANONICAL_FEEDS_KEY)
+    if articles is not None:
+        return articles
+    
+    stale = cache_get(f'{CANONICAL_FEEDS_KEY}:stale')
+    lock_token = cache_acquire_lock(f'{CANONICAL_FEEDS_KEY}:lock', Config.CACHE_LOCK_TTL)
+    
+    if stale is not None:
+        # Serve the previous snapshot; the lock holder refreshes in the background
+        if lock_token:
+            threading.Thread(target=_refresh_snapshot, args=(lock_token,), daemon=True).start()
+        return stale
+    
+    if lock_token:
+        return _refresh_snapshot(lock_token)
+    
+    # Another process is building the first snapshot - wait for it
+    articles = _wait_for_snapshot(CANONICAL_FEEDS_KEY)
+    if articles is None:
+        logger.warning('Timed out waiting for the feed snapshot, building it here')
+        articles = build_canonical_snapshot()
+        cache_snapshot(CANONICAL_FEEDS_KEY, articles)
+    
+    return articles
+
+def get_all_feeds(source_filter=None, limit=None, apply_quality_filter=True, min_quality_score=0.4, content_preference='both'):
+    """
+    Get all feeds from cache or fetch from sources with quality scoring
+    
+    Args:
+        source_filter: Filter by 'rss' or 'scrape'
+        limit: Maximum number of articles
+        apply_quality_filter: Whether to apply quality filtering
+        min_quality_score: Minimum quality score threshold (0.0-1.0)
+        content_preference: 'tech', 'general', or 'both'
         
-        cache_set(cache_key, articles)
+    Returns:
+        List of articles with categories and quality scores
+    """
+    snapshot = get_canonical_snapshot()
+    return derive_feeds(snapshot, source_filter, limit, apply_quality_filter, min_quality_score, content_preference)
     
+def refresh_feeds_from_sources(jobs):
+    """
+    Rebuild the canonical snapshot from each source's latest stored articles
+
+    Used by the per-source scheduler, so sources that were not due keep
+    contributing their previous articles without being refetched. New
+    entries are written to the articles table and the snapshot is read back
+    from it, so articles older than the latest fetch of a source are kept.
+
+    Args:
+        jobs: FetchJob for every active source
+
+    Returns:
+        List of processed articles
+    """
+    stored = load_source_articles(jobs)
+    all_articles = [article for job in jobs for article in stored.get(job, [])]
+
+    processed = process_articles(all_articles, source_jobs=_jobs_by_link(stored))
+    articles = load_canonical_snapshot() or processed
+    cache_snapshot(CANONICAL_FEEDS_KEY, articles)
+
     return articles
 
 def get_personalized_feeds(user_preferences, user_id=None):
@@ -115,7 +473,7 @@ def get_personalized_feeds(user_preferences, user_id=None):
                 read_urls = db.query(ReadHistory.article_url).filter(
                     ReadHistory.user_id == user_id
                 ).order_by(ReadHistory.read_at.desc()).limit(1000).all()
-                read_url_set = {url[0] for url in read_urls}
+                read_url_set = {canonicalize_url(url[0]) for url in read_urls}
                 # Cache for 5 minutes
                 cache_set(cache_key, list(read_url_set), ttl=300)
         else:
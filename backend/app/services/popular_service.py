@@ -2,7 +2,7 @@
 from app.core.database import get_db
 from app.models.bookmark import Bookmark
 from app.models.read_history import ReadHistory
-from app.services.feed_service import get_all_feeds
+from app.services.article_service import query_articles, rows_to_articles
 from sqlalchemy import func
 from datetime import datetime, timedelta
 from collections import Counter
@@ -35,8 +35,9 @@ def get_popular_articles(days=7, limit=20):
         for url, count in read_counts:
             url_scores[url] += count
         
-        # Get all articles
-        articles = get_all_feeds()
+        # Look up only the scored articles
+        rows = query_articles(db, links=list(url_scores)) if url_scores else []
+        articles = rows_to_articles(rows, db=db)
         
         # Match articles with scores
         popular = []
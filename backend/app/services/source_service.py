@@ -0,0 +1,322 @@
+"""Source service for per-source article storage and adaptive fetch scheduling"""
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
+from app.core.cache import cache_get, cache_set
+from app.core.config import Config
+from app.models.source import Source
+from app.utils.fetch_engine import FetchJob, build_fetch_jobs
+
+SOURCE_ARTICLES_PREFIX = 'source_articles'
+
+logger = logging.getLogger(__name__)
+
+def source_key(job):
+    """Stable identifier for a fetch job"""
+    return f'{job.kind}:{job.target}'
+
+def get_config_jobs(rss_feeds=None):
+    """
+    Build fetch jobs for every source configured in the environment
+    
+    Args:
+        rss_feeds: RSS feed URLs to include (defaults to all configured feeds)
+    
+    Returns:
+        List of FetchJob
+    """
+    return build_fetch_jobs(
+        rss_feeds=Config.RSS_FEEDS if rss_feeds is None else rss_feeds,
+        scrape_urls=Config.SCRAPE_URLS,
+        subreddits=Config.REDDIT_SUBREDDITS,
+        youtube_channels=Config.YOUTUBE_CHANNELS
+    )
+
+def feed_list_for_job(job):
+    """
+    Get which configured RSS list a fetch job belongs to
+    
+    Args:
+        job: FetchJob
+    
+    Returns:
+        'tech', 'general', 'both' (listed in both) or None
+    """
+    if job.kind != 'rss':
+        return None
+    
+    in_tech = job.target in Config.RSS_FEEDS_TECH
+    in_general = job.target in Config.RSS_FEEDS_GENERAL
+    if in_tech and in_general:
+        return 'both'
+    if in_tech:
+        return 'tech'
+    if in_general:
+        return 'general'
+    return None
+
+def save_source_articles(job, articles):
+    """
+    Store the latest articles fetched from a source
+    
+    Args:
+        job: FetchJob the articles came from
+        articles: Normalized articles
+    """
+    cache_set(
+        f'{SOURCE_ARTICLES_PREFIX}:{source_key(job)}',
+        {'articles': articles},
+        ttl=Config.SOURCE_MAX_INTERVAL * 2
+    )
+
+def load_source_articles(jobs):
+    """
+    Load the latest stored articles for a list of sources
+    
+    Args:
+        jobs: List of FetchJob
+    
+    Returns:
+        Dict mapping FetchJob to its stored articles (missing sources omitted)
+    """
+    stored = {}
+    for job in jobs:
+        entry = cache_get(f'{SOURCE_ARTICLES_PREFIX}:{source_key(job)}')
+        if entry is not None:
+            stored[job] = entry.get('articles', [])
+    return stored
+
+def source_url_for_job(job):
+    """Get the URL stored on a Source row for a fetch job"""
+    if job.kind == 'reddit':
+        return f'https://www.reddit.com/r/{job.target}'
+    if job.kind == 'youtube':
+        return f'https://www.youtube.com/feeds/videos.xml?channel_id={job.target}'
+    return job.target
+
+def source_name_for_job(job):
+    """Get a readable unique name for a Source row created from config"""
+    if job.kind == 'reddit':
+        return f'r/{job.target}'
+    if job.kind == 'youtube':
+        return f'youtube/{job.target}'
+    
+    parsed = urlparse(job.target)
+    return f'{parsed.netloc}{parsed.path}'.rstrip('/')[:100]
+
+def job_for_source(source):
+    """
+    Build the fetch job for a Source row
+    
+    Args:
+        source: Source model instance
+    
+    Returns:
+        FetchJob
+    """
+    if source.type == 'reddit':
+        return FetchJob('reddit', source.url.rstrip('/').rsplit('/', 1)[-1])
+    if source.type == 'youtube':
+        channel_ids = parse_qs(urlparse(source.url).query).get('channel_id')
+        return FetchJob('youtube', channel_ids[0] if channel_ids else source.url)
+    return FetchJob(source.type, source.url)
+
+def sync_config_sources(db):
+    """
+    Create Source rows for configured sources that are not tracked yet
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of sources created
+    """
+    existing = {(source.type, source.url) for source in db.query(Source.type, Source.url).all()}
+    
+    created = 0
+    for job in get_config_jobs():
+        url = source_url_for_job(job)
+        if (job.kind, url) in existing:
+            continue
+        
+        db.add(Source(
+            name=source_name_for_job(job),
+            url=url,
+            type=job.kind,
+            fetch_frequency=Config.CACHE_TTL,
+            error_count=0,
+            success_count=0,
+            success_rate=1.0,
+            avg_fetch_time=0.0
+        ))
+        existing.add((job.kind, url))
+        created += 1
+    
+    if created:
+        db.flush()
+    
+    return created
+
+def get_due_sources(db, now=None):
+    """
+    Get active sources whose next fetch time has passed
+    
+    Args:
+        db: Database session
+        now: Current time (defaults to utcnow)
+    
+    Returns:
+        List of Source rows, slowest first so they start early in the crawl
+    """
+    now = now or datetime.now(timezone.utc)
+    
+    return db.query(Source).filter(
+        Source.is_active,
+        (Source.next_fetch_at.is_(None)) | (Source.next_fetch_at <= now)
+    ).order_by(Source.avg_fetch_time.desc()).all()
+
+def _open_circuit_jobs(db, now):
+    sources = db.query(Source).filter(
+        Source.consecutive_failures >= Config.CIRCUIT_FAILURE_THRESHOLD,
+        Source.circuit_open_until > now
+    ).all()
+    return {job_for_source(source) for source in sources}
+
+def skip_open_circuits(jobs, db=None, now=None):
+    """
+    Drop fetch jobs whose source has an open circuit breaker
+    
+    For crawls that do not go through the per-source schedule (cold
+    snapshot builds and the direct fetch helpers), so they do not hit
+    sources that are backing off.
+    
+    Args:
+        jobs: List of FetchJob
+        db: Database session (optional)
+        now: Current time (defaults to utcnow)
+    
+    Returns:
+        Jobs to fetch (all of them if the sources table is unavailable)
+    """
+    if not jobs:
+        return jobs
+    
+    now = now or datetime.now(timezone.utc)
+    try:
+        if db is not None:
+            open_jobs = _open_circuit_jobs(db, now)
+        else:
+            from app.core.database import get_db
+            with get_db() as session:
+                open_jobs = _open_circuit_jobs(session, now)
+    except Exception as e:
+        logger.warning(f'Could not check source circuit breakers: {str(e)}')
+        return jobs
+    
+    return [job for job in jobs if job not in open_jobs]
+
+def compute_next_interval(current_interval, elapsed, new_entries):
+    """
+    Learn the next fetch interval from how often new entries appear
+    
+    The interval moves halfway towards the observed time per new entry,
+    backs off by 50% when nothing new appeared and is clamped to
+    [SOURCE_MIN_INTERVAL, SOURCE_MAX_INTERVAL].
+    
+    Args:
+        current_interval: Current fetch interval in seconds
+        elapsed: Seconds since the previous fetch (None on first fetch)
+        new_entries: Number of entries not seen in the previous fetch
+    
+    Returns:
+        Next interval in seconds
+    """
+    interval = current_interval or Config.CACHE_TTL
+    
+    if elapsed:
+        if new_entries > 0:
+            observed = elapsed / new_entries
+            interval = (interval + observed) / 2
+        else:
+            interval = interval * 1.5
+    
+    return int(min(max(interval, Config.SOURCE_MIN_INTERVAL), Config.SOURCE_MAX_INTERVAL))
+
+def next_fetch_delay(interval, success_rate=1.0):
+    """
+    Get the delay before the next fetch of a source
+    
+    Unreliable sources are retried less eagerly, and the delay is spread by
+    +/- SOURCE_INTERVAL_JITTER so fetches do not cluster.
+    
+    Args:
+        interval: Learned fetch interval in seconds
+        success_rate: Source success rate (0.0-1.0)
+    
+    Returns:
+        Delay in seconds
+    """
+    if success_rate is None:
+        success_rate = 1.0
+    delay = min(interval / max(success_rate, 0.25), Config.SOURCE_MAX_INTERVAL)
+    
+    jitter = Config.SOURCE_INTERVAL_JITTER
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+def count_new_entries(job, articles):
+    """
+    Count entries that were not in the previously stored fetch of a source
+    
+    Args:
+        job: FetchJob
+        articles: Newly fetched articles
+    
+    Returns:
+        Number of new entries
+    """
+    previous = load_source_articles([job]).get(job)
+    if previous is None:
+        return len(articles)
+    
+    previous_links = {article.get('link') for article in previous}
+    return sum(1 for article in articles if article.get('link') not in previous_links)
+
+def schedule_next_fetch(source, new_entries, fetch_time, succeeded=True, now=None):
+    """
+    Record a fetch on a Source row and schedule its next run
+    
+    Args:
+        source: Source model instance
+        new_entries: Number of new entries found
+        fetch_time: Seconds the fetch took
+        succeeded: Whether the fetch completed without error
+        now: Current time (defaults to utcnow)
+    """
+    now = now or datetime.now(timezone.utc)
+    
+    elapsed = None
+    if source.last_fetched_at is not None:
+        last_fetched_at = source.last_fetched_at
+        if last_fetched_at.tzinfo is None:
+            last_fetched_at = last_fetched_at.replace(tzinfo=timezone.utc)
+        elapsed = (now - last_fetched_at).total_seconds()
+    
+    # Only successful fetches say how often new entries appear; failures
+    # are backed off by the circuit breaker alone
+    if succeeded:
+        source.record_success(fetch_time)
+        source.last_fetched_at = now
+        source.fetch_frequency = compute_next_interval(source.fetch_frequency, elapsed, new_entries)
+    else:
+        source.record_error(now)
+    source.next_fetch_at = now + timedelta(
+        seconds=next_fetch_delay(source.fetch_frequency, source.success_rate)
+    )
+    
+    # An open circuit is not fetched again before its backoff ends
+    if source.circuit_state(now) == 'open':
+        open_until = source.circuit_open_until
+        if open_until.tzinfo is None:
+            open_until = open_until.replace(tzinfo=timezone.utc)
+        source.next_fetch_at = max(source.next_fetch_at, open_until)
@@ -1,31 +1,41 @@
 """Trending service for recent articles"""
+from app.core.config import Config
+from app.core.database import get_db
+from app.services.article_service import query_articles, rows_to_articles
 from app.services.feed_service import get_all_feeds
-from datetime import datetime, timedelta
-from dateutil import parser
+from datetime import datetime, timedelta, timezone
+from app.utils.dates import article_timestamp
+from app.utils.feed_aggregator import top_by_date
+from app.utils.near_duplicates import collapse_near_duplicates
+import logging
 
-def get_trending_articles(days=1, limit=20):
-    """Get articles published within the last N days"""
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-    
-    # Get all articles
-    articles = get_all_feeds()
-    
-    # Filter articles by published date
+logger = logging.getLogger(__name__)
+
+def _filter_recent(articles, cutoff_ts):
+    """Filter snapshot articles by published time (undated articles are kept)"""
     recent_articles = []
     for article in articles:
-        published = article.get('published', '')
-        if published:
-            try:
-                pub_date = parser.parse(published)
-                if pub_date.replace(tzinfo=None) >= cutoff_date:
-                    recent_articles.append(article)
-            except Exception:
-                # If date parsing fails, include the article
-                recent_articles.append(article)
-        else:
-            # If no published date, include the article
+        published_ts = article_timestamp(article)
+        if published_ts is None or published_ts >= cutoff_ts:
             recent_articles.append(article)
+    return recent_articles
+
+def get_trending_articles(days=1, limit=20):
+    """Get articles published within the last N days"""
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+    
+    try:
+        # Query the recent window directly instead of scanning the whole snapshot
+        with get_db() as db:
+            rows = query_articles(
+                db,
+                since=cutoff_date,
+                limit=Config.FEED_SNAPSHOT_LIMIT
+            )
+            recent_articles = collapse_near_duplicates(rows_to_articles(rows, db=db))
+    except Exception as e:
+        logger.error(f'Failed to query trending articles: {str(e)}')
+        recent_articles = _filter_recent(get_all_feeds(), cutoff_date.timestamp())
     
-    # Sort by published date (newest first)
-    recent_articles.sort(key=lambda x: x.get('published', ''), reverse=True)
-    return recent_articles[:limit]
+    # Newest first without sorting the whole window
+    return top_by_date(recent_articles, limit)
@@ -1,5 +1,6 @@
 import unittest
-from app.utils.feed_aggregator import deduplicate_articles, sort_by_date, aggregate_feeds
+import random
+from app.utils.feed_aggregator import deduplicate_articles, sort_by_date, aggregate_feeds, merge_by_date, top_by_date
 
 class TestFeedAggregator(unittest.TestCase):
     """Test feed aggregation functionality"""
@@ -65,5 +66,25 @@ class TestFeedAggregator(unittest.TestCase):
         result = aggregate_feeds(rss, [], limit=5)
         self.assertEqual(len(result), 5)
 
+    def test_merge_matches_full_sort(self):
+        """Test merging source runs gives the same order as a full sort"""
+        rng = random.Random(7)
+        articles = []
+        for source in range(5):
+            timestamps = sorted((rng.randrange(100) for _ in range(20)), reverse=True)
+            articles += [{'title': f'{source}-{i}', 'published_ts': ts} for i, ts in enumerate(timestamps)]
+        articles.append({'title': 'undated', 'published_ts': None})
+        head = articles[:30]
+        rng.shuffle(head)
+        articles[:30] = head
+        
+        self.assertEqual(merge_by_date(articles), sort_by_date(articles))
+        self.assertEqual(merge_by_date(articles, limit=7), sort_by_date(articles)[:7])
+    
+    def test_top_by_date(self):
+        """Test top-k selection returns the newest articles in order"""
+        articles = [{'title': str(ts), 'published_ts': ts} for ts in [5, 1, 9, 3, 7]]
+        self.assertEqual([a['published_ts'] for a in top_by_date(articles, 3)], [9, 7, 5])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
+from app.services.article_service import parse_published, upsert_articles
+
+class RecordingSession:
+    """Minimal session that records executed statements"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def execute(self, statement):
+        self.statements.append(statement)
+
+class TestArticleService(unittest.TestCase):
+    """Test article persistence helpers"""
+    
+    def test_parse_published(self):
+        """Test published strings are normalized to UTC"""
+        self.assertEqual(
+            parse_published('Mon, 01 Jan 2024 12:00:00 +0100'),
+            datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            parse_published('2024-01-01T12:00:00'),
+            datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        )
+        self.assertIsNone(parse_published(''))
+        self.assertIsNone(parse_published('not a date'))
+    
+    def test_upsert_dedupes_links(self):
+        """Test duplicate links collapse into one row per upsert"""
+        db = RecordingSession()
+        articles = [
+            {'link': 'https://example.com/a', 'title': 'First'},
+            {'link': 'https://example.com/a', 'title': 'First (updated)'},
+            {'link': 'https://example.com/b', 'title': 'Second'},
+            {'title': 'No link'}
+        ]
+        
+        self.assertEqual(upsert_articles(db, articles), 2)
+        self.assertEqual(len(db.statements), 1)
+        
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        self.assertIn('ON CONFLICT (link) DO UPDATE', sql)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import unittest
+from unittest.mock import patch
+from app.services.feed_service import save_ai_categories
+from app.utils.gemini_categorizer import CategorizationQueue, parse_response
+from app.utils.token_bucket import TokenBucket
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+class StubModel:
+    """Local stand-in for the Gemini model answering every article with fixed categories"""
+    
+    def __init__(self, categories=('AI',), failures=0):
+        self.categories = list(categories)
+        self.failures = failures
+        self.prompts = []
+    
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('quota exceeded')
+        
+        articles = json.loads(prompt.split('Articles (JSON):\n', 1)[1].split('\n', 1)[0])
+        return StubResponse(json.dumps({str(article['id']): self.categories for article in articles}))
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+def make_articles(count):
+    return [{'link': f'https://example.com/{i}', 'title': f'Story {i}', 'summary': 'Details'} for i in range(count)]
+
+@patch('app.utils.gemini_categorizer.cache_set_many', return_value=True)
+@patch('app.utils.gemini_categorizer.cache_get_many', return_value={})
+class TestCategorizationQueue(unittest.TestCase):
+    """Test the batched background categorization queue"""
+    
+    def make_queue(self, model, batch_size=10):
+        self.results = []
+        clock = FakeClock()
+        bucket = TokenBucket(1.0, capacity=1, clock=clock, sleep=clock.sleep)
+        return CategorizationQueue(model=model, on_result=self.results.extend, batch_size=batch_size, bucket=bucket, background=False)
+    
+    def test_one_request_per_batch(self, cache_get_many, cache_set_many):
+        """Test articles are packed batch_size to a model request"""
+        model = StubModel(categories=['AI', 'Cloud'])
+        categorizer = self.make_queue(model, batch_size=10)
+        
+        self.assertEqual(categorizer.submit(make_articles(25)), 25)
+        categorizer.drain()
+        
+        self.assertEqual(len(model.prompts), 3)
+        self.assertEqual(len(self.results), 25)
+        self.assertTrue(all(categories == ['AI', 'Cloud'] for _, _, categories in self.results))
+        self.assertEqual(cache_set_many.call_count, 3)
+    
+    def test_duplicate_submissions_queued_once(self, cache_get_many, cache_set_many):
+        """Test an article already waiting is not queued again"""
+        model = StubModel()
+        categorizer = self.make_queue(model)
+        
+        categorizer.submit(make_articles(5))
+        self.assertEqual(categorizer.submit(make_articles(5)), 0)
+        categorizer.drain()
+        
+        self.assertEqual(len(self.results), 5)
+    
+    def test_failed_batch_retried_once(self, cache_get_many, cache_set_many):
+        """Test a failed request is retried once and then given up on"""
+        categorizer = self.make_queue(StubModel(failures=1))
+        categorizer.submit(make_articles(3))
+        categorizer.drain()
+        self.assertEqual(len(self.results), 3)
+        
+        model = StubModel(failures=5)
+        categorizer = self.make_queue(model)
+        categorizer.submit(make_articles(3))
+        categorizer.drain()
+        self.assertEqual(len(model.prompts), 2)
+        self.assertEqual(self.results, [])
+    
+    def test_full_queue_drops_articles(self, cache_get_many, cache_set_many):
+        """Test submit never blocks when the queue is full"""
+        with patch('app.utils.gemini_categorizer.Config.GEMINI_QUEUE_SIZE', 2):
+            categorizer = self.make_queue(StubModel())
+        
+        self.assertEqual(categorizer.submit(make_articles(5)), 2)
+        self.assertEqual(categorizer.dropped, 3)
+
+class TestWriteBack(unittest.TestCase):
+    """Test Gemini results are stored only for the version they were computed for"""
+    
+    def test_stale_results_are_not_written(self):
+        """Test a result for an older version of an article is dropped"""
+        seen = {
+            'https://example.com/0': {'hash': 'current', 'keep': True, 'categories': ['Web'], 'content_score': 0.5},
+            'https://example.com/1': {'hash': 'newer', 'keep': True, 'categories': ['Web'], 'content_score': 0.5},
+        }
+        results = [('https://example.com/0', 'current', ['AI']), ('https://example.com/1', 'older', ['AI'])]
+        
+        with patch('app.utils.seen_entries.get_seen_entries', return_value=seen), \
+                patch('app.utils.seen_entries.save_seen_entries'), \
+                patch('app.services.feed_service.get_db'), \
+                patch('app.services.feed_service.update_article_categories') as update:
+            save_ai_categories(results)
+        
+        self.assertEqual(update.call_args[0][1], {'https://example.com/0': ['AI']})
+
+class TestParseResponse(unittest.TestCase):
+    """Test parsing of batch replies"""
+    
+    def test_parse_fenced_reply(self):
+        """Test a fenced reply keeps only valid categories and article ids"""
+        text = '```json\n{"0": ["AI", "Cooking"], "1": "Web", "2": ["Cloud"], "x": ["AI"], "7": ["Web"]}\n```'
+        self.assertEqual(parse_response(text, 3), {0: ['AI'], 2: ['Cloud']})
+    
+    def test_parse_garbage(self):
+        """Test an unparseable reply yields no results"""
+        self.assertEqual(parse_response('Sorry, I cannot help with that.', 2), {})
+        self.assertEqual(parse_response('{"0": [', 2), {})
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the token bucket rate limiter"""
+    
+    def test_rate_limits_requests(self):
+        """Test acquisitions past the burst wait for tokens to refill"""
+        clock = FakeClock()
+        bucket = TokenBucket(0.5, capacity=2, clock=clock, sleep=clock.sleep)
+        
+        for _ in range(4):
+            bucket.acquire()
+        
+        self.assertEqual(clock.now, 4.0)
+        self.assertFalse(bucket.try_acquire())
+        clock.now += 2
+        self.assertTrue(bucket.try_acquire())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from app.core.config import Config
+from app.models.source import Source
+from app.services.source_service import schedule_next_fetch, skip_open_circuits
+from app.utils.fetch_engine import FetchJob
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def make_source():
+    return Source(
+        name='example', url='https://example.com/feed', type='rss',
+        fetch_frequency=900, error_count=0, success_count=0,
+        success_rate=1.0, avg_fetch_time=0.0, consecutive_failures=0, is_active=True
+    )
+
+class StubSession:
+    """Minimal session whose queries return fixed Source rows"""
+    
+    def __init__(self, sources):
+        self.sources = sources
+    
+    def query(self, model):
+        return self
+    
+    def filter(self, *criteria):
+        return self
+    
+    def all(self):
+        return self.sources
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test per-source circuit breaker transitions"""
+    
+    def fail(self, source, times):
+        for _ in range(times):
+            source.record_error(NOW)
+    
+    def test_stays_closed_below_threshold(self):
+        """Test failures below the threshold keep the circuit closed"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD - 1)
+        self.assertEqual(source.circuit_state(NOW), 'closed')
+    
+    def test_opens_then_half_opens(self):
+        """Test the circuit opens at the threshold and half-opens after the backoff"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD)
+        
+        self.assertEqual(source.circuit_state(NOW), 'open')
+        self.assertEqual(source.circuit_open_until, NOW + timedelta(seconds=Config.CIRCUIT_BASE_BACKOFF))
+        self.assertEqual(source.circuit_state(source.circuit_open_until), 'half-open')
+    
+    def test_backoff_doubles_and_is_capped(self):
+        """Test each failed trial doubles the backoff up to the maximum"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD + 1)
+        self.assertEqual(source.circuit_open_until, NOW + timedelta(seconds=Config.CIRCUIT_BASE_BACKOFF * 2))
+        
+        self.fail(source, 30)
+        self.assertEqual(source.circuit_open_until, NOW + timedelta(seconds=Config.CIRCUIT_MAX_BACKOFF))
+    
+    def test_success_closes_circuit(self):
+        """Test a successful trial fetch closes the circuit"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD)
+        source.record_success(0.5)
+        
+        self.assertEqual(source.circuit_state(NOW), 'closed')
+        self.assertEqual(source.consecutive_failures, 0)
+    
+    def test_open_circuit_delays_next_fetch(self):
+        """Test scheduling never picks a time before the circuit half-opens"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD - 1)
+        schedule_next_fetch(source, 0, None, succeeded=False, now=NOW)
+        
+        self.assertEqual(source.circuit_state(NOW), 'open')
+        self.assertGreaterEqual(source.next_fetch_at, source.circuit_open_until)
+    
+    def test_failure_does_not_stretch_interval(self):
+        """Test a failed fetch leaves the learned interval to the next success"""
+        source = make_source()
+        schedule_next_fetch(source, 3, 0.5, now=NOW)
+        
+        schedule_next_fetch(source, 0, None, succeeded=False, now=NOW + timedelta(seconds=900))
+        self.assertEqual(source.fetch_frequency, 900)
+        self.assertEqual(source.last_fetched_at, NOW)
+        
+        schedule_next_fetch(source, 6, 0.5, now=NOW + timedelta(seconds=1200))
+        self.assertEqual(source.fetch_frequency, max(Config.SOURCE_MIN_INTERVAL, (900 + 200) // 2))
+    
+    def test_repeated_failures_keep_source_active(self):
+        """Test a failing source backs off instead of being disabled for good"""
+        source = make_source()
+        self.fail(source, 20)
+        
+        self.assertTrue(source.is_active)
+        source.record_success(0.5)
+        self.assertEqual(source.circuit_state(NOW), 'closed')
+    
+    def test_unscheduled_crawls_skip_open_circuits(self):
+        """Test jobs for sources with an open circuit are dropped"""
+        source = make_source()
+        self.fail(source, Config.CIRCUIT_FAILURE_THRESHOLD)
+        jobs = [FetchJob('rss', source.url), FetchJob('rss', 'https://other.example.com/feed')]
+        
+        kept = skip_open_circuits(jobs, db=StubSession([source]), now=NOW)
+        self.assertEqual(kept, [FetchJob('rss', 'https://other.example.com/feed')])
+
+if __name__ == '__main__':
+    unittest.main()
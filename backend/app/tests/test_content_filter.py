@@ -0,0 +1,41 @@
+import unittest
+from app.utils.content_filter import (
+    filter_articles, rejection_rule, contains_explicit_content, is_non_english,
+    get_filter_stats, reset_filter_stats
+)
+
+class TestContentFilter(unittest.TestCase):
+    """Test the compiled content filter rules"""
+    
+    def setUp(self):
+        reset_filter_stats()
+    
+    def test_rules(self):
+        """Test each rule is detected"""
+        self.assertEqual(rejection_rule({'title': 'NSFW gallery leaks', 'summary': ''}), 'explicit')
+        self.assertEqual(rejection_rule({'title': 'Новости технологий', 'summary': ''}), 'non_latin_script')
+        self.assertEqual(rejection_rule({'title': 'La computación en la nube', 'summary': 'Está transformando el mundo de las empresas.'}), 'non_english')
+        self.assertIsNone(rejection_rule({'title': 'Python 3.13 released', 'summary': 'A faster interpreter and a new REPL.'}))
+    
+    def test_whole_word_matching(self):
+        """Test explicit keywords only match whole words"""
+        self.assertTrue(contains_explicit_content('Adult content warning'))
+        self.assertFalse(contains_explicit_content('Sussex police update'))
+        self.assertFalse(is_non_english('Café opens downtown today'))
+    
+    def test_filter_counts_rules(self):
+        """Test rejected articles are counted per rule instead of printed"""
+        articles = [
+            {'title': 'Porn sites blocked', 'summary': ''},
+            {'title': 'Xxx and more', 'summary': ''},
+            {'title': '日本のニュース', 'summary': ''},
+            {'title': 'Rust 2.0 announced', 'summary': 'The Rust team shipped a release.'},
+        ]
+        
+        kept = filter_articles(articles)
+        
+        self.assertEqual([a['title'] for a in kept], ['Rust 2.0 announced'])
+        self.assertEqual(get_filter_stats(), {'explicit': 2, 'non_latin_script': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from app.utils.dates import parse_timestamp, article_timestamp, stamp_published_ts
+from app.utils.feed_aggregator import sort_by_date
+from app.utils.quality_scorer import calculate_freshness_score
+
+JAN_1_NOON = 1704110400  # 2024-01-01T12:00:00Z
+
+class TestDates(unittest.TestCase):
+    """Test ingest-time published date normalization"""
+    
+    def test_parses_common_formats(self):
+        """Test ISO 8601, RFC 822 and other formats parse to the same instant"""
+        self.assertEqual(parse_timestamp('2024-01-01T12:00:00Z'), JAN_1_NOON)
+        self.assertEqual(parse_timestamp('2024-01-01T12:00:00'), JAN_1_NOON)
+        self.assertEqual(parse_timestamp('Mon, 01 Jan 2024 13:00:00 +0100'), JAN_1_NOON)
+        self.assertEqual(parse_timestamp('Mon, 01 Jan 2024 12:00:00 GMT'), JAN_1_NOON)
+        self.assertEqual(parse_timestamp('January 1, 2024 12:00 UTC'), JAN_1_NOON)
+    
+    def test_unparseable_dates(self):
+        """Test missing or invalid dates give None"""
+        self.assertIsNone(parse_timestamp(''))
+        self.assertIsNone(parse_timestamp(None))
+        self.assertIsNone(parse_timestamp('not a date'))
+    
+    def test_stamped_timestamp_is_used(self):
+        """Test published_ts is stamped once and preferred over re-parsing"""
+        articles = stamp_published_ts([{'published': '2024-01-01T12:00:00Z'}, {'published': 'soon'}])
+        
+        self.assertEqual(articles[0]['published_ts'], JAN_1_NOON)
+        self.assertIsNone(articles[1]['published_ts'])
+        self.assertEqual(article_timestamp({'published': 'garbage', 'published_ts': 5}), 5)
+    
+    def test_sort_mixes_formats(self):
+        """Test RFC 822 and ISO dates sort together, undated last"""
+        articles = [
+            {'title': 'Undated'},
+            {'title': 'Old', 'published': '2024-01-01T10:00:00Z'},
+            {'title': 'New', 'published': 'Tue, 02 Jan 2024 10:00:00 GMT'},
+        ]
+        
+        self.assertEqual([a['title'] for a in sort_by_date(articles)], ['New', 'Old', 'Undated'])
+    
+    def test_freshness_from_timestamp(self):
+        """Test freshness scoring works on epoch seconds"""
+        self.assertEqual(calculate_freshness_score(JAN_1_NOON, now=JAN_1_NOON + 3600), 1.0)
+        self.assertEqual(calculate_freshness_score(JAN_1_NOON, now=JAN_1_NOON - 3600), 0.1)
+        self.assertEqual(calculate_freshness_score(None), 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
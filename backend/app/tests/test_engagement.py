@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import patch
+from sqlalchemy.dialects import postgresql
+from app.services.article_service import rows_to_articles
+from app.services.engagement_service import record_engagement, record_feedback_change, feedback_count, remove_user_engagement
+from app.utils.quality_scorer import score_articles, engagement_from_counts
+
+class RecordingSession:
+    """Minimal session that records executed statements"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def execute(self, statement):
+        self.statements.append(statement)
+
+class GroupedCountSession(RecordingSession):
+    """Recording session whose grouped count queries return fixed rows in order"""
+    
+    def __init__(self, *results):
+        super().__init__()
+        self.results = list(results)
+    
+    def query(self, *entities):
+        return self
+    
+    def filter(self, *criteria):
+        return self
+    
+    def group_by(self, *clauses):
+        return iter(self.results.pop(0))
+
+def compiled(statement):
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+
+class ArticleRow:
+    """Stand-in for an Article row"""
+    
+    def __init__(self, link, title):
+        self.link = link
+        self.content_score = None
+        self.source_key = None
+        self.data = {'link': link, 'title': title, 'summary': 'x' * 60}
+    
+    def to_dict(self):
+        return dict(self.data)
+
+class TestEngagement(unittest.TestCase):
+    """Test materialized engagement counts and their use in scoring"""
+    
+    def test_record_engagement_upserts_increment(self):
+        """Test counts are incremented in one upsert and never go negative"""
+        db = RecordingSession()
+        record_engagement(db, 'https://example.com/a', bookmarks=-1)
+        
+        sql = compiled(db.statements[0])
+        self.assertIn('ON CONFLICT (article_url) DO UPDATE', sql)
+        self.assertIn('greatest(article_engagement.bookmarks + -1, 0)', sql)
+        self.assertNotIn('reads', sql.split('DO UPDATE')[1])
+    
+    def test_feedback_change_moves_tally(self):
+        """Test changing feedback moves the vote between helpful and negative"""
+        self.assertEqual(feedback_count('spam'), 'negative')
+        self.assertIsNone(feedback_count('other'))
+        
+        db = RecordingSession()
+        record_feedback_change(db, 'https://example.com/a', 'spam', 'low_quality')
+        self.assertEqual(db.statements, [])
+        
+        record_feedback_change(db, 'https://example.com/a', 'helpful', 'spam')
+        sql = compiled(db.statements[0]).split('DO UPDATE')[1]
+        self.assertIn('article_engagement.helpful + -1', sql)
+        self.assertIn('article_engagement.negative + 1', sql)
+    
+    def test_deleted_user_activity_is_uncounted(self):
+        """Test deleting an account takes its activity out of the counts"""
+        db = GroupedCountSession(
+            [('https://example.com/a', 2)],
+            [('https://example.com/a', 1), ('https://example.com/b', 1)],
+            [],
+            [('https://example.com/b', 1)],
+        )
+        remove_user_engagement(db, 7)
+        
+        updates = [compiled(statement).split('DO UPDATE')[1] for statement in db.statements]
+        self.assertEqual(len(updates), 2)
+        self.assertIn('article_engagement.reads + -2', updates[0])
+        self.assertIn('article_engagement.bookmarks + -1', updates[0])
+        self.assertIn('article_engagement.bookmarks + -1', updates[1])
+        self.assertIn('article_engagement.negative + -1', updates[1])
+    
+    def test_engagement_lifts_score(self):
+        """Test engaged articles outrank otherwise identical ones"""
+        articles = [
+            {'link': 'a', 'title': 'A perfectly ordinary headline', 'summary': 'x' * 60},
+            {'link': 'b', 'title': 'A perfectly ordinary headline', 'summary': 'x' * 60},
+        ]
+        engagement = {'b': engagement_from_counts(200, 40, 25, 0)}
+        
+        plain, engaged = score_articles(articles, engagement_scores=engagement)
+        self.assertEqual(plain, score_articles(articles)[0])
+        self.assertAlmostEqual(engaged - plain, 0.1, places=3)
+    
+    def test_row_scores_include_engagement(self):
+        """Test trending/popular rows are scored with engagement, like the snapshot"""
+        rows = [ArticleRow('a', 'A perfectly ordinary headline'), ArticleRow('b', 'A perfectly ordinary headline')]
+        engagement = {'a': engagement_from_counts(200, 40, 25, 0)}
+        
+        with patch('app.services.engagement_service.get_engagement_scores', return_value=engagement) as load, \
+                patch('app.services.article_service.get_source_registry') as registry:
+            registry.return_value.tiers_by_link.return_value = {}
+            articles = rows_to_articles(rows, min_quality_score=0.0, db=object())
+        
+        load.assert_called_once()
+        expected = score_articles([row.to_dict() for row in rows], engagement_scores=engagement)
+        self.assertEqual({article['link']: article['quality_score'] for article in articles}, {'a': expected[0], 'b': expected[1]})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from app.core.config import Config
+from app.utils import fetch_engine
+from app.utils.feed_archive import body_hash, archive_body, load_body, iter_archive
+from app.utils.fetch_engine import FetchJob, RawPayload
+from app.scripts.replay_feed_archive import replay
+
+class TestFeedArchive(unittest.TestCase):
+    """Test the content-addressed body archive"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_dir = Config.FEED_ARCHIVE_DIR
+        Config.FEED_ARCHIVE_DIR = self.tmp.name
+
+    def tearDown(self):
+        Config.FEED_ARCHIVE_DIR = self.original_dir
+        self.tmp.cleanup()
+
+    def test_archive_round_trip(self):
+        """Test archived bodies can be replayed from the index"""
+        content = b'<rss></rss>'
+        payload = RawPayload('https://example.com/feed', 200, content, {'Content-Type': 'application/rss+xml'}, body_hash(content))
+
+        self.assertTrue(archive_body('rss', 'https://example.com/feed', payload))
+
+        records = list(iter_archive())
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['hash'], payload.body_hash)
+        self.assertEqual(load_body(records[0]['hash']), content)
+
+    def test_identical_body_skips_parsing(self):
+        """Test a body matching the last fetch returns the stored articles"""
+        content = b'<rss>unchanged</rss>'
+        stored = {'etag': None, 'modified': None, 'body_hash': body_hash(content), 'articles': [{'title': 'Cached'}]}
+        response = MagicMock(status_code=200, content=content, headers={})
+
+        with patch.object(fetch_engine, 'get_feed_validators', return_value=stored), \
+                patch.object(fetch_engine, 'fetch_url', return_value=response):
+            articles, payload = fetch_engine.download_source(FetchJob('rss', 'https://example.com/feed'))
+
+        self.assertEqual(articles, [{'title': 'Cached'}])
+        self.assertIsNone(payload)
+        self.assertEqual(list(iter_archive()), [])
+
+    def test_replay_counts_failed_bodies(self):
+        """Test bodies that fail to parse are counted instead of crashing the replay"""
+        payload = RawPayload('https://example.com/feed', 200, b'<rss></rss>', {}, body_hash(b'<rss></rss>'))
+
+        with patch.object(fetch_engine, 'parse_source', side_effect=[ValueError('bad body'), [{'title': 'Parsed'}]]):
+            article_count, failed, _ = replay([('rss', 'a', payload), ('rss', 'b', payload)])
+
+        self.assertEqual((article_count, failed), (1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+from app.services import feed_service
+
+STALE = [{'title': 'Stale article', 'link': 'https://example.com/stale'}]
+FRESH = [{'title': 'Fresh article', 'link': 'https://example.com/fresh'}]
+
+def fake_cache(stale=None):
+    """Cache where the fresh key is expired and the stale copy may remain"""
+    return lambda key: stale if key.endswith(':stale') else None
+
+class TestFeedCacheSingleFlight(unittest.TestCase):
+    """Test single-flight refresh of expired feed snapshots"""
+    
+    def test_stale_snapshot_served_while_locked(self):
+        """Test callers without the lock get the stale snapshot and do not build"""
+        with patch.object(feed_service, 'cache_get', side_effect=fake_cache(STALE)), \
+                patch.object(feed_service, 'cache_acquire_lock', return_value=None), \
+                patch.object(feed_service, 'build_canonical_snapshot') as build:
+            self.assertEqual(feed_service.get_canonical_snapshot(), STALE)
+            build.assert_not_called()
+    
+    def test_lock_holder_builds_without_stale(self):
+        """Test the lock holder builds, caches and releases when nothing is stale"""
+        with patch.object(feed_service, 'cache_get', side_effect=fake_cache()), \
+                patch.object(feed_service, 'cache_acquire_lock', return_value='token'), \
+                patch.object(feed_service, 'cache_release_lock') as release, \
+                patch.object(feed_service, 'cache_set') as cache_set, \
+                patch.object(feed_service, 'build_canonical_snapshot', return_value=FRESH) as build:
+            self.assertEqual(feed_service.get_canonical_snapshot(), FRESH)
+            build.assert_called_once()
+            release.assert_called_once_with(f'{feed_service.CANONICAL_FEEDS_KEY}:lock', 'token')
+            self.assertEqual(cache_set.call_count, 2)
+
+class TestDeriveFeeds(unittest.TestCase):
+    """Test feed variants derived from the canonical snapshot"""
+    
+    def setUp(self):
+        self.snapshot = [
+            {'link': 'a', 'type': 'rss', 'feed_list': 'tech', 'quality_score': 0.5},
+            {'link': 'b', 'type': 'rss', 'feed_list': 'general', 'quality_score': 0.9},
+            {'link': 'c', 'type': 'reddit', 'feed_list': None, 'quality_score': 0.7},
+            {'link': 'd', 'type': 'rss', 'feed_list': 'both', 'quality_score': 0.3},
+        ]
+    
+    def links(self, articles):
+        return [article['link'] for article in articles]
+    
+    def test_content_preference(self):
+        """Test RSS articles are limited to the preferred feed list"""
+        tech = feed_service.derive_feeds(self.snapshot, apply_quality_filter=False, content_preference='tech')
+        self.assertEqual(self.links(tech), ['a', 'c', 'd'])
+        
+        both = feed_service.derive_feeds(self.snapshot, apply_quality_filter=False)
+        self.assertEqual(self.links(both), ['a', 'b', 'c', 'd'])
+    
+    def test_quality_filter_and_limit(self):
+        """Test the newest articles are limited before filtering and sorting by quality"""
+        articles = feed_service.derive_feeds(self.snapshot, limit=3, min_quality_score=0.4)
+        self.assertEqual(self.links(articles), ['b', 'c', 'a'])
+    
+    def test_source_filter(self):
+        """Test filtering by article type"""
+        articles = feed_service.derive_feeds(self.snapshot, source_filter='reddit')
+        self.assertEqual(self.links(articles), ['c'])
+
+if __name__ == '__main__':
+    unittest.main()
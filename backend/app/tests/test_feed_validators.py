@@ -0,0 +1,31 @@
+import unittest
+from app.utils.feed_validators import conditional_headers, save_feed_validators
+
+class TestFeedValidators(unittest.TestCase):
+    """Test conditional GET validator helpers"""
+    
+    def test_conditional_headers_empty(self):
+        """Test no headers are sent without stored validators"""
+        self.assertEqual(conditional_headers(None), {})
+        self.assertEqual(conditional_headers({}), {})
+    
+    def test_conditional_headers_etag(self):
+        """Test ETag is sent as If-None-Match"""
+        headers = conditional_headers({'etag': '"abc123"', 'modified': None})
+        self.assertEqual(headers, {'If-None-Match': '"abc123"'})
+    
+    def test_conditional_headers_both(self):
+        """Test both validators are sent"""
+        headers = conditional_headers({
+            'etag': '"abc123"',
+            'modified': 'Mon, 01 Jan 2024 10:00:00 GMT'
+        })
+        self.assertEqual(headers['If-None-Match'], '"abc123"')
+        self.assertEqual(headers['If-Modified-Since'], 'Mon, 01 Jan 2024 10:00:00 GMT')
+    
+    def test_save_without_validators_is_skipped(self):
+        """Test responses without validators are not stored"""
+        self.assertFalse(save_feed_validators('https://example.com/feed', None, None, []))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import time
+from unittest.mock import patch
+from app.core.config import Config
+from app.utils.fetch_engine import FetchJob, RawPayload, build_fetch_jobs, run_fetch_jobs
+import app.utils.fetch_engine as fetch_engine
+
+FEED_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example Blog</title>
+<item><title>First post</title><link>https://example.com/1</link>
+<description>&lt;p&gt;Hello world.&lt;/p&gt;</description></item>
+</channel></rss>"""
+
+class TestFetchEngine(unittest.TestCase):
+    """Test concurrent fetch engine"""
+    
+    def setUp(self):
+        """Replace real downloads with fake slow sources parsed inline"""
+        self.original_download = fetch_engine.download_source
+        self.original_parse_workers = Config.PARSE_WORKERS
+        
+        def fake_download(job):
+            time.sleep(1.5 if job.target == 'slow' else 0.2)
+            if job.target == 'broken':
+                raise ValueError('boom')
+            return [{'title': job.target, 'link': f'https://example.com/{job.target}'}], None
+        
+        fetch_engine.download_source = fake_download
+        Config.PARSE_WORKERS = 0
+    
+    def tearDown(self):
+        fetch_engine.download_source = self.original_download
+        Config.PARSE_WORKERS = self.original_parse_workers
+    
+    def test_build_fetch_jobs(self):
+        """Test jobs are built for every configured source"""
+        jobs = build_fetch_jobs(
+            rss_feeds=['https://example.com/feed'],
+            subreddits=['python'],
+            youtube_channels=['UC123']
+        )
+        self.assertEqual(jobs, [
+            FetchJob('rss', 'https://example.com/feed'),
+            FetchJob('reddit', 'python'),
+            FetchJob('youtube', 'UC123')
+        ])
+    
+    def test_runs_concurrently(self):
+        """Test total time is bounded by the slowest source"""
+        jobs = [FetchJob('rss', f'feed{i}') for i in range(10)]
+        
+        start = time.time()
+        articles = run_fetch_jobs(jobs, concurrency=10)
+        elapsed = time.time() - start
+        
+        self.assertEqual(len(articles), 10)
+        self.assertLess(elapsed, 1.0)
+    
+    def test_results_in_job_order(self):
+        """Test combined results keep job order"""
+        jobs = [FetchJob('rss', 'a'), FetchJob('rss', 'b'), FetchJob('rss', 'c')]
+        articles = run_fetch_jobs(jobs)
+        self.assertEqual([a['title'] for a in articles], ['a', 'b', 'c'])
+    
+    def test_failed_source_is_skipped(self):
+        """Test one failing source does not break the crawl"""
+        completed = []
+        jobs = [FetchJob('rss', 'ok'), FetchJob('rss', 'broken')]
+        
+        articles = run_fetch_jobs(jobs, on_result=lambda job, result, elapsed, error: completed.append((job.target, error is None)))
+        
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(sorted(completed), [('broken', False), ('ok', True)])
+    
+    def test_deadline_returns_partial_results(self):
+        """Test crawl stops at the deadline and keeps finished sources"""
+        jobs = [FetchJob('rss', 'fast'), FetchJob('rss', 'slow')]
+        
+        start = time.time()
+        articles = run_fetch_jobs(jobs, deadline=0.6)
+        elapsed = time.time() - start
+        
+        self.assertLess(elapsed, 1.2)
+        self.assertEqual([a['title'] for a in articles], ['fast'])
+
+def import_app_in_worker():
+    """Import the Flask app the way a spawned worker re-runs run.py, reporting whether the scheduler started"""
+    with patch('app.core.scheduler.init_scheduler') as init_scheduler:
+        import app.main  # noqa: F401
+    return init_scheduler.called
+
+class TestParsePool(unittest.TestCase):
+    """Test parsing downloaded bodies on the process pool"""
+    
+    def setUp(self):
+        self.original_download = fetch_engine.download_source
+        self.original_parse_workers = Config.PARSE_WORKERS
+        
+        def fake_download(job):
+            payload = RawPayload(job.target, 200, FEED_XML, {'Content-Type': 'application/rss+xml'})
+            return None, payload
+        
+        fetch_engine.download_source = fake_download
+        Config.PARSE_WORKERS = 1
+    
+    def tearDown(self):
+        fetch_engine.download_source = self.original_download
+        Config.PARSE_WORKERS = self.original_parse_workers
+    
+    def test_parse_batch(self):
+        """Test a batch is parsed in a worker process"""
+        payload = RawPayload('https://example.com/feed', 200, FEED_XML, {'Content-Type': 'application/rss+xml'})
+        results = fetch_engine.get_parse_executor().submit(
+            fetch_engine.parse_batch,
+            [('rss', 'https://example.com/feed', payload), ('rss', 'https://example.com/bad', None)]
+        ).result()
+        
+        self.assertEqual([a['title'] for a in results[0]], ['First post'])
+        self.assertEqual(results[0][0]['summary'], 'Hello world.')
+        self.assertIsNone(results[1])
+    
+    def test_crawl_parses_on_pool(self):
+        """Test downloaded feeds go through the parse pool during a crawl"""
+        jobs = [FetchJob('rss', f'https://example.com/feed{i}') for i in range(3)]
+        articles = run_fetch_jobs(jobs, deadline=30)
+        self.assertEqual([a['source'] for a in articles], ['Example Blog'] * 3)
+    
+    def test_worker_does_not_start_scheduler(self):
+        """Test a parse worker importing the app does not start its own scheduler"""
+        started = fetch_engine.get_parse_executor().submit(import_app_in_worker).result()
+        self.assertFalse(started)
+
+if __name__ == '__main__':
+    unittest.main()
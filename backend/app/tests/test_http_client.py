@@ -0,0 +1,59 @@
+import socket
+import unittest
+from unittest.mock import MagicMock, patch
+from app.utils import http_client
+
+class TestHttpClient(unittest.TestCase):
+    """Test the pooled HTTP client"""
+    
+    def tearDown(self):
+        http_client.clear_dns_cache()
+    
+    def test_session_is_shared(self):
+        """Test fetchers share one session that negotiates compression"""
+        session = http_client.get_session()
+        self.assertIs(session, http_client.get_session())
+        self.assertIn('gzip', session.headers['Accept-Encoding'])
+    
+    def test_body_read_stops_at_max_bytes(self):
+        """Test a capped fetch stops reading the body at max_bytes"""
+        chunks_read = []
+        def iter_content(chunk_size):
+            for _ in range(10):
+                chunks_read.append(chunk_size)
+                yield b'x' * chunk_size
+        
+        response = MagicMock(iter_content=iter_content)
+        with patch.object(http_client, 'get_session') as get_session:
+            get_session.return_value.get.return_value = response
+            fetched = http_client.fetch_url('https://example.com/feed', max_bytes=100000)
+        
+        self.assertEqual(len(fetched._content), 100000)
+        self.assertEqual(len(chunks_read), 2)
+    
+    def test_dns_lookups_are_cached(self):
+        """Test repeated lookups for a host resolve once"""
+        result = [(2, 1, 6, '', ('93.184.216.34', 443))]
+        cache = http_client.DnsCache()
+        with patch('app.utils.http_client.socket.getaddrinfo', return_value=result) as lookup:
+            self.assertEqual(cache.resolve('example.com', 443), [('93.184.216.34', 443)])
+            self.assertEqual(cache.resolve('example.com', 443), [('93.184.216.34', 443)])
+            lookup.assert_called_once()
+    
+    def test_dns_cache_is_bounded(self):
+        """Test the cache never holds more than max_hosts lookups"""
+        cache = http_client.DnsCache(max_hosts=2)
+        with patch('app.utils.http_client.socket.getaddrinfo', return_value=[(2, 1, 6, '', ('10.0.0.1', 80))]):
+            for host in ('a.example', 'b.example', 'c.example'):
+                cache.resolve(host, 80)
+        self.assertEqual(len(cache), 2)
+    
+    def test_dns_cache_scoped_to_fetch_session(self):
+        """Test only fetch connections use the cache, not the process resolver"""
+        original = socket.getaddrinfo
+        session = http_client.get_session()
+        self.assertIs(socket.getaddrinfo, original)
+        self.assertIsInstance(session.get_adapter('https://example.com'), http_client.CachedDnsAdapter)
+
+if __name__ == '__main__':
+    unittest.main()
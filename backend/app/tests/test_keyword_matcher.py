@@ -0,0 +1,41 @@
+import re
+import unittest
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.tag_matcher import match_tags_from_dict
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test the shared Aho-Corasick keyword matcher"""
+    
+    def setUp(self):
+        self.matcher = KeywordMatcher({
+            'category': {'AI': ['ai', 'machine learning'], 'Web': ['web', 'react']},
+            'tag': {'C++': ['c++'], 'Go': [' go ', 'golang'], 'React': ['react']},
+        })
+    
+    def test_overlapping_keywords_found_in_one_scan(self):
+        """Test keywords inside and overlapping others are all reported"""
+        hits = self.matcher.scan('react and machine learning said golang')
+        
+        self.assertEqual(set(hits), {'react', 'machine learning', 'ai', 'golang'})
+        self.assertTrue(hits['machine learning'])
+        self.assertFalse(hits['ai'])  # only inside 'said'
+        self.assertEqual(self.matcher.labels['react'], {'category': ['Web'], 'tag': ['React']})
+    
+    def test_word_boundaries_match_regex(self):
+        """Test whole-word flags agree with rf'\\b{keyword}\\b' for keywords edged by symbols"""
+        for text in ['modern c++ tips', 'c++x', 'let go now', 'let go !', 'xreact react', 'reactjs']:
+            hits = self.matcher.scan(text)
+            for keyword in hits:
+                expected = re.search(rf'\b{re.escape(keyword)}\b', text) is not None
+                self.assertEqual(hits[keyword], expected, (keyword, text))
+        
+        self.assertTrue(self.matcher.scan('let go now')[' go '])
+        self.assertFalse(self.matcher.scan('reactjs')['react'])
+    
+    def test_custom_tag_dict(self):
+        """Test tag dicts outside TAG_KEYWORDS get their own matcher"""
+        tags = match_tags_from_dict('Intro to Widgets', 'widgets everywhere', {'Widgets': ['Widgets']})
+        self.assertEqual(tags, [('Widgets', 2.5 / 3.0)])
+
+if __name__ == '__main__':
+    unittest.main()
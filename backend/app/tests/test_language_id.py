@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+from app.utils import language_id
+from app.utils.language_id import detect_languages, text_trigrams
+
+class TestLanguageId(unittest.TestCase):
+    """Test the trigram language identifier"""
+    
+    def test_trigrams(self):
+        """Test words are lowercased and space padded"""
+        self.assertEqual(text_trigrams('The 4 a'), [' th', 'the', 'he ', ' a '])
+    
+    def test_detects_languages(self):
+        """Test English and other Latin-script languages are told apart"""
+        texts = [
+            'Apple unveils new MacBook Pro with M4 chip. The new laptops ship next week with longer battery life.',
+            'El gobierno anuncia nuevas medidas económicas para las pequeñas empresas.',
+            'Die Bundesregierung plant neue Regeln für künstliche Intelligenz und Datenschutz.',
+            'Le gouvernement annonce de nouvelles mesures pour les entreprises.',
+        ]
+        self.assertEqual(detect_languages(texts), ['en', 'es', 'de', 'fr'])
+    
+    def test_short_texts_are_undetermined(self):
+        """Test short titles are not classified"""
+        self.assertEqual(detect_languages(['Das neue iPhone im Test']), [None])
+    
+    def test_results_are_cached(self):
+        """Test unchanged texts are not scored again"""
+        text = 'Cinco maneiras de extrair requisitos claros de stakeholders indecisos no projeto.'
+        detect_languages([text])
+        
+        with patch.object(language_id, '_score') as score:
+            self.assertEqual(detect_languages([text]), ['pt'])
+        score.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+from app.services.feed_service import _process_clustered, process_articles
+from app.utils.near_duplicates import simhash, find_clusters, collapse_near_duplicates
+
+SUMMARY = 'The company unveiled its new foldable phone with a larger battery and faster chip at an event on Tuesday.'
+
+def article(link, title, summary=SUMMARY, score=0.5):
+    return {'link': link, 'title': title, 'summary': summary, 'source': link.split('/')[2], 'type': 'rss', 'quality_score': score}
+
+class TestNearDuplicates(unittest.TestCase):
+    """Test SimHash near-duplicate clustering"""
+    
+    def test_similar_texts_have_close_fingerprints(self):
+        """Test a small edit changes few fingerprint bits"""
+        words = SUMMARY.lower().replace('.', '').split()
+        edited = words[:-1] + ['wednesday']
+        self.assertLessEqual(bin(simhash(words) ^ simhash(edited)).count('1'), 12)
+        self.assertEqual(simhash(words), simhash(list(words)))
+    
+    def test_clusters_reposts(self):
+        """Test the same story from several sources lands in one cluster"""
+        articles = [
+            article('https://techcrunch.com/a', 'Acme unveils foldable phone'),
+            article('https://theverge.com/b', 'Acme unveils foldable phone'),
+            article('https://example.com/c', 'Rust 2.0 released', 'The Rust team shipped a major release with a new borrow checker and faster builds.'),
+        ]
+        clusters = find_clusters(articles, max_distance=3)
+        
+        self.assertEqual([[a['link'] for a in cluster] for cluster in clusters], [
+            ['https://techcrunch.com/a', 'https://theverge.com/b'],
+            ['https://example.com/c'],
+        ])
+    
+    def test_short_texts_are_not_clustered(self):
+        """Test generic short titles are never merged"""
+        articles = [article('https://a.com/1', 'Weekly thread', ''), article('https://b.com/2', 'Weekly thread', '')]
+        self.assertEqual(len(find_clusters(articles, max_distance=3)), 2)
+    
+    def test_disabled(self):
+        """Test a negative distance keeps every article separate"""
+        articles = [article('https://a.com/1', 'Acme unveils foldable phone'), article('https://b.com/2', 'Acme unveils foldable phone')]
+        self.assertEqual(len(find_clusters(articles, max_distance=-1)), 2)
+    
+    def test_collapse_keeps_best_with_alternates(self):
+        """Test the highest scored article represents its cluster"""
+        articles = [
+            article('https://techcrunch.com/a', 'Acme unveils foldable phone', score=0.4),
+            article('https://theverge.com/b', 'Acme unveils foldable phone', score=0.8),
+        ]
+        collapsed = collapse_near_duplicates(articles)
+        
+        self.assertEqual(len(collapsed), 1)
+        self.assertEqual(collapsed[0]['link'], 'https://theverge.com/b')
+        self.assertEqual([alt['link'] for alt in collapsed[0]['alternates']], ['https://techcrunch.com/a'])
+    
+    def test_cluster_is_processed_once(self):
+        """Test only one changed article per cluster is categorized"""
+        articles = [
+            article('https://techcrunch.com/a', 'Acme unveils foldable phone'),
+            article('https://theverge.com/b', 'Acme unveils foldable phone'),
+        ]
+        record = {'hash': 'x', 'keep': True, 'categories': ['Gadgets'], 'content_score': 0.5}
+        
+        with patch('app.services.feed_service._process_changed', return_value={'https://techcrunch.com/a': record}) as process:
+            records = _process_clustered(articles, {}, find_clusters(articles, max_distance=3))
+        
+        self.assertEqual(process.call_args[0][0], [articles[0]])
+        self.assertEqual(records['https://theverge.com/b']['categories'], ['Gadgets'])
+    
+    def test_cluster_followers_stored_with_categories(self):
+        """Test every article of a processed cluster is stored with the leader's categories"""
+        articles = [
+            article('https://techcrunch.com/a', 'Acme unveils foldable phone'),
+            article('https://theverge.com/b', 'Acme unveils foldable phone'),
+        ]
+        def process_changed(leaders):
+            leaders[0]['categories'] = ['Hardware', 'AI']
+            return {leaders[0]['link']: {'hash': 'x', 'keep': True, 'categories': ['Hardware', 'AI'], 'content_score': 0.5}}
+        
+        # Snapshot at call time; the articles are updated again after storing
+        stored = {}
+        def store_articles(kept, content_scores=None, source_jobs=None):
+            stored.update({a['link']: a.get('categories') for a in kept})
+            return True
+        
+        with patch('app.services.feed_service._process_changed', side_effect=process_changed), \
+                patch('app.services.feed_service.get_seen_entries', return_value={}), \
+                patch('app.services.feed_service.save_seen_entries'), \
+                patch('app.services.feed_service.get_source_registry'), \
+                patch('app.services.feed_service.store_articles', side_effect=store_articles):
+            process_articles(articles)
+        
+        self.assertEqual(stored, {
+            'https://techcrunch.com/a': ['Hardware', 'AI'],
+            'https://theverge.com/b': ['Hardware', 'AI'],
+        })
+
+if __name__ == '__main__':
+    unittest.main()
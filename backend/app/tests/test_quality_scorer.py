@@ -0,0 +1,59 @@
+import random
+import unittest
+from unittest.mock import patch
+from app.utils.quality_scorer import (
+    calculate_quality_score, calculate_freshness_score, batch_freshness_scores,
+    score_articles, filter_by_quality
+)
+
+NOW = 1704110400  # 2024-01-01T12:00:00Z
+HOUR = 3600
+DAY = 24 * HOUR
+
+class TestBatchQualityScoring(unittest.TestCase):
+    """Test vectorized quality scoring matches per-article scoring"""
+    
+    def test_freshness_buckets_match(self):
+        """Test batch freshness agrees with the scalar score at every bucket edge"""
+        ages = [None, -1, 0, 6 * HOUR - 1, 6 * HOUR, DAY, 3 * DAY, 7 * DAY - 1, 7 * DAY, 30 * DAY, 400 * DAY]
+        published = [None if age is None else NOW - age for age in ages]
+        
+        expected = [calculate_freshness_score(ts, now=NOW) for ts in published]
+        self.assertEqual(batch_freshness_scores(published, now=NOW).tolist(), expected)
+    
+    def test_snapshot_scores_match(self):
+        """Test score_articles gives the same scores as calculate_quality_score"""
+        rng = random.Random(7)
+        titles = ['', 'Short', 'A perfectly ordinary headline about databases', 'YOU WON\'T BELIEVE THIS NEW GADGET',
+                  'Buy now!!! limited time offer on laptops', 'x' * 250, 'This is why Rust keeps growing']
+        summaries = ['', 'Too short', 'A longer summary describing what happened in reasonable detail for readers.']
+        
+        articles = []
+        for i in range(300):
+            ts = rng.choice([None, NOW - rng.randint(-HOUR, 60 * DAY)])
+            articles.append({
+                'link': f'https://example.com/{i}',
+                'title': rng.choice(titles),
+                'summary': rng.choice(summaries),
+                'published_ts': ts,
+            })
+        stored = {articles[i]['link']: 0.55 for i in range(0, 300, 3)}
+        
+        with patch('app.utils.quality_scorer.time.time', return_value=NOW):
+            expected = [calculate_quality_score(article, content_score=stored.get(article['link'])) for article in articles]
+            
+            self.assertEqual(score_articles(articles, content_scores=stored), expected)
+    
+    def test_filter_by_quality_sorts_and_filters(self):
+        """Test low scores are dropped and the rest sorted best first"""
+        articles = [
+            {'link': 'a', 'title': 'A perfectly ordinary headline', 'summary': 'x' * 60, 'published_ts': None},
+            {'link': 'b', 'title': 'A perfectly ordinary headline', 'summary': 'x' * 60, 'published_ts': None},
+        ]
+        scored = filter_by_quality(articles, min_score=0.5, content_scores={'a': 0.0, 'b': 1.0})
+        
+        self.assertEqual([article['link'] for article in scored], ['b'])
+        self.assertEqual(scored[0]['quality_score'], 0.71)
+
+if __name__ == '__main__':
+    unittest.main()
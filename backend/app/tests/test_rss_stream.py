@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+from app.utils.fetch_engine import RawPayload
+from app.utils.rss_parser import stream_feed, parse_feed, parse_feed_bytes
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+<title>Example Blog: notes</title>
+<link>https://example.com</link>
+<item>
+<title>First &amp; best</title>
+<link>https://example.com/1</link>
+<description>&lt;p&gt;One. Two. Three.&lt;/p&gt;</description>
+<pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
+</item>
+<item>
+<title>Content only</title>
+<link>https://example.com/2</link>
+<content:encoded><![CDATA[<figure><img src="a.png"></figure><p>Body here. More.</p>]]></content:encoded>
+<pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate>
+</item>
+</channel>
+</rss>"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Atom Example</title>
+<entry>
+<title>Atom post</title>
+<link rel="self" href="https://example.com/self"/>
+<link rel="alternate" href="https://example.com/atom-post"/>
+<content type="html">&lt;p&gt;Full text.&lt;/p&gt;</content>
+<summary>Short text.</summary>
+<updated>2024-01-03T10:00:00Z</updated>
+</entry>
+</feed>"""
+
+def payload(content):
+    return RawPayload('https://example.com/feed', 200, content, {'Content-Type': 'application/xml'})
+
+class TestStreamFeed(unittest.TestCase):
+    """Test the streaming feed parser fast path"""
+    
+    def test_matches_feedparser_for_rss(self):
+        """Test the fast path produces the same articles as feedparser"""
+        streamed = parse_feed('https://example.com/feed', payload(RSS_FEED))
+        with patch('app.utils.rss_parser.stream_feed', return_value=None):
+            parsed = parse_feed('https://example.com/feed', payload(RSS_FEED))
+        
+        self.assertEqual(streamed, parsed)
+        self.assertEqual(streamed[0]['source'], 'Example Blog')
+        self.assertEqual(streamed[1]['summary'], 'Body here. More.')
+    
+    def test_atom_links_and_summary(self):
+        """Test Atom entries use the alternate link and prefer the summary"""
+        title, entries = stream_feed(ATOM_FEED)
+        
+        self.assertEqual(title, 'Atom Example')
+        self.assertEqual(entries[0]['link'], 'https://example.com/atom-post')
+        self.assertEqual(entries[0]['summary'], 'Short text.')
+        self.assertEqual(entries[0]['updated'], parse_feed_bytes(ATOM_FEED).entries[0]['updated'])
+    
+    def test_malformed_feed_falls_back(self):
+        """Test malformed or non RSS/Atom bodies are left to feedparser"""
+        self.assertIsNone(stream_feed(b'<rss><channel><item>&nbsp;</item></channel></rss>'))
+        self.assertIsNone(stream_feed(b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>'))
+        
+        articles = parse_feed('https://example.com/feed', payload(b'<rss><channel><title>T</title><item><title>Loose &nbsp;</title></item></channel></rss>'))
+        self.assertEqual(len(articles), 1)
+    
+    def test_entry_html_is_capped(self):
+        """Test entry HTML is cut to the budget without a partial tag"""
+        body = RSS_FEED.replace(b'One. Two. Three.', b'x' * 50 + b'&lt;a href="y"&gt;')
+        with patch('app.utils.rss_parser.Config.FEED_SUMMARY_BUDGET', 60):
+            _, entries = stream_feed(body)
+        
+        self.assertEqual(entries[0]['summary'], '<p>' + 'x' * 50)
+    
+    def test_body_is_capped(self):
+        """Test only FEED_MAX_BYTES of the body are parsed"""
+        with patch('app.utils.rss_parser.Config.FEED_MAX_BYTES', RSS_FEED.index(b'<item>', 300)):
+            _, entries = stream_feed(RSS_FEED)
+        
+        self.assertEqual([entry['title'] for entry in entries], ['First & best'])
+    
+    def test_permalink_guid_stands_in_for_link(self):
+        """Test a permalink guid is used as the link, as feedparser does"""
+        body = RSS_FEED.replace(
+            b'<link>https://example.com/1</link>', b'<guid isPermaLink="true">https://example.com/guid-1</guid>'
+        ).replace(
+            b'<link>https://example.com/2</link>', b'<guid isPermaLink="false">tag:example.com,2024:2</guid>'
+        )
+        _, entries = stream_feed(body)
+        
+        self.assertEqual([entry.get('link', '') for entry in entries], [entry.get('link', '') for entry in parse_feed_bytes(body).entries])
+        self.assertEqual(entries[0]['link'], 'https://example.com/guid-1')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from app.utils.seen_entries import entry_hash, split_changed
+
+class TestSeenEntries(unittest.TestCase):
+    """Test incremental processing of seen entries"""
+    
+    def setUp(self):
+        self.article = {'link': 'https://example.com/a', 'title': 'Python 3.13 released', 'summary': 'New features'}
+    
+    def test_hash_ignores_non_content_fields(self):
+        """Test the hash only changes with title or summary"""
+        moved = dict(self.article, source='Other', published='2024-01-01T00:00:00')
+        self.assertEqual(entry_hash(self.article), entry_hash(moved))
+        self.assertNotEqual(entry_hash(self.article), entry_hash(dict(self.article, title='Python 3.14 released')))
+    
+    def test_split_changed(self):
+        """Test unseen and edited entries are reprocessed, unchanged ones are not"""
+        edited = {'link': 'https://example.com/b', 'title': 'Edited title', 'summary': ''}
+        unseen = {'link': 'https://example.com/c', 'title': 'Brand new', 'summary': ''}
+        seen = {
+            self.article['link']: {'hash': entry_hash(self.article)},
+            edited['link']: {'hash': 'stale'}
+        }
+        
+        changed, unchanged = split_changed([self.article, edited, unseen], seen)
+        
+        self.assertEqual(changed, [edited, unseen])
+        self.assertEqual(unchanged, [self.article])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+from app.utils.source_registry import SourceRegistry, SourceEntry
+from app.utils.personalization import filter_by_user_preferences
+from app.utils.quality_scorer import score_articles
+
+def entry(name, url_host, tier='standard', tags=(), is_active=True, success_rate=1.0, key=None):
+    return SourceEntry(name, url_host, 'rss', tier, tuple(tags), None, is_active, success_rate, key)
+
+class TestSourceRegistry(unittest.TestCase):
+    """Test Source registry lookups"""
+    
+    def setUp(self):
+        self.registry = SourceRegistry([
+            entry('TechCrunch', 'techcrunch.com', 'premium', tags=['1', '2']),
+            entry('r/python', 'reddit.com', 'community', tags=['1'], success_rate=0.9),
+            entry('r/golang', 'reddit.com', 'standard', tags=['3']),
+            entry('Old Blog', 'old.example.com', 'premium', tags=['1'], is_active=False),
+            # Synced from config: named after the feed URL, served from a feed host
+            entry('feeds.example.com/news', 'feeds.example.com', 'premium', key='rss:https://feeds.example.com/news'),
+        ])
+    
+    def test_lookup_by_name_then_host(self):
+        """Test articles resolve by source name, then by a host owned by one source"""
+        self.assertEqual(self.registry.tier_for({'source': 'r/Python', 'link': 'https://www.reddit.com/r/python/x'}), 'community')
+        self.assertEqual(self.registry.tier_for({'source': 'TC', 'link': 'https://www.techcrunch.com/2024/a'}), 'premium')
+        # reddit.com is shared, so an unknown name does not resolve by host
+        self.assertEqual(self.registry.tier_for({'source': 'r/rust', 'link': 'https://reddit.com/r/rust/x'}), 'standard')
+    
+    def test_config_feeds_resolve_by_fetch_key(self):
+        """Test articles from a config-synced feed resolve by the job they were fetched with"""
+        articles = [{'source': 'Example News', 'link': 'https://example.com/2024/story'}]
+        
+        self.assertEqual(self.registry.tiers_by_link(articles), {'https://example.com/2024/story': 'standard'})
+        self.assertEqual(
+            self.registry.tiers_by_link(articles, source_keys={'https://example.com/2024/story': 'rss:https://feeds.example.com/news'}),
+            {'https://example.com/2024/story': 'premium'}
+        )
+    
+    def test_sources_for_tags(self):
+        """Test recommendations rank active sources by tier, then reliability"""
+        names = [source.name for source in self.registry.sources_for_tags([1, 3])]
+        self.assertEqual(names, ['TechCrunch', 'r/golang', 'r/python'])
+    
+    def test_tiers_change_scores(self):
+        """Test per-article tiers feed the source component of quality scores"""
+        articles = [
+            {'link': 'https://techcrunch.com/a', 'source': 'TechCrunch', 'title': 'Same headline here', 'summary': ''},
+            {'link': 'https://unknown.example/a', 'source': 'Unknown', 'title': 'Same headline here', 'summary': ''},
+        ]
+        premium, standard = score_articles(articles, source_tiers=self.registry.tiers_by_link(articles))
+        self.assertAlmostEqual(premium - standard, 0.09, places=3)
+    
+    def test_personalization_matches_source_names(self):
+        """Test sources chosen by Source name match articles with a display name"""
+        articles = [
+            {'source': 'TechCrunch Daily', 'link': 'https://techcrunch.com/a'},
+            {'source': 'Hacker News', 'link': 'https://news.ycombinator.com/a'},
+        ]
+        with patch('app.utils.personalization.get_source_registry', return_value=self.registry):
+            self.assertEqual(len(filter_by_user_preferences(articles, feed_sources=['techcrunch'])), 1)
+            self.assertEqual(len(filter_by_user_preferences(articles, feed_sources=['TechCrunch'])), 1)
+
+if __name__ == '__main__':
+    unittest.main()
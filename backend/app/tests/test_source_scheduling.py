@@ -0,0 +1,40 @@
+import unittest
+from app.core.config import Config
+from app.services.source_service import compute_next_interval, next_fetch_delay, job_for_source, source_url_for_job
+from app.utils.fetch_engine import FetchJob
+
+class TestSourceScheduling(unittest.TestCase):
+    """Test adaptive per-source fetch intervals"""
+    
+    def test_interval_moves_towards_observed_rate(self):
+        """Test interval moves halfway towards seconds per new entry"""
+        self.assertEqual(compute_next_interval(3600, 1200, 1), 2400)
+    
+    def test_interval_backs_off_without_new_entries(self):
+        """Test interval grows when nothing new was found"""
+        self.assertEqual(compute_next_interval(1000, 1000, 0), 1500)
+    
+    def test_interval_is_clamped(self):
+        """Test interval stays within configured bounds"""
+        self.assertEqual(compute_next_interval(Config.SOURCE_MIN_INTERVAL, 10, 100), Config.SOURCE_MIN_INTERVAL)
+        self.assertEqual(compute_next_interval(Config.SOURCE_MAX_INTERVAL, 1000, 0), Config.SOURCE_MAX_INTERVAL)
+    
+    def test_first_fetch_keeps_interval(self):
+        """Test the interval is unchanged when there is no previous fetch"""
+        self.assertEqual(compute_next_interval(900, None, 10), 900)
+    
+    def test_delay_stretches_for_unreliable_sources(self):
+        """Test low success rates delay the next fetch"""
+        jitter = Config.SOURCE_INTERVAL_JITTER
+        delay = next_fetch_delay(600, success_rate=0.5)
+        self.assertGreaterEqual(delay, 1200 * (1 - jitter))
+        self.assertLessEqual(delay, 1200 * (1 + jitter))
+    
+    def test_job_round_trips_through_source_url(self):
+        """Test config jobs map back from their Source row URLs"""
+        for job in [FetchJob('rss', 'https://example.com/feed'), FetchJob('reddit', 'python'), FetchJob('youtube', 'UC123')]:
+            source = type('Source', (), {'type': job.kind, 'url': source_url_for_job(job)})()
+            self.assertEqual(job_for_source(source), job)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+from app.core.cache import VersionedLocalCache
+from app.utils import tag_catalog
+from app.utils.tag_matcher import add_tags_to_articles
+
+class CountingSession:
+    """Minimal session returning fixed tag rows and counting queries"""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+    
+    def query(self, *columns):
+        self.queries += 1
+        return self
+    
+    def all(self):
+        return self.rows
+
+class TestTagCatalog(unittest.TestCase):
+    """Test the versioned tag catalog cache"""
+    
+    def test_versioned_cache_reloads_on_invalidate(self):
+        """Test the value is reused between checks and rebuilt after invalidation"""
+        loads = []
+        cache = VersionedLocalCache('test:version', load=lambda: loads.append(1) or len(loads), empty=lambda: 0, check_interval=60)
+        
+        self.assertEqual(cache.get(), 1)
+        self.assertEqual(cache.get(), 1)
+        cache.invalidate()
+        self.assertEqual(cache.get(), 2)
+    
+    def test_unset_version_loads_once(self):
+        """Test a version key nobody has bumped yet does not force reloads"""
+        db = CountingSession([('Python', 1)])
+        catalog = VersionedLocalCache('test:tags', load=tag_catalog._load_catalog, empty=lambda: tag_catalog.TagCatalog({}), check_interval=0)
+        
+        with patch('app.core.cache.cache_get', return_value=None), patch.object(tag_catalog, '_catalog', catalog):
+            for _ in range(3):
+                tag_catalog.get_tag_catalog(db)
+        
+        self.assertEqual(db.queries, 1)
+    
+    def test_failed_first_load_retries(self):
+        """Test a failed load serves the empty value and is retried on the next check"""
+        def load():
+            raise RuntimeError('database down')
+        cache = VersionedLocalCache('test:version', load=load, empty=dict, check_interval=0)
+        
+        self.assertEqual(cache.get(), {})
+        cache._load = lambda: {'ok': True}
+        self.assertEqual(cache.get(), {'ok': True})
+    
+    def test_tagging_queries_tags_once(self):
+        """Test tagging many batches loads the tags table only once"""
+        db = CountingSession([('Python', 1), ('Rust', 2)])
+        catalog = VersionedLocalCache('test:tags', load=tag_catalog._load_catalog, empty=lambda: tag_catalog.TagCatalog({}), check_interval=60)
+        
+        with patch.object(tag_catalog, '_catalog', catalog):
+            for _ in range(3):
+                articles = add_tags_to_articles([{'title': 'Python and Rust in production', 'summary': ''}], db)
+        
+        self.assertEqual(db.queries, 1)
+        self.assertEqual({tag['name'] for tag in articles[0]['tags']}, {'Python', 'Rust'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from app.utils.url_canonical import canonicalize_url, canonicalize_links
+from app.utils.feed_aggregator import deduplicate_articles
+
+class TestUrlCanonical(unittest.TestCase):
+    """Test article URL canonicalization"""
+    
+    def test_host_scheme_port_and_fragment(self):
+        """Test case, default ports and fragments are normalized"""
+        self.assertEqual(canonicalize_url('HTTPS://Example.COM:443/Post#comments'), 'https://example.com/Post')
+        self.assertEqual(canonicalize_url('http://example.com:8080/post'), 'http://example.com:8080/post')
+    
+    def test_tracking_params_removed_and_sorted(self):
+        """Test tracking parameters are dropped and the rest sorted"""
+        self.assertEqual(
+            canonicalize_url('https://example.com/post?utm_source=rss&b=2&fbclid=x&a=1'),
+            'https://example.com/post?a=1&b=2'
+        )
+    
+    def test_trailing_slash_and_amp(self):
+        """Test trailing slashes and AMP variants map to the canonical page"""
+        canonical = 'https://example.com/2024/story'
+        for url in ['https://example.com/2024/story/', 'https://example.com/2024/story/amp/', 'https://example.com/2024/story?amp=1', 'https://example.com/2024/story?outputType=amp']:
+            self.assertEqual(canonicalize_url(url), canonical)
+        self.assertEqual(canonicalize_url('https://example.com/story.amp.html'), 'https://example.com/story.html')
+        self.assertEqual(canonicalize_url('https://example.com'), 'https://example.com/')
+    
+    def test_non_http_values_unchanged(self):
+        """Test values that are not HTTP URLs are only stripped"""
+        self.assertEqual(canonicalize_url(' mailto:a@b.com '), 'mailto:a@b.com')
+        self.assertEqual(canonicalize_url(''), '')
+        self.assertIsNone(canonicalize_url(None))
+    
+    def test_variants_deduplicate(self):
+        """Test link variants collapse to one article after canonicalization"""
+        articles = canonicalize_links([
+            {'link': 'https://Example.com/post/?utm_medium=social'},
+            {'link': 'https://example.com/post'},
+        ])
+        self.assertEqual(len(deduplicate_articles(articles)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
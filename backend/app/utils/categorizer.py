@@ -1,4 +1,5 @@
 """Auto-categorize articles based on keywords"""
+from app.utils.keyword_matcher import get_keyword_matcher
 
 CATEGORIES = {
     'AI': ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural network', 'gpt', 'llm', 'chatgpt', 'openai', 'generative ai', 'transformer', 'nlp', 'computer vision', 'anthropic', 'claude', 'gemini', 'copilot', 'midjourney', 'stable diffusion'],
@@ -26,23 +27,19 @@ def categorize_article(title, summary=''):
     Returns:
         List of matching categories (primary first)
     """
-    title_lower = title.lower()
-    summary_lower = summary.lower()
+    matcher = get_keyword_matcher()
+    title_hits = matcher.scan(title.lower())
+    summary_hits = matcher.scan(summary.lower())
     
-    category_scores = {}
+    scores = {}
+    for keyword in title_hits.keys() | summary_hits.keys():
+        # Title matches worth more, summary matches only count without one
+        points = 3 if keyword in title_hits else 1
+        for category in matcher.labels[keyword].get('category', ()):
+            scores[category] = scores.get(category, 0) + points
     
-    for category, keywords in CATEGORIES.items():
-        score = 0
-        for keyword in keywords:
-            # Title matches worth more
-            if keyword in title_lower:
-                score += 3
-            # Summary matches
-            elif keyword in summary_lower:
-                score += 1
-        
-        if score > 0:
-            category_scores[category] = score
+    # Keep CATEGORIES order so ties rank as before
+    category_scores = {category: scores[category] for category in CATEGORIES if category in scores}
     
     # Sort by score, return top categories
     if category_scores:
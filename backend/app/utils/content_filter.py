@@ -1,6 +1,9 @@
 """Content filtering utilities to remove unwanted articles"""
 import re
+import threading
+from collections import Counter
 from typing import List, Dict
+from app.utils.language_id import detect_languages
 
 # Explicit content keywords to filter out
 EXPLICIT_KEYWORDS = [
@@ -8,7 +11,7 @@ EXPLICIT_KEYWORDS = [
     'sexual', 'sexy', 'dating', 'hookup', 'escort', 'webcam'
 ]
 
-# Non-English language patterns (common words/characters)
+# Non-Latin script ranges (any character from these marks text as non-English)
 NON_ENGLISH_PATTERNS = [
     # Greek
     r'[\u0370-\u03FF]',
@@ -26,19 +29,27 @@ NON_ENGLISH_PATTERNS = [
     r'[\u0900-\u097F]',
 ]
 
-# Common non-English words (Spanish, Portuguese, French, German, etc.)
-NON_ENGLISH_WORDS = [
-    # Spanish/Portuguese
-    'de', 'la', 'el', 'los', 'las', 'una', 'para', 'con', 'por', 'como', 'que', 'más',
-    'computación', 'nube', 'está', 'transformando', 'mundo', 'visão', 'faça', 'casa',
-    'maneiras', 'extrair', 'requisitos', 'claros', 'stakeholders', 'indecisos',
-    # French
-    'le', 'les', 'une', 'des', 'dans', 'sur', 'avec', 'pour', 'est', 'sont',
-    # German
-    'der', 'die', 'das', 'und', 'ist', 'sind', 'mit', 'für', 'von', 'zu',
-    # Italian
-    'il', 'lo', 'gli', 'della', 'degli', 'delle', 'alla', 'agli', 'alle',
-]
+# Rules are compiled once: one regex pass splits text into Latin words and
+# non-Latin script characters; Latin text then goes to the language model
+_SCRIPT_RANGES = ''.join(pattern[1:-1] for pattern in NON_ENGLISH_PATTERNS)
+_SCAN_RE = re.compile(rf'(?P<script>[{_SCRIPT_RANGES}])|(?P<word>[^\W{_SCRIPT_RANGES}]+)')
+_EXPLICIT_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, EXPLICIT_KEYWORDS)) + r')\b')
+_EXPLICIT_SET = frozenset(EXPLICIT_KEYWORDS)
+
+# Rejected articles per rule since startup
+_rule_hits = Counter()
+_rule_hits_lock = threading.Lock()
+
+def _scan(text):
+    """Split lowercased text into Latin words, noting any non-Latin script"""
+    has_script = False
+    words = []
+    for match in _SCAN_RE.finditer(text.lower()):
+        if match.lastgroup == 'script':
+            has_script = True
+        else:
+            words.append(match.group())
+    return has_script, words
 
 def contains_explicit_content(text: str) -> bool:
     """
@@ -50,14 +61,7 @@ def contains_explicit_content(text: str) -> bool:
     Returns:
         True if explicit content detected
     """
-    text_lower = text.lower()
-    
-    # Check for explicit keywords
-    for keyword in EXPLICIT_KEYWORDS:
-        if re.search(r'\b' + keyword + r'\b', text_lower):
-            return True
-    
-    return False
+    return _EXPLICIT_RE.search(text.lower()) is not None
 
 def is_non_english(text: str) -> bool:
     """
@@ -69,36 +73,56 @@ def is_non_english(text: str) -> bool:
     Returns:
         True if text appears to be non-English
     """
-    # Check for non-Latin scripts
-    for pattern in NON_ENGLISH_PATTERNS:
-        if re.search(pattern, text):
-            return True
-    
-    # Check for common non-English words
-    # Split text into words and check if many are non-English
-    words = re.findall(r'\b\w+\b', text.lower())
-    if len(words) < 3:
-        return False  # Too short to determine
-    
-    non_english_count = sum(1 for word in words if word in NON_ENGLISH_WORDS)
-    
-    # If more than 30% of words are non-English, flag it
-    if len(words) > 0 and (non_english_count / len(words)) > 0.3:
-        return True
-    
-    # Check for Spanish/Portuguese specific patterns
-    spanish_portuguese_patterns = [
-        r'ción\b',  # -ción ending (Spanish)
-        r'ão\b',    # -ão ending (Portuguese)
-        r'ões\b',   # -ões ending (Portuguese)
-        r'á|é|í|ó|ú|ã|õ',  # Accented characters common in Spanish/Portuguese
-    ]
-    
-    accent_count = sum(1 for pattern in spanish_portuguese_patterns if re.search(pattern, text.lower()))
-    if accent_count >= 2:
-        return True
-    
-    return False
+    has_script, _ = _scan(text)
+    return has_script or detect_languages([text])[0] not in (None, 'en')
+    
+def rejection_rules(articles: List[Dict]) -> List:
+    """
+    Get the first filter rule each article breaks
+    
+    Explicit keywords and non-Latin scripts come from one scan per article;
+    the remaining articles are language-scored together in one batch.
+    
+    Args:
+        articles: List of article dictionaries with title and summary
+    
+    Returns:
+        List with 'explicit', 'non_latin_script', 'non_english' or None (kept)
+        per article
+    """
+    rules = [None] * len(articles)
+    pending = []
+    texts = []
+    
+    for position, article in enumerate(articles):
+        text = f"{article.get('title', '')} {article.get('summary', '')}"
+        has_script, words = _scan(text)
+        if not _EXPLICIT_SET.isdisjoint(words):
+            rules[position] = 'explicit'
+        elif has_script:
+            rules[position] = 'non_latin_script'
+        else:
+            pending.append(position)
+            texts.append(text)
+    
+    for position, language in zip(pending, detect_languages(texts)):
+        if language not in (None, 'en'):
+            rules[position] = 'non_english'
+    
+    return rules
+
+def rejection_rule(article: Dict):
+    """
+    Get the first filter rule an article breaks
+    
+    Args:
+        article: Article dictionary with title and summary
+    
+    Returns:
+        'explicit', 'non_latin_script', 'non_english' or None if the article
+        is kept
+    """
+    return rejection_rules([article])[0]
 
 def should_filter_article(article: Dict) -> bool:
     """
@@ -110,24 +134,15 @@ def should_filter_article(article: Dict) -> bool:
     Returns:
         True if article should be filtered out
     """
-    title = article.get('title', '')
-    summary = article.get('summary', '')
-    combined_text = f"{title} {summary}"
-    
-    # Filter explicit content
-    if contains_explicit_content(combined_text):
-        return True
-    
-    # Filter non-English content
-    if is_non_english(combined_text):
-        return True
-    
-    return False
+    return rejection_rule(article) is not None
 
 def filter_articles(articles: List[Dict]) -> List[Dict]:
     """
     Filter out unwanted articles from a list
     
+    Rejections are counted per rule (see get_filter_stats) instead of
+    being logged one by one.
+    
     Args:
         articles: List of article dictionaries
         
@@ -135,18 +150,26 @@ def filter_articles(articles: List[Dict]) -> List[Dict]:
         Filtered list of articles
     """
     filtered = []
-    filtered_count = 0
-    
-    for article in articles:
-        if should_filter_article(article):
-            filtered_count += 1
-            # Log what was filtered (for debugging)
-            title = article.get('title', 'No title')
-            print(f"Filtered: {title[:50]}...")
+    hits = Counter()
+    
+    for article, rule in zip(articles, rejection_rules(articles)):
+        if rule:
+            hits[rule] += 1
         else:
             filtered.append(article)
     
-    if filtered_count > 0:
-        print(f"Filtered out {filtered_count} articles (explicit/non-English content)")
+    if hits:
+        with _rule_hits_lock:
+            _rule_hits.update(hits)
     
     return filtered
+
+def get_filter_stats() -> Dict[str, int]:
+    """Get the number of articles rejected by each rule since startup"""
+    with _rule_hits_lock:
+        return dict(_rule_hits)
+
+def reset_filter_stats():
+    """Clear the per-rule rejection counters"""
+    with _rule_hits_lock:
+        _rule_hits.clear()
@@ -0,0 +1,83 @@
+"""Published date normalization to epoch seconds"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from dateutil import parser
+
+# Distinct date strings remembered by parse_timestamp (feeds repeat them every crawl)
+PARSE_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_timestamp(value):
+    """
+    Parse a date string into epoch seconds
+    
+    ISO 8601 and RFC 822 (the formats feeds use) take a fast path, anything
+    else goes through dateutil. Dates without a timezone are taken as UTC.
+    
+    Args:
+        value: Date string as reported by a source
+    
+    Returns:
+        Integer epoch seconds, or None if missing or unparseable
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = None
+    
+    if parsed is None and value[:1].isalpha():
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (ValueError, TypeError, IndexError):
+            parsed = None
+    
+    if parsed is None:
+        try:
+            parsed = parser.parse(value)
+        except (ValueError, OverflowError, TypeError):
+            return None
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    
+    try:
+        return int(parsed.timestamp())
+    except (ValueError, OverflowError, OSError):
+        return None
+
+def article_timestamp(article):
+    """
+    Get an article's published time in epoch seconds
+    
+    Uses the published_ts stamped at ingest and only parses 'published' for
+    articles that were never stamped.
+    
+    Args:
+        article: Article dict
+    
+    Returns:
+        Integer epoch seconds, or None if the article has no usable date
+    """
+    if 'published_ts' in article:
+        return article['published_ts']
+    return parse_timestamp(article.get('published'))
+
+def stamp_published_ts(articles):
+    """
+    Store the parsed published time on each article as published_ts
+    
+    Args:
+        articles: List of article dicts (modified in place)
+    
+    Returns:
+        The same list
+    """
+    for article in articles:
+        if 'published_ts' not in article:
+            article['published_ts'] = parse_timestamp(article.get('published'))
+    return articles
@@ -1,4 +1,11 @@
-from datetime import datetime
+import heapq
+from itertools import islice
+from app.utils.dates import article_timestamp
+
+def _date_key(article):
+    # Undated articles sort last
+    timestamp = article_timestamp(article)
+    return timestamp if timestamp is not None else float('-inf')
 
 def deduplicate_articles(articles):
     """
@@ -31,17 +38,52 @@ def sort_by_date(articles):
     Returns:
         Sorted list of articles
     """
-    def get_date(article):
-        published = article.get('published', '')
-        if not published:
-            return datetime.min.replace(tzinfo=None)
-        try:
-            dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-            return dt.replace(tzinfo=None)
-        except Exception:
-            return datetime.min.replace(tzinfo=None)
+    return sorted(articles, key=_date_key, reverse=True)
+    
+def merge_by_date(articles, limit=None):
+    """
+    Order articles newest first by merging the date-ordered runs they contain
+    
+    Sources return entries mostly newest first, so the combined list is a
+    few sorted runs. A heap merges those runs in O(n log k) for k runs and
+    stops as soon as limit articles have been produced. Ties keep their
+    input order, matching sort_by_date.
+    
+    Args:
+        articles: List of articles (typically sources concatenated)
+        limit: Maximum number of articles to return
+    
+    Returns:
+        Articles newest first
+    """
+    runs = []
+    run = []
+    previous = None
+    for article in articles:
+        key = _date_key(article)
+        if run and key > previous:
+            runs.append(run)
+            run = []
+        run.append(article)
+        previous = key
+    if run:
+        runs.append(run)
     
-    return sorted(articles, key=get_date, reverse=True)
+    merged = heapq.merge(*runs, key=_date_key, reverse=True)
+    return list(islice(merged, limit) if limit else merged)
+
+def top_by_date(articles, k):
+    """
+    Get the k newest articles without sorting the rest
+    
+    Args:
+        articles: List of articles
+        k: Number of articles to return
+    
+    Returns:
+        Up to k articles, newest first
+    """
+    return heapq.nlargest(k, articles, key=_date_key)
 
 def aggregate_feeds(all_articles, unused_param=None, source_filter=None, limit=None):
     """
@@ -63,11 +105,5 @@ def aggregate_feeds(all_articles, unused_param=None, source_filter=None, limit=N
     # Deduplicate
     all_articles = deduplicate_articles(all_articles)
     
-    # Sort by date
-    all_articles = sort_by_date(all_articles)
-    
-    # Apply limit
-    if limit:
-        all_articles = all_articles[:limit]
-    
-    return all_articles
+    # Merge the per-source date order, stopping once limit articles are out
+    return merge_by_date(all_articles, limit)
@@ -0,0 +1,86 @@
+"""Content-addressed archive of raw fetched source bodies
+
+Bodies are stored gzip-compressed under FEED_ARCHIVE_DIR by SHA-256, and
+every new body per source is listed in index.jsonl so the archive doubles as
+a replay corpus for offline parser benchmarks. Archiving is off unless
+FEED_ARCHIVE_DIR is set, and the archive is never pruned.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from app.core.config import Config
+
+ARCHIVE_INDEX = 'index.jsonl'
+
+_index_lock = threading.Lock()
+
+def body_hash(content):
+    """SHA-256 hex digest of a fetched body"""
+    return hashlib.sha256(content).hexdigest()
+
+def archive_path(digest):
+    """Path of an archived body"""
+    return os.path.join(Config.FEED_ARCHIVE_DIR, digest[:2], f'{digest}.gz')
+
+def archive_body(kind, target, payload):
+    """
+    Store a fetched body and record it in the archive index
+    
+    Args:
+        kind: Source kind
+        target: Job target
+        payload: RawPayload with body_hash set
+    
+    Returns:
+        True if archived (False when the archive is disabled)
+    """
+    if not Config.FEED_ARCHIVE_DIR:
+        return False
+    
+    path = archive_path(payload.body_hash)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so readers never see a partial file
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(payload.content)
+        os.replace(tmp_path, path)
+    
+    record = {
+        'kind': kind,
+        'target': target,
+        'url': payload.url,
+        'hash': payload.body_hash,
+        'content_type': payload.headers.get('Content-Type', ''),
+        'fetched_at': int(time.time())
+    }
+    with _index_lock:
+        with open(os.path.join(Config.FEED_ARCHIVE_DIR, ARCHIVE_INDEX), 'a') as f:
+            f.write(json.dumps(record) + '\n')
+    
+    return True
+
+def load_body(digest):
+    """Read an archived body by its hash"""
+    with gzip.open(archive_path(digest), 'rb') as f:
+        return f.read()
+
+def iter_archive():
+    """
+    Iterate over archived fetches, oldest first
+    
+    Yields:
+        Index records with 'kind', 'target', 'url', 'hash', 'content_type'
+        and 'fetched_at'
+    """
+    index_path = os.path.join(Config.FEED_ARCHIVE_DIR, ARCHIVE_INDEX)
+    if not os.path.exists(index_path):
+        return
+    
+    with open(index_path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -173,18 +173,12 @@ def get_recommended_sources_for_tags(tag_ids, db):
     Returns:
         List of source names
     """
-    from app.models.source import Source
+    from app.utils.source_registry import get_source_registry
     
     if not tag_ids:
         return []
     
     # Find sources that have overlapping tags
-    sources = db.query(Source).filter(
-        Source.is_active,
-        Source.tags.overlap(tag_ids)
-    ).order_by(
-        Source.quality_tier.desc(),
-        Source.success_rate.desc()
-    ).limit(20).all()
+    sources = get_source_registry(db).sources_for_tags(tag_ids, limit=20)
     
     return [source.name for source in sources]
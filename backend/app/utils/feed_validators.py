@@ -0,0 +1,66 @@
+"""Persistent HTTP validator store for conditional feed fetching and parse skipping"""
+from app.core.cache import cache_get, cache_set
+from app.core.config import Config
+
+VALIDATOR_KEY_PREFIX = 'feed_validators'
+
+def _validator_key(url):
+    return f'{VALIDATOR_KEY_PREFIX}:{url}'
+
+def get_feed_validators(url):
+    """
+    Get stored validators and last parsed articles for a feed URL
+    
+    Args:
+        url: Feed URL
+    
+    Returns:
+        Dict with 'etag', 'modified', 'body_hash' and 'articles', or None if unknown
+    """
+    return cache_get(_validator_key(url))
+
+def save_feed_validators(url, etag=None, modified=None, articles=None, body_hash=None):
+    """
+    Store validators and parsed articles from a successful fetch
+    
+    Args:
+        url: Feed URL
+        etag: ETag header returned by the server
+        modified: Last-Modified header returned by the server
+        articles: Normalized articles parsed from the response
+        body_hash: SHA-256 of the response body
+    
+    Returns:
+        True if stored
+    """
+    # Without a validator or body hash the stored articles can never be reused
+    if not etag and not modified and not body_hash:
+        return False
+    
+    return cache_set(_validator_key(url), {
+        'etag': etag,
+        'modified': modified,
+        'body_hash': body_hash,
+        'articles': articles or []
+    }, ttl=Config.FEED_VALIDATOR_TTL)
+
+def conditional_headers(validators):
+    """
+    Build conditional request headers from stored validators
+    
+    Args:
+        validators: Dict returned by get_feed_validators (or None)
+    
+    Returns:
+        Dict of If-None-Match / If-Modified-Since headers
+    """
+    headers = {}
+    if not validators:
+        return headers
+    
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('modified'):
+        headers['If-Modified-Since'] = validators['modified']
+    
+    return headers
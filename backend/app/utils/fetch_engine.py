@@ -0,0 +1,461 @@
+"""Async ingestion engine that fetches every content source concurrently
+
+Fetching is split into two stages: I/O threads download raw bytes and a
+process pool parses and normalizes them into articles, so CPU-bound parsing
+does not share the GIL with the network workers.
+"""
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures.process import BrokenProcessPool
+from app.core.cache import cache_get, cache_set
+from app.core.config import Config
+from app.utils.dates import stamp_published_ts
+from app.utils.url_canonical import canonicalize_links
+from app.utils.feed_archive import body_hash, archive_body
+from app.utils.feed_validators import get_feed_validators, save_feed_validators, conditional_headers
+from app.utils.http_client import fetch_url
+
+logger = logging.getLogger(__name__)
+
+# A single source to fetch: kind is 'rss', 'scrape', 'reddit' or 'youtube',
+# target is the feed URL, page URL, subreddit name or channel ID
+FetchJob = namedtuple('FetchJob', ['kind', 'target'])
+
+# Downloaded response handed to a parse worker; headers holds Content-Type,
+# ETag and Last-Modified, body_hash the SHA-256 of content
+RawPayload = namedtuple('RawPayload', ['url', 'status', 'content', 'headers', 'body_hash'], defaults=[None])
+
+# How a source kind is fetched: url_for(target) gives the URL to download
+# (None to skip), parse(target, payload) normalizes it into articles and
+# conditional sends stored ETag/Last-Modified validators with the request
+SourceSpec = namedtuple('SourceSpec', ['url_for', 'parse', 'conditional'])
+
+LATE_SOURCES_KEY = 'crawl:late_sources'
+
+# Shared worker pool so the concurrency limit is global across crawls
+_executor = None
+_executor_lock = threading.Lock()
+
+# Shared parse process pool (None until first use)
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+def get_executor():
+    """Get the shared fetch worker pool (sized by FETCH_CONCURRENCY)"""
+    global _executor
+    
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=Config.FETCH_CONCURRENCY,
+                    thread_name_prefix='fetch'
+                )
+    
+    return _executor
+
+def get_parse_executor():
+    """
+    Get the shared parse process pool
+    
+    Returns:
+        ProcessPoolExecutor, or None when PARSE_WORKERS is 0 and parsing runs
+        inline on the fetch threads
+    """
+    global _parse_executor
+    
+    workers = Config.PARSE_WORKERS
+    if workers <= 0:
+        return None
+    
+    if _parse_executor is None:
+        with _parse_executor_lock:
+            if _parse_executor is None:
+                # spawn: forking a process that runs fetch/scheduler threads is unsafe
+                _parse_executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    
+    return _parse_executor
+
+def _reset_parse_executor():
+    """Drop a broken parse pool so the next batch starts a new one"""
+    global _parse_executor
+    
+    with _parse_executor_lock:
+        broken, _parse_executor = _parse_executor, None
+    if broken is not None:
+        broken.shutdown(wait=False, cancel_futures=True)
+
+def get_source_spec(kind):
+    """
+    Get how a job kind is downloaded and parsed
+    
+    Args:
+        kind: Source kind ('rss', 'scrape', 'reddit', 'youtube')
+    
+    Returns:
+        SourceSpec
+    """
+    # Imported lazily - the scrapers themselves run through this engine
+    from app.utils.rss_parser import parse_feed
+    from app.utils.scraper import website_url, parse_website
+    from app.utils.social_scrapers import subreddit_url, parse_subreddit, youtube_feed_url, parse_youtube_feed
+    
+    specs = {
+        'rss': SourceSpec(lambda target: target, parse_feed, True),
+        'scrape': SourceSpec(website_url, parse_website, False),
+        'reddit': SourceSpec(subreddit_url, parse_subreddit, True),
+        'youtube': SourceSpec(youtube_feed_url, parse_youtube_feed, True),
+    }
+    return specs[kind]
+
+def download_source(job):
+    """
+    Download a source (I/O stage)
+    
+    Args:
+        job: FetchJob
+    
+    Returns:
+        Tuple of (articles, payload): articles is set when nothing needs
+        parsing (unchanged since the last fetch or no site scraper), payload
+        holds the downloaded body otherwise
+    """
+    spec = get_source_spec(job.kind)
+    url = spec.url_for(job.target)
+    if url is None:
+        return [], None
+    
+    # Send stored validators so unchanged sources answer 304 Not Modified
+    validators = get_feed_validators(url)
+    headers = conditional_headers(validators) if spec.conditional else None
+    # RSS parsing never reads past FEED_MAX_BYTES, so stop downloading there
+    max_bytes = Config.FEED_MAX_BYTES if job.kind == 'rss' else None
+    response = fetch_url(url, headers=headers, max_bytes=max_bytes)
+    
+    # Reuse previously parsed entries when the source has not changed
+    if response.status_code == 304 and validators:
+        return validators.get('articles', []), None
+    
+    response.raise_for_status()
+    
+    # Many sources ignore validators but serve byte-identical bodies
+    digest = body_hash(response.content)
+    if validators and validators.get('body_hash') == digest:
+        return validators.get('articles', []), None
+    
+    payload = RawPayload(
+        url=response.url,
+        status=response.status_code,
+        content=response.content,
+        headers={name: response.headers.get(name, '') for name in ('Content-Type', 'ETag', 'Last-Modified')},
+        body_hash=digest
+    )
+    
+    try:
+        archive_body(job.kind, job.target, payload)
+    except OSError as e:
+        logger.warning(f'Could not archive body of {url}: {str(e)}')
+    
+    return None, payload
+
+def parse_source(kind, target, payload):
+    """
+    Parse a downloaded source into articles (CPU stage)
+    
+    Args:
+        kind: Source kind
+        target: Job target
+        payload: RawPayload from download_source
+    
+    Returns:
+        List of normalized articles with canonical links, each with its
+        published_ts
+    """
+    return stamp_published_ts(canonicalize_links(get_source_spec(kind).parse(target, payload)))
+
+def parse_batch(items):
+    """
+    Parse a batch of downloaded sources in a worker process
+    
+    Args:
+        items: List of (kind, target, payload)
+    
+    Returns:
+        List of article lists in the same order (None for failed sources)
+    """
+    results = []
+    for kind, target, payload in items:
+        try:
+            results.append(parse_source(kind, target, payload))
+        except Exception as e:
+            logger.warning(f'Error parsing {kind} source {target}: {str(e)}')
+            results.append(None)
+    return results
+
+def finish_source(job, payload, articles):
+    """Store validators, body hash and parsed articles so the next fetch can skip work"""
+    spec = get_source_spec(job.kind)
+    save_feed_validators(
+        spec.url_for(job.target),
+        payload.headers.get('ETag') if spec.conditional else None,
+        payload.headers.get('Last-Modified') if spec.conditional else None,
+        articles,
+        body_hash=payload.body_hash
+    )
+
+def fetch_source(job):
+    """
+    Download, parse and finish a single source on the calling thread
+    
+    Args:
+        job: FetchJob
+    
+    Returns:
+        List of normalized articles
+    """
+    articles, payload = download_source(job)
+    if payload is None:
+        return articles
+    
+    articles = parse_source(job.kind, job.target, payload)
+    finish_source(job, payload, articles)
+    return articles
+
+def build_fetch_jobs(rss_feeds=None, scrape_urls=None, subreddits=None, youtube_channels=None):
+    """
+    Build fetch jobs for all configured sources
+    
+    Args:
+        rss_feeds: List of RSS feed URLs
+        scrape_urls: List of URLs to scrape
+        subreddits: List of subreddit names
+        youtube_channels: List of YouTube channel IDs
+    
+    Returns:
+        List of FetchJob
+    """
+    jobs = []
+    jobs.extend(FetchJob('rss', url) for url in rss_feeds or [])
+    jobs.extend(FetchJob('scrape', url) for url in scrape_urls or [])
+    jobs.extend(FetchJob('reddit', sub) for sub in subreddits or [])
+    jobs.extend(FetchJob('youtube', channel) for channel in youtube_channels or [])
+    return jobs
+
+def _download_job(job, parse_inline):
+    """
+    Download a job on an I/O thread, never raising
+    
+    Returns:
+        Tuple of (articles, payload still to parse, seconds taken, error
+        message or None)
+    """
+    start = time.monotonic()
+    error = None
+    try:
+        articles, payload = download_source(job)
+        if payload is not None and parse_inline:
+            articles = parse_source(job.kind, job.target, payload)
+            finish_source(job, payload, articles)
+            payload = None
+    except Exception as e:
+        logger.error(f'Error fetching {job.kind} source {job.target}: {str(e)}')
+        articles, payload, error = [], None, str(e)
+    return articles, payload, time.monotonic() - start, error
+
+def _finish_job(job, payload, articles):
+    """Finish a parsed job on an I/O thread, never raising"""
+    try:
+        finish_source(job, payload, articles)
+    except Exception as e:
+        logger.error(f'Error storing validators for {job.kind} source {job.target}: {str(e)}')
+
+class _ParseBatcher:
+    """Groups downloaded payloads into batches for the parse process pool"""
+    
+    def __init__(self, loop, executor):
+        self.loop = loop
+        self.executor = executor
+        self.pending = []
+        self.timer = None
+        self.tasks = set()
+    
+    def parse(self, job, payload):
+        """Queue a payload; returns a future resolving to its articles"""
+        future = self.loop.create_future()
+        self.pending.append((job, payload, future))
+        
+        if len(self.pending) >= Config.PARSE_BATCH_SIZE:
+            self.flush()
+        elif self.timer is None:
+            # Flush partial batches shortly so slow crawls do not stall parsing
+            self.timer = self.loop.call_later(Config.PARSE_BATCH_DELAY, self.flush)
+        
+        return future
+    
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        
+        items = [(job.kind, job.target, payload) for job, payload, _ in batch]
+        task = self.loop.run_in_executor(self.executor, parse_batch, items)
+        self.tasks.add(task)
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+    
+    def cancel(self):
+        """Stop waiting for queued and running batches"""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.pending = []
+        for task in self.tasks:
+            task.cancel()
+    
+    def _resolve(self, batch, task):
+        self.tasks.discard(task)
+        if task.cancelled():
+            results = [None for _ in batch]
+        elif task.exception() is not None:
+            logger.error(f'Parse batch of {len(batch)} sources failed: {str(task.exception())}')
+            if isinstance(task.exception(), BrokenProcessPool):
+                _reset_parse_executor()
+            results = [None for _ in batch]
+        else:
+            results = task.result()
+        
+        for (_, _, future), articles in zip(batch, results):
+            if not future.done():
+                future.set_result(articles)
+
+async def fetch_as_completed(jobs, concurrency=None, deadline=None):
+    """
+    Run fetch jobs concurrently and yield results as they complete
+    
+    Downloads run on the shared thread pool; the bodies are parsed in
+    batches on the parse process pool (or inline when PARSE_WORKERS is 0).
+    
+    Args:
+        jobs: List of FetchJob
+        concurrency: Maximum downloads in flight (defaults to FETCH_CONCURRENCY)
+        deadline: Seconds to wait for the whole crawl (None waits for all)
+    
+    Yields:
+        Tuples of (job index, job, articles, seconds spent downloading, error
+        message or None); jobs still running when the deadline passes are
+        cancelled and yielded with articles=None
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    semaphore = asyncio.Semaphore(concurrency or Config.FETCH_CONCURRENCY)
+    
+    parse_executor = get_parse_executor()
+    batcher = _ParseBatcher(loop, parse_executor) if parse_executor else None
+    
+    async def run(index, job):
+        async with semaphore:
+            articles, payload, elapsed, error = await loop.run_in_executor(
+                executor, _download_job, job, batcher is None
+            )
+        
+        if payload is not None:
+            articles = await batcher.parse(job, payload)
+            if articles is None:
+                articles, error = [], 'parse failed'
+            else:
+                await loop.run_in_executor(executor, _finish_job, job, payload, articles)
+        
+        return index, job, articles, elapsed, error
+    
+    tasks = [asyncio.ensure_future(run(index, job)) for index, job in enumerate(jobs)]
+    pending = set(tasks)
+    
+    try:
+        for task in asyncio.as_completed(tasks, timeout=deadline):
+            result = await task
+            pending.discard(tasks[result[0]])
+            yield result
+    except asyncio.TimeoutError:
+        # Stop waiting - the worker threads finish on their own socket timeouts
+        for task in pending:
+            task.cancel()
+        if batcher:
+            batcher.cancel()
+        for index, task in enumerate(tasks):
+            if task in pending:
+                yield index, jobs[index], None, None, 'deadline exceeded'
+
+async def _collect(jobs, concurrency, deadline, on_result):
+    results = [None] * len(jobs)
+    late_jobs = []
+    async for index, job, articles, elapsed, error in fetch_as_completed(jobs, concurrency, deadline):
+        if articles is None:
+            late_jobs.append(job)
+            continue
+        results[index] = articles
+        if on_result:
+            on_result(job, articles, elapsed, error)
+    return results, late_jobs
+
+def record_late_sources(late_jobs):
+    """
+    Record sources that missed the crawl deadline
+    
+    Args:
+        late_jobs: List of FetchJob that did not finish in time
+    """
+    if late_jobs:
+        logger.warning(
+            f'Crawl deadline passed with {len(late_jobs)} sources still running: '
+            f'{", ".join(job.target for job in late_jobs)}'
+        )
+    
+    cache_set(LATE_SOURCES_KEY, {
+        'recorded_at': int(time.time()),
+        'sources': [{'kind': job.kind, 'target': job.target} for job in late_jobs]
+    })
+
+def get_late_sources():
+    """Get the sources that missed the last crawl deadline"""
+    return cache_get(LATE_SOURCES_KEY) or {'recorded_at': None, 'sources': []}
+
+def run_fetch_jobs(jobs, concurrency=None, on_result=None, deadline=None):
+    """
+    Fetch all jobs concurrently and return the combined articles
+    
+    Args:
+        jobs: List of FetchJob
+        concurrency: Maximum jobs in flight (defaults to FETCH_CONCURRENCY)
+        on_result: Optional callback(job, articles, seconds taken, error
+            message or None) invoked as each job completes
+        deadline: Seconds to wait for the whole crawl (defaults to CRAWL_DEADLINE);
+            sources still running afterwards are recorded as late and skipped
+    
+    Returns:
+        List of articles from sources that finished in time, in job order
+    """
+    if not jobs:
+        return []
+    
+    if deadline is None:
+        deadline = Config.CRAWL_DEADLINE
+    
+    results, late_jobs = asyncio.run(_collect(jobs, concurrency, deadline, on_result))
+    record_late_sources(late_jobs)
+    
+    all_articles = []
+    for articles in results:
+        all_articles.extend(articles or [])
+    
+    return all_articles
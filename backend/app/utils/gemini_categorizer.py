@@ -1,11 +1,14 @@
-"""AI-powered article categorization using Gemini"""
-import os
-import time
-import google.generativeai as genai
-from app.core.cache import cache_get, cache_set
+"""AI-powered article categorization using Gemini, batched on a background queue"""
+import json
+import logging
+import queue
+import threading
+from app.core.cache import cache_get_many, cache_set_many
+from app.core.config import Config
+from app.utils.seen_entries import entry_hash
+from app.utils.token_bucket import TokenBucket
 
-genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-model = genai.GenerativeModel('gemini-2.0-flash')
+logger = logging.getLogger(__name__)
 
 CATEGORIES = [
     'AI', 'Security', 'Cloud', 'Mobile', 'Web', 'Hardware', 
@@ -13,78 +16,286 @@ CATEGORIES = [
     'DevOps', 'Cybersecurity', 'General'
 ]
 
-REQUEST_DELAY = 5  # seconds between requests
+CATEGORY_CACHE_PREFIX = 'gemini_cat'
+CATEGORY_CACHE_TTL = 86400  # 24h cache
 
-def categorize_with_gemini(title, summary=''):
+def _category_key(content_hash):
+    return f'{CATEGORY_CACHE_PREFIX}:{content_hash}'
+
+def gemini_model():
+    """Get the Gemini model used when no other model is plugged in"""
+    import google.generativeai as genai
+    
+    genai.configure(api_key=Config.GEMINI_API_KEY)
+    return genai.GenerativeModel(Config.GEMINI_MODEL)
+
+def build_prompt(items):
     """
-    Categorize article using Gemini API
+    Build one structured prompt categorizing many articles
     
     Args:
-        title: Article title
-        summary: Article summary
+        items: Queued items with 'title' and 'summary'
         
     Returns:
-        List of categories (primary first)
+        Prompt string
     """
-    cache_key = f"gemini_cat:{hash(title + summary)}"
-    cached = cache_get(cache_key)
-    if cached:
-        return cached.split(',')
+    articles = [
+        {'id': index, 'title': item['title'], 'summary': item['summary'][:500]}
+        for index, item in enumerate(items)
+    ]
     
-    prompt = f"""Categorize this tech article into 1-3 categories from this list: {', '.join(CATEGORIES)}
+    return f"""Categorize each tech article into 1-3 categories from this list: {', '.join(CATEGORIES)}
+
+Articles (JSON):
+{json.dumps(articles, ensure_ascii=False)}
+
+Return ONLY a JSON object mapping each article id to a list of category names, primary category first. No explanation."""
+
+def parse_response(text, count):
+    """
+    Parse the model's reply to a batch prompt
 
-Title: {title}
-Summary: {summary[:500]}
+    Args:
+        text: Response text (a JSON object, possibly in a code fence)
+        count: Number of articles in the prompt
 
-Return ONLY category names separated by commas, primary category first. No explanation."""
+    Returns:
+        Dict mapping article index to its valid categories (unusable answers omitted)
+    """
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end < start:
+        return {}
 
     try:
-        response = model.generate_content(prompt)
-        categories = [cat.strip() for cat in response.text.strip().split(',')]
-        categories = [cat for cat in categories if cat in CATEGORIES]
-        
-        if not categories:
-            categories = ['General']
-        
-        cache_set(cache_key, ','.join(categories), ttl=86400)  # 24h cache
-        return categories
-    except Exception as e:
-        from app.utils.categorizer import categorize_article
-        print(f"Gemini categorization failed: {e}")
-        return categorize_article(title, summary)
-
-def batch_categorize(articles, max_gemini=3):
+        answers = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(answers, dict):
+        return {}
+
+    results = {}
+    for key, categories in answers.items():
+        try:
+            index = int(key)
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= index < count or not isinstance(categories, list):
+            continue
+
+        valid = [category for category in categories if category in CATEGORIES][:3]
+        if valid:
+            results[index] = valid
+
+    return results
+
+def cached_categories(articles):
     """
-    Smart categorization: Gemini for new articles, keywords for cached
+    Get Gemini categories already stored for articles in their current form
+    
+    Args:
+        articles: List of articles
+    
+    Returns:
+        Dict mapping link to its categories (uncategorized articles omitted)
+    """
+    keys = {article.get('link'): _category_key(entry_hash(article)) for article in articles}
+    stored = cache_get_many(list(keys.values()))
+    
+    return {
+        link: stored[key].split(',')
+        for link, key in keys.items()
+        if stored.get(key)
+    }
+
+def batch_categorize(articles):
+    """
+    Smart categorization: Gemini categories when cached, keywords otherwise
+    
+    Never calls the model; submit the articles to a CategorizationQueue to
+    get Gemini categories for them later.
     
     Args:
         articles: List of articles with title and summary
-        max_gemini: Maximum new articles to categorize with Gemini (default: 3)
         
     Returns:
         Articles with updated categories
     """
     from app.utils.categorizer import categorize_article
     
-    gemini_count = 0
-    
+    cached = cached_categories(articles)
     for article in articles:
-        title = article.get('title', '')
-        summary = article.get('summary', '')
-        cache_key = f"gemini_cat:{hash(title + summary)}"
-        
-        # Check if already categorized by Gemini
-        cached = cache_get(cache_key)
-        if cached:
-            article['categories'] = cached.split(',')
-        elif gemini_count < max_gemini:
-            # Use Gemini for new articles (up to limit)
-            article['categories'] = categorize_with_gemini(title, summary)
-            gemini_count += 1
-            if gemini_count < max_gemini:
-                time.sleep(REQUEST_DELAY)
-        else:
-            # Use improved keyword categorization
-            article['categories'] = categorize_article(title, summary)
+        categories = cached.get(article.get('link'))
+        if categories is None:
+            categories = categorize_article(article.get('title', ''), article.get('summary', ''))
+        article['categories'] = categories
     
     return articles
+
+class CategorizationQueue:
+    """
+    Background queue categorizing articles with one model request per batch
+    
+    Articles are packed GEMINI_BATCH_SIZE to a prompt, requests are limited
+    by a token bucket (GEMINI_REQUESTS_PER_MINUTE), and each batch's results
+    are cached and handed to on_result as they arrive. Callers never wait on
+    the model.
+    """
+    
+    def __init__(self, model=None, on_result=None, batch_size=None, requests_per_minute=None, bucket=None, background=True):
+        """
+        Args:
+            model: Object with generate_content(prompt) returning a response
+                with .text (defaults to the Gemini model, created on first use)
+            on_result: Called with a list of (link, content hash, categories)
+                for every batch that returns results
+            batch_size: Articles per request (defaults to GEMINI_BATCH_SIZE)
+            requests_per_minute: Request quota (defaults to GEMINI_REQUESTS_PER_MINUTE)
+            bucket: TokenBucket to use instead of one built from the quota
+            background: Start a worker thread on submit (False leaves
+                batches for drain)
+        """
+        self._model = model
+        self._on_result = on_result
+        self.batch_size = batch_size or Config.GEMINI_BATCH_SIZE
+        rate = (requests_per_minute or Config.GEMINI_REQUESTS_PER_MINUTE) / 60.0
+        self._bucket = bucket or TokenBucket(rate, capacity=Config.GEMINI_BURST)
+        
+        self._queue = queue.Queue(maxsize=Config.GEMINI_QUEUE_SIZE)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._background = background
+        self._worker = None
+        self.dropped = 0
+    
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = gemini_model()
+        return self._model
+    
+    def submit(self, articles):
+        """
+        Queue articles for categorization without waiting
+        
+        Articles already categorized in their current form or already
+        queued are skipped; when the queue is full the rest are dropped and
+        keep their keyword categories.
+        
+        Args:
+            articles: List of articles
+        
+        Returns:
+            Number of articles queued
+        """
+        cached = cached_categories(articles)
+        
+        queued = 0
+        for article in articles:
+            link = article.get('link')
+            if not link or link in cached:
+                continue
+            
+            item = {
+                'link': link,
+                'hash': entry_hash(article),
+                'title': article.get('title', ''),
+                'summary': article.get('summary', ''),
+                'attempts': 0
+            }
+            if self._put(item):
+                queued += 1
+        
+        if queued and self._background:
+            self._ensure_worker()
+        return queued
+    
+    def _put(self, item):
+        with self._lock:
+            if (item['link'], item['hash']) in self._pending:
+                return False
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending.add((item['link'], item['hash']))
+            return True
+    
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='categorization-queue', daemon=True)
+                self._worker.start()
+    
+    def _take_batch(self, limit, wait=0):
+        """Take up to `limit` queued items, waiting up to `wait` seconds for each"""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get(timeout=wait) if wait else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        while True:
+            # Block for the first item, then give the batch a moment to fill
+            first = self._queue.get()
+            batch = [first] + self._take_batch(self.batch_size - 1, Config.GEMINI_BATCH_DELAY)
+            self._bucket.acquire()
+            self.process_batch(batch)
+    
+    def drain(self):
+        """Categorize everything queued in the calling thread (for scripts and tests)"""
+        while True:
+            batch = self._take_batch(self.batch_size)
+            if not batch:
+                return
+            self._bucket.acquire()
+            self.process_batch(batch)
+    
+    def process_batch(self, batch):
+        """
+        Categorize one batch with a single model request
+        
+        Args:
+            batch: Queued items
+        
+        Returns:
+            List of (link, content hash, categories) for the batch
+        """
+        with self._lock:
+            for item in batch:
+                self._pending.discard((item['link'], item['hash']))
+        
+        try:
+            response = self.model.generate_content(build_prompt(batch))
+            answers = parse_response(response.text, len(batch))
+        except Exception as e:
+            logger.warning(f'Gemini categorization failed: {str(e)}')
+            # Retry once later; until then articles keep their keyword categories
+            for item in batch:
+                if item['attempts'] < 1:
+                    self._put({**item, 'attempts': item['attempts'] + 1})
+            return []
+        
+        results = [
+            (item['link'], item['hash'], answers[index])
+            for index, item in enumerate(batch)
+            if index in answers
+        ]
+        if not results:
+            return results
+        
+        cache_set_many(
+            {_category_key(content_hash): ','.join(categories) for _, content_hash, categories in results},
+            ttl=CATEGORY_CACHE_TTL
+        )
+        
+        if self._on_result:
+            try:
+                self._on_result(results)
+            except Exception as e:
+                logger.error(f'Error storing Gemini categories: {str(e)}')
+        
+        return results
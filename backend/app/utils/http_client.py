@@ -0,0 +1,212 @@
+"""Pooled HTTP client for source fetchers with connect/read deadlines"""
+import socket
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import make_headers
+from urllib3.util.connection import allowed_gai_family, create_connection
+from app.core.config import Config
+
+USER_AGENT = 'ContentHub/1.0'
+
+# gzip/deflate, plus br when a brotli package is installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+class FetchTimeoutError(requests.exceptions.Timeout):
+    """Raised when a source exceeds its total fetch deadline"""
+
+# Shared session so connections (and TLS sessions) are reused per host
+_session = None
+_session_lock = threading.Lock()
+
+# Most hosts a fetch session keeps resolved addresses for
+DNS_CACHE_MAX_HOSTS = 1024
+
+class DnsCache:
+    """Bounded, thread-safe cache of resolved addresses with a DNS_CACHE_TTL expiry"""
+    
+    def __init__(self, max_hosts=DNS_CACHE_MAX_HOSTS, clock=time.monotonic):
+        self.max_hosts = max_hosts
+        self._clock = clock
+        self._entries = {}  # (host, port) -> (expires_at, addresses)
+        self._lock = threading.Lock()
+    
+    def resolve(self, host, port):
+        """
+        Resolve a host, reusing an unexpired earlier lookup
+        
+        Args:
+            host: Hostname
+            port: Port number
+        
+        Returns:
+            List of (address, port) to try in order
+        """
+        key = (host, port)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        addresses = [
+            (sockaddr[0], sockaddr[1])
+            for _, _, _, _, sockaddr in socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        ]
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (now + Config.DNS_CACHE_TTL, addresses)
+            if len(self._entries) > self.max_hosts:
+                self._evict(now)
+        return addresses
+    
+    def _evict(self, now):
+        # Drop expired lookups first, then the oldest until back under the bound
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) > self.max_hosts:
+            del self._entries[next(iter(self._entries))]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
+# Only connections made by the fetch session use this cache; other clients
+# (Redis, Postgres, Gemini) resolve through the system as usual
+_dns_cache = DnsCache()
+
+class _CachedDnsMixin:
+    """Connection that resolves its host through the fetch DNS cache"""
+    
+    def _new_conn(self):
+        if Config.DNS_CACHE_TTL <= 0:
+            return super()._new_conn()
+        
+        try:
+            addresses = _dns_cache.resolve(self._dns_host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        
+        error = NewConnectionError(self, f'No addresses found for {self.host}')
+        for address in addresses:
+            try:
+                return create_connection(
+                    address,
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options
+                )
+            except socket.timeout as e:
+                error = ConnectTimeoutError(self, f'Connection to {self.host} timed out. (connect timeout={self.timeout})')
+                error.__cause__ = e
+            except OSError as e:
+                error = NewConnectionError(self, f'Failed to establish a new connection: {e}')
+                error.__cause__ = e
+        raise error
+
+class _CachedDnsHTTPConnection(_CachedDnsMixin, HTTPConnection):
+    pass
+
+class _CachedDnsHTTPSConnection(_CachedDnsMixin, HTTPSConnection):
+    pass
+
+class _CachedDnsHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDnsHTTPConnection
+
+class _CachedDnsHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDnsHTTPSConnection
+
+class CachedDnsAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct connections resolve hosts through the fetch DNS cache"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedDnsHTTPConnectionPool,
+            'https': _CachedDnsHTTPSConnectionPool
+        }
+
+def clear_dns_cache():
+    """Forget all cached DNS lookups"""
+    _dns_cache.clear()
+
+def get_session():
+    """Get the shared pooled HTTP session"""
+    global _session
+    
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = CachedDnsAdapter(
+                    pool_connections=Config.HTTP_POOL_HOSTS,
+                    pool_maxsize=Config.FETCH_CONCURRENCY
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'User-Agent': USER_AGENT,
+                    'Accept-Encoding': ACCEPT_ENCODING
+                })
+                _session = session
+    
+    return _session
+
+def get_timeouts():
+    """Get (connect, read) timeouts for a single source request"""
+    return (Config.FETCH_CONNECT_TIMEOUT, Config.FETCH_READ_TIMEOUT)
+
+def fetch_url(url, headers=None, max_bytes=None):
+    """
+    Fetch a URL over the shared pool with per-source connect/read deadlines
+    
+    The read timeout only bounds the gap between socket reads, so the body
+    is streamed and the whole download is also capped at connect + read
+    seconds to stop slow-drip servers holding a worker.
+    
+    Args:
+        url: URL to fetch
+        headers: Optional extra request headers
+        max_bytes: Stop reading once this many (decompressed) bytes have
+            arrived; the body is cut to that size
+    
+    Returns:
+        requests.Response with the decompressed body already read into
+        response.content
+    """
+    connect_timeout, read_timeout = get_timeouts()
+    deadline = time.monotonic() + connect_timeout + read_timeout
+    
+    response = get_session().get(
+        url,
+        headers=headers,
+        timeout=(connect_timeout, read_timeout),
+        stream=True
+    )
+    
+    try:
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes is not None and size >= max_bytes:
+                break
+            if time.monotonic() > deadline:
+                raise FetchTimeoutError(f'Fetch deadline exceeded for {url}')
+        
+        # Store the body so response.content / response.json() work as usual
+        body = b''.join(chunks)
+        response._content = body[:max_bytes] if max_bytes is not None else body
+    finally:
+        # Returns the connection to the pool once the body is consumed
+        response.close()
+    
+    return response
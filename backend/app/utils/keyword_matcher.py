@@ -0,0 +1,100 @@
+"""Aho-Corasick keyword matcher shared by the categorizer and tag matcher"""
+from collections import deque
+from functools import lru_cache
+
+def _is_word(char):
+    # Same characters as \w in a str regex
+    return char.isalnum() or char == '_'
+
+class KeywordMatcher:
+    """
+    Automaton over lowercased keywords from several labelled groups
+    
+    A text is scanned once, whatever the number of keywords, and every
+    keyword found is reported with whether any occurrence stands on word
+    boundaries (as rf'\\b{keyword}\\b' would match).
+    """
+    
+    def __init__(self, groups):
+        """
+        Compile the automaton
+        
+        Args:
+            groups: Dict of group name to a dict of label -> keywords,
+                e.g. {'category': CATEGORIES, 'tag': TAG_KEYWORDS}
+        """
+        # keyword -> group -> labels (a label repeats if it lists the keyword twice)
+        self.labels = {}
+        for group, keywords_by_label in groups.items():
+            for label, keywords in keywords_by_label.items():
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    if keyword:
+                        self.labels.setdefault(keyword, {}).setdefault(group, []).append(label)
+        
+        goto = [{}]
+        outputs = [[]]
+        for keyword in self.labels:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append(keyword)
+        
+        # Breadth-first failure links, folded into a full transition table so
+        # scanning never walks them; each state also reports its fallback's keywords
+        fail = [0] * len(goto)
+        self._delta = [None] * len(goto)
+        self._delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            self._delta[state] = {**self._delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = self._delta[fail[state]].get(char, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+                queue.append(child)
+        
+        self._outputs = [tuple(output) for output in outputs]
+    
+    def scan(self, text):
+        """
+        Find every keyword occurring in a text
+        
+        Args:
+            text: Text to scan (lowercased by the caller)
+        
+        Returns:
+            Dict mapping each keyword found to True if any occurrence is a
+            whole-word match
+        """
+        hits = {}
+        delta, outputs = self._delta, self._outputs
+        
+        state = 0
+        for end, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            
+            for keyword in outputs[state]:
+                if hits.get(keyword):
+                    continue
+                start = end - len(keyword) + 1
+                hits[keyword] = (
+                    _is_word(keyword[0]) != (start > 0 and _is_word(text[start - 1])) and
+                    _is_word(keyword[-1]) != (end + 1 < len(text) and _is_word(text[end + 1]))
+                )
+        
+        return hits
+
+@lru_cache(maxsize=1)
+def get_keyword_matcher():
+    """Get the matcher compiled from CATEGORIES and TAG_KEYWORDS (built once per process)"""
+    from app.utils.categorizer import CATEGORIES
+    from app.utils.tag_matcher import TAG_KEYWORDS
+    
+    return KeywordMatcher({'category': CATEGORIES, 'tag': TAG_KEYWORDS})
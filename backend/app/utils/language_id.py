@@ -0,0 +1,150 @@
+"""Character trigram language identification scored in batch with NumPy"""
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+import numpy as np
+from app.core.config import Config
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'language_trigrams.json')
+
+# Detected languages remembered by content hash
+LANGUAGE_CACHE_SIZE = 50000
+
+_LETTERS_RE = re.compile(r'[^\W\d_]+')
+
+_model = None
+_model_lock = threading.Lock()
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def text_trigrams(text):
+    """
+    Split text into space-padded character trigrams of its words
+    
+    Args:
+        text: Text to split
+    
+    Returns:
+        List of trigrams, e.g. ' th', 'the', 'he ' for 'The'
+    """
+    trigrams = []
+    for word in _LETTERS_RE.findall(text.lower()):
+        padded = f' {word} '
+        trigrams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+def get_model():
+    """
+    Load the trigram model
+    
+    Returns:
+        Tuple of (language codes, trigram -> row index, log-probability
+        matrix of shape (trigrams, languages), per-language floor for
+        trigrams outside the model)
+    """
+    global _model
+    
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                with open(MODEL_PATH, encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                languages = data['languages']
+                floors = np.array([data['floors'][language] for language in languages], dtype=np.float32)
+                index = {}
+                for language in languages:
+                    for gram in data['profiles'][language]:
+                        index.setdefault(gram, len(index))
+                
+                # Trigrams missing from a language's profile score its floor
+                weights = np.tile(floors, (len(index), 1))
+                for column, language in enumerate(languages):
+                    for gram, log_prob in data['profiles'][language].items():
+                        weights[index[gram], column] = log_prob
+                
+                _model = (languages, index, weights, floors)
+    
+    return _model
+
+def _text_key(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def _score(texts):
+    """Score uncached texts in one matrix product"""
+    languages, index, weights, floors = get_model()
+    english = languages.index('en')
+    
+    counts = np.zeros((len(texts), len(index)), dtype=np.float32)
+    totals = np.zeros(len(texts), dtype=np.float32)
+    unknown = np.zeros(len(texts), dtype=np.float32)
+    rows, columns = [], []
+    for row, text in enumerate(texts):
+        trigrams = text_trigrams(text)
+        totals[row] = len(trigrams)
+        for gram in trigrams:
+            column = index.get(gram)
+            if column is None:
+                unknown[row] += 1
+            else:
+                rows.append(row)
+                columns.append(column)
+    np.add.at(counts, (rows, columns), 1)
+    
+    scores = counts @ weights + unknown[:, None] * floors[None, :]
+    best = scores.argmax(axis=1)
+    
+    # Average log-likelihood gain per trigram of the best language over English
+    margins = (scores[np.arange(len(texts)), best] - scores[:, english]) / np.maximum(totals, 1)
+    
+    results = []
+    for row in range(len(texts)):
+        if totals[row] < Config.LANGUAGE_MIN_TRIGRAMS:
+            results.append(None)
+        elif best[row] != english and margins[row] < Config.LANGUAGE_MIN_MARGIN:
+            results.append('en')
+        else:
+            results.append(languages[best[row]])
+    return results
+
+def detect_languages(texts):
+    """
+    Identify the language of each text
+    
+    Results are cached by content hash, so unchanged texts are never
+    re-scored. Another language only wins over English when it is ahead by
+    LANGUAGE_MIN_MARGIN per trigram.
+    
+    Args:
+        texts: List of texts
+    
+    Returns:
+        List of language codes in the same order (None for texts with fewer
+        than LANGUAGE_MIN_TRIGRAMS trigrams)
+    """
+    keys = [_text_key(text) for text in texts]
+    results = [None] * len(texts)
+    
+    missing = []
+    with _cache_lock:
+        for position, key in enumerate(keys):
+            if key in _cache:
+                _cache.move_to_end(key)
+                results[position] = _cache[key]
+            else:
+                missing.append(position)
+    
+    if missing:
+        scored = _score([texts[position] for position in missing])
+        with _cache_lock:
+            for position, language in zip(missing, scored):
+                results[position] = language
+                _cache[keys[position]] = language
+            while len(_cache) > LANGUAGE_CACHE_SIZE:
+                _cache.popitem(last=False)
+    
+    return results
@@ -0,0 +1,156 @@
+"""Near-duplicate story detection with SimHash and an LSH band index
+
+SimHash over word 3-shingles with a distance of a few bits only catches
+near-identical text (syndicated copies, reposts with small edits). The same
+story rewritten under a different headline shares too few shingles to
+cluster, and widening the distance far enough to catch it merges unrelated
+articles first.
+"""
+import hashlib
+import re
+from collections import defaultdict
+from app.core.config import Config
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# Texts shorter than this many words are too generic to cluster safely
+MIN_CLUSTER_WORDS = 4
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+def _words(article):
+    text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+    return _WORD_RE.findall(text)
+
+def simhash(words):
+    """
+    Compute the 64-bit SimHash of a text's word shingles
+    
+    Args:
+        words: Normalized words of the text
+    
+    Returns:
+        Integer fingerprint
+    """
+    if len(words) < SHINGLE_SIZE:
+        shingles = set(words)
+    else:
+        shingles = {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    
+    # One bit string per shingle; each fingerprint bit is the majority vote
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'), '064b')
+        for shingle in shingles
+    ]
+    half = len(rows) / 2
+    
+    fingerprint = 0
+    for column in zip(*rows):
+        fingerprint = (fingerprint << 1) | (column.count('1') > half)
+    return fingerprint
+
+def _find(parents, i):
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+def find_clusters(articles, max_distance=None):
+    """
+    Group articles telling the same story
+    
+    Fingerprints are split into max_distance + 1 bands, so any two within
+    max_distance bits share at least one band exactly. Only articles sharing
+    a band bucket are compared, which keeps clustering close to linear.
+    
+    Args:
+        articles: List of articles
+        max_distance: Maximum differing SimHash bits (defaults to
+            NEAR_DUPLICATE_DISTANCE; negative disables clustering)
+    
+    Returns:
+        List of clusters (lists of articles), ordered by each cluster's first
+        article, with articles in input order
+    """
+    if max_distance is None:
+        max_distance = Config.NEAR_DUPLICATE_DISTANCE
+    if max_distance < 0:
+        return [[article] for article in articles]
+    
+    bands = max_distance + 1
+    band_bits = SIMHASH_BITS // bands
+    band_mask = (1 << band_bits) - 1
+    
+    fingerprints = {}
+    buckets = defaultdict(list)
+    for i, article in enumerate(articles):
+        words = _words(article)
+        if len(words) < MIN_CLUSTER_WORDS:
+            continue
+        fingerprint = simhash(words)
+        fingerprints[i] = fingerprint
+        for band in range(bands):
+            buckets[(band, (fingerprint >> (band * band_bits)) & band_mask)].append(i)
+    
+    parents = list(range(len(articles)))
+    for members in buckets.values():
+        for a_pos, a in enumerate(members):
+            for b in members[a_pos + 1:]:
+                if bin(fingerprints[a] ^ fingerprints[b]).count('1') <= max_distance:
+                    root_a, root_b = _find(parents, a), _find(parents, b)
+                    if root_a != root_b:
+                        parents[max(root_a, root_b)] = min(root_a, root_b)
+    
+    clusters = defaultdict(list)
+    for i, article in enumerate(articles):
+        clusters[_find(parents, i)].append(article)
+    return [clusters[root] for root in sorted(clusters)]
+
+def _alternate(article):
+    return {
+        'title': article.get('title'),
+        'link': article.get('link'),
+        'source': article.get('source'),
+        'type': article.get('type'),
+        'published': article.get('published')
+    }
+
+def collapse_clusters(clusters, score=None):
+    """
+    Keep the best article of each cluster with the others attached
+    
+    Args:
+        clusters: Clusters from find_clusters
+        score: Callable ranking articles (defaults to their quality_score)
+    
+    Returns:
+        One article per cluster, in cluster order, each with an 'alternates'
+        list of the other versions of the story
+    """
+    score = score or (lambda article: article.get('quality_score') or 0)
+    
+    representatives = []
+    for cluster in clusters:
+        # Ties go to the earliest article in the cluster
+        best = max(range(len(cluster)), key=lambda i: (score(cluster[i]), -i))
+        representative = cluster[best]
+        representative['alternates'] = [
+            _alternate(article) for i, article in enumerate(cluster) if i != best
+        ]
+        representatives.append(representative)
+    
+    return representatives
+
+def collapse_near_duplicates(articles, score=None):
+    """
+    Collapse near-duplicate stories to their best version
+    
+    Args:
+        articles: List of articles
+        score: Callable ranking articles (defaults to their quality_score)
+    
+    Returns:
+        Articles with near-duplicates folded into 'alternates'
+    """
+    return collapse_clusters(find_clusters(articles), score)
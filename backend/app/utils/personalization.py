@@ -1,3 +1,18 @@
+from app.utils.source_registry import get_source_registry
+
+def _matches_sources(article, wanted, registry):
+    """Check if an article comes from one of the wanted sources (lowercased names)"""
+    name = (article.get('source') or '').lower()
+    if name in wanted:
+        return True
+    
+    # Sources picked from the registry (e.g. onboarding recommendations) by their Source name
+    entry = registry.lookup(article)
+    if entry is not None and entry.name.lower() in wanted:
+        return True
+    
+    return any(source in name for source in wanted)
+
 def filter_by_user_preferences(articles, feed_sources=None, feed_types=None):
     """
     Filter articles based on user preferences
@@ -14,9 +29,11 @@ def filter_by_user_preferences(articles, feed_sources=None, feed_types=None):
     
     # Filter by source names
     if feed_sources and len(feed_sources) > 0:
+        wanted = {source.lower() for source in feed_sources}
+        registry = get_source_registry()
         filtered = [
             article for article in filtered
-            if any(source.lower() in article.get('source', '').lower() for source in feed_sources)
+            if _matches_sources(article, wanted, registry)
         ]
     
     # Filter by feed types
@@ -1,6 +1,10 @@
 """Content quality scoring system"""
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+import numpy as np
+from app.core.config import Config
+from app.utils.dates import article_timestamp
 
 # Quality tier scores
 QUALITY_TIER_SCORES = {
@@ -27,6 +31,14 @@ CLICKBAIT_PATTERNS = [
     r'number \d+ will shock you',
 ]
 
+# Each pattern list compiled into one alternation, so a text is scanned once per list
+_SPAM_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in SPAM_PATTERNS), re.IGNORECASE)
+_CLICKBAIT_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in CLICKBAIT_PATTERNS), re.IGNORECASE)
+
+# Freshness by age: articles younger than each edge (seconds) get the matching score
+FRESHNESS_EDGES = np.array([6 * 3600, 24 * 3600, 3 * 86400, 7 * 86400, 30 * 86400], dtype=float)
+FRESHNESS_SCORES = np.array([1.0, 0.9, 0.7, 0.5, 0.3, 0.1])
+
 def calculate_source_score(source_name, source_tier='standard'):
     """
     Calculate score based on source reputation
@@ -51,81 +63,107 @@ def calculate_content_score(title, summary):
     Returns:
         Score between 0.0 and 1.0
     """
-    score = 1.0
+    return float(batch_content_scores([title], [summary])[0])
     
-    # Check title length
-    if len(title) < 10:
-        score -= 0.3
-    elif len(title) > 200:
-        score -= 0.2
+def batch_content_scores(titles, summaries):
+    """
+    Calculate content quality scores for many articles at once
     
-    # Check summary length
-    if len(summary) < 50:
-        score -= 0.2
+    Text features are extracted once per article, then the penalties are
+    applied over the whole batch.
     
-    # Check for spam patterns
-    text = f"{title} {summary}".lower()
-    for pattern in SPAM_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            score -= 0.4
-            break
+    Args:
+        titles: Article titles
+        summaries: Article summaries (same order as titles)
+    
+    Returns:
+        NumPy array of scores between 0.0 and 1.0
+    """
+    count = len(titles)
+    texts = [f"{title} {summary}".lower() for title, summary in zip(titles, summaries)]
     
-    # Check for clickbait
-    for pattern in CLICKBAIT_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            score -= 0.3
-            break
+    title_len = np.fromiter((len(title) for title in titles), dtype=float, count=count)
+    summary_len = np.fromiter((len(summary) for summary in summaries), dtype=float, count=count)
+    spam = np.fromiter((_SPAM_RE.search(text) is not None for text in texts), dtype=bool, count=count)
+    clickbait = np.fromiter((_CLICKBAIT_RE.search(text) is not None for text in texts), dtype=bool, count=count)
+    all_caps = np.fromiter((title.isupper() for title in titles), dtype=bool, count=count)
+    upper = np.fromiter((sum(1 for c in title if c.isupper()) for title in titles), dtype=float, count=count)
+    complete = np.fromiter((bool(title and summary) for title, summary in zip(titles, summaries)), dtype=bool, count=count)
+    
+    score = np.ones(count)
+    
+    # Check title and summary length
+    score -= np.where(title_len < 10, 0.3, np.where(title_len > 200, 0.2, 0.0))
+    score -= np.where(summary_len < 50, 0.2, 0.0)
+    
+    # Check for spam and clickbait
+    score -= np.where(spam, 0.4, 0.0)
+    score -= np.where(clickbait, 0.3, 0.0)
     
     # Check for excessive capitalization
-    if title.isupper() and len(title) > 10:
-        score -= 0.3
-    elif sum(1 for c in title if c.isupper()) / max(len(title), 1) > 0.5:
-        score -= 0.2
+    shouting = all_caps & (title_len > 10)
+    score -= np.where(shouting, 0.3, np.where(upper / np.maximum(title_len, 1) > 0.5, 0.2, 0.0))
     
     # Check for meaningful content
-    if title and summary:
-        score += 0.1
+    score += np.where(complete, 0.1, 0.0)
     
-    return max(score, 0.0)
+    return np.maximum(score, 0.0)
 
-def calculate_freshness_score(published_date):
+def calculate_freshness_score(published_ts, now=None):
     """
     Calculate score based on article freshness
-    
+
     Args:
-        published_date: ISO format date string
-        
+        published_ts: Published time in epoch seconds (None if unknown)
+        now: Current epoch seconds (defaults to time.time())
+
     Returns:
         Score between 0.0 and 1.0
     """
-    if not published_date:
+    if published_ts is None:
         return 0.5
-    
-    try:
-        pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-        pub_date = pub_date.replace(tzinfo=None)
-        now = datetime.utcnow()
-        age = now - pub_date
-        
-        # Future dates get low score
-        if age.total_seconds() < 0:
-            return 0.1
-        
-        # Score based on age
-        if age < timedelta(hours=6):
-            return 1.0
-        elif age < timedelta(hours=24):
-            return 0.9
-        elif age < timedelta(days=3):
-            return 0.7
-        elif age < timedelta(days=7):
-            return 0.5
-        elif age < timedelta(days=30):
-            return 0.3
-        else:
-            return 0.1
-    except Exception:
+
+    age = timedelta(seconds=(now if now is not None else time.time()) - published_ts)
+
+    # Future dates get low score
+    if age.total_seconds() < 0:
+        return 0.1
+
+    # Score based on age
+    if age < timedelta(hours=6):
+        return 1.0
+    elif age < timedelta(hours=24):
+        return 0.9
+    elif age < timedelta(days=3):
+        return 0.7
+    elif age < timedelta(days=7):
         return 0.5
+    elif age < timedelta(days=30):
+        return 0.3
+    else:
+        return 0.1
+
+def batch_freshness_scores(published_ts, now=None):
+    """
+    Calculate freshness scores for many articles at once
+    
+    Args:
+        published_ts: Published times in epoch seconds (None if unknown)
+        now: Current epoch seconds (defaults to time.time())
+    
+    Returns:
+        NumPy array of scores between 0.0 and 1.0
+    """
+    published = np.array([np.nan if ts is None else ts for ts in published_ts], dtype=float)
+    age = (now if now is not None else time.time()) - published
+    
+    scores = FRESHNESS_SCORES[np.searchsorted(FRESHNESS_EDGES, age, side='right')]
+    
+    # Future dates get low score, unknown dates a neutral one
+    scores[age < 0] = 0.1
+    scores[np.isnan(published)] = 0.5
+    
+    return scores
 
 def calculate_engagement_score(article_url, db):
     """
@@ -138,39 +176,32 @@ def calculate_engagement_score(article_url, db):
     Returns:
         Score between 0.0 and 1.0
     """
-    from app.models.read_history import ReadHistory
-    from app.models.bookmark import Bookmark
-    from app.models.article_feedback import ArticleFeedback
-    
-    # Count reads
-    read_count = db.query(ReadHistory).filter(
-        ReadHistory.article_url == article_url
-    ).count()
-    
-    # Count bookmarks
-    bookmark_count = db.query(Bookmark).filter(
-        Bookmark.article_url == article_url
-    ).count()
-    
-    # Count positive feedback
-    positive_feedback = db.query(ArticleFeedback).filter(
-        ArticleFeedback.article_url == article_url,
-        ArticleFeedback.feedback_type == 'helpful'
-    ).count()
-    
-    # Count negative feedback
-    negative_feedback = db.query(ArticleFeedback).filter(
-        ArticleFeedback.article_url == article_url,
-        ArticleFeedback.feedback_type.in_(['not_helpful', 'spam', 'low_quality'])
-    ).count()
-    
-    # Calculate engagement score
-    engagement = (read_count * 0.3) + (bookmark_count * 0.5) + (positive_feedback * 0.8) - (negative_feedback * 1.0)
+    from app.models.article_engagement import ArticleEngagement
     
-    # Normalize to 0-1 range (assuming max engagement of 100)
-    score = min(max(engagement / 100.0, 0.0), 1.0)
+    # Counts are kept up to date by the read, bookmark and feedback routes
+    counts = db.get(ArticleEngagement, article_url)
+    if counts is None:
+        return 0.0
     
-    return score
+    return engagement_from_counts(counts.reads, counts.bookmarks, counts.helpful, counts.negative)
+    
+def engagement_from_counts(reads, bookmarks, helpful, negative):
+    """
+    Calculate engagement score from an article's engagement counts
+    
+    Args:
+        reads: Number of users who read the article
+        bookmarks: Number of bookmarks
+        helpful: Number of helpful feedback votes
+        negative: Number of not_helpful, spam or low_quality votes
+    
+    Returns:
+        Score between 0.0 and 1.0
+    """
+    engagement = (reads * 0.3) + (bookmarks * 0.5) + (helpful * 0.8) - (negative * 1.0)
+    
+    # Normalize to 0-1 range (assuming max engagement of 100)
+    return min(max(engagement / 100.0, 0.0), 1.0)
 
 def calculate_relevance_score(article_tags, user_tag_ids):
     """
@@ -206,7 +237,7 @@ def calculate_relevance_score(article_tags, user_tag_ids):
     
     return score
 
-def calculate_quality_score(article, source_tier='standard', user_tag_ids=None, db=None):
+def calculate_quality_score(article, source_tier='standard', user_tag_ids=None, db=None, content_score=None):
     """
     Calculate overall quality score for an article
     
@@ -214,31 +245,96 @@ def calculate_quality_score(article, source_tier='standard', user_tag_ids=None,
         article: Article dict
         source_tier: Source quality tier
         user_tag_ids: User's selected tag IDs (optional)
-        db: Database session (optional, for engagement)
+        db: Database session (optional, adds engagement)
+        content_score: Precomputed content score (optional)
         
     Returns:
-        Score between 0.0 and 1.0
+        Quality score (engagement can lift it above 1.0)
     """
     # Component scores
     source_score = calculate_source_score(article.get('source', ''), source_tier)
-    content_score = calculate_content_score(article.get('title', ''), article.get('summary', ''))
-    freshness_score = calculate_freshness_score(article.get('published', ''))
+    if content_score is None:
+        content_score = calculate_content_score(article.get('title', ''), article.get('summary', ''))
+    freshness_score = calculate_freshness_score(article_timestamp(article))
     
     relevance_score = 0.5
     if user_tag_ids and article.get('tags'):
         relevance_score = calculate_relevance_score(article.get('tags', []), user_tag_ids)
     
-    # Weighted final score (without engagement)
+    # Weighted final score, with engagement as a bonus on top
     final_score = (
         source_score * 0.30 +
         content_score * 0.30 +
         freshness_score * 0.25 +
         relevance_score * 0.15
     )
+    if db is not None:
+        final_score += calculate_engagement_score(article.get('link'), db) * Config.ENGAGEMENT_WEIGHT
     
     return round(final_score, 3)
 
-def filter_by_quality(articles, min_score=0.4, source_tier='standard', user_tag_ids=None, db=None):
+def score_articles(articles, source_tier='standard', user_tag_ids=None, content_scores=None, now=None, engagement_scores=None, source_tiers=None):
+    """
+    Calculate quality scores for a whole snapshot at once
+    
+    Gives the same scores as calculate_quality_score. Stored content scores
+    are reused, so rescoring a processed snapshot only recomputes freshness
+    from published_ts against now.
+    
+    Args:
+        articles: List of article dicts
+        source_tier: Source quality tier
+        user_tag_ids: User's selected tag IDs (optional)
+        content_scores: Precomputed content scores keyed by article link (optional)
+        now: Current epoch seconds (defaults to time.time())
+        engagement_scores: Engagement scores keyed by article link (optional)
+        source_tiers: Source tiers keyed by article link, overriding source_tier (optional)
+    
+    Returns:
+        List of quality scores, in article order
+    """
+    content_scores = content_scores or {}
+    
+    source = calculate_source_score('', source_tier)
+    if source_tiers:
+        source = np.array([
+            calculate_source_score('', source_tiers.get(article.get('link'), source_tier))
+            for article in articles
+        ], dtype=float)
+    
+    content = np.array([
+        np.nan if content_scores.get(article.get('link')) is None else content_scores[article.get('link')]
+        for article in articles
+    ], dtype=float)
+    missing = np.flatnonzero(np.isnan(content))
+    if missing.size:
+        content[missing] = batch_content_scores(
+            [articles[i].get('title', '') for i in missing],
+            [articles[i].get('summary', '') for i in missing]
+        )
+    
+    freshness = batch_freshness_scores([article_timestamp(article) for article in articles], now)
+    
+    relevance = np.full(len(articles), 0.5)
+    if user_tag_ids:
+        for i, article in enumerate(articles):
+            if article.get('tags'):
+                relevance[i] = calculate_relevance_score(article['tags'], user_tag_ids)
+    
+    # Weighted final score, with engagement as a bonus on top
+    final = (
+        source * 0.30 +
+        content * 0.30 +
+        freshness * 0.25 +
+        relevance * 0.15
+    )
+    if engagement_scores:
+        engagement = np.array([engagement_scores.get(article.get('link'), 0.0) for article in articles], dtype=float)
+        final += engagement * Config.ENGAGEMENT_WEIGHT
+    
+    return [round(score, 3) for score in final.tolist()]
+
+def filter_by_quality(articles, min_score=0.4, source_tier='standard', user_tag_ids=None, db=None, content_scores=None, engagement_scores=None, source_tiers=None):
     """
     Filter articles by minimum quality score
     
@@ -247,16 +343,22 @@ def filter_by_quality(articles, min_score=0.4, source_tier='standard', user_tag_
         min_score: Minimum quality score threshold
         source_tier: Source quality tier
         user_tag_ids: User's selected tag IDs
-        db: Database session
+        db: Database session (optional, loads engagement when not given)
+        content_scores: Precomputed content scores keyed by article link
+        engagement_scores: Engagement scores keyed by article link
+        source_tiers: Source tiers keyed by article link (falls back to source_tier)
         
     Returns:
         Filtered and scored articles
     """
+    if engagement_scores is None and db is not None:
+        from app.services.engagement_service import get_engagement_scores
+        engagement_scores = get_engagement_scores(db, [article.get('link') for article in articles])
+    
     scored_articles = []
+    scores = score_articles(articles, source_tier, user_tag_ids, content_scores, engagement_scores=engagement_scores, source_tiers=source_tiers)
     
-    for article in articles:
-        score = calculate_quality_score(article, source_tier, user_tag_ids, db)
-        
+    for article, score in zip(articles, scores):
         if score >= min_score:
             article['quality_score'] = score
             scored_articles.append(article)
@@ -280,9 +382,8 @@ def is_spam(title, summary):
     text = f"{title} {summary}".lower()
     
     # Check spam patterns
-    for pattern in SPAM_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+    if _SPAM_RE.search(text):
+        return True
     
     # Check for excessive caps
     if title.isupper() and len(title) > 10:
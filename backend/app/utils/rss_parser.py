@@ -1,8 +1,31 @@
 import feedparser
 import html
 import re
-import concurrent.futures
 from typing import List
+from xml.parsers import expat
+from app.core.config import Config
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+CONTENT_NS = '{http://purl.org/rss/1.0/modules/content/}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+
+# Element tags understood by the streaming parser, mapped to entry fields
+STREAM_ENTRY_TAGS = {'item', ATOM_NS + 'entry'}
+STREAM_FIELD_TAGS = {
+    'title': 'title',
+    ATOM_NS + 'title': 'title',
+    'link': 'link',
+    ATOM_NS + 'link': 'link',
+    'description': 'summary',
+    ATOM_NS + 'summary': 'summary',
+    CONTENT_NS + 'encoded': 'content',
+    ATOM_NS + 'content': 'content',
+    'pubDate': 'published',
+    ATOM_NS + 'published': 'published',
+    DC_NS + 'date': 'published',
+    ATOM_NS + 'updated': 'updated',
+    'guid': 'guid'
+}
 
 def strip_html_tags(text):
     """Remove HTML tags and decode HTML entities"""
@@ -34,6 +57,252 @@ def is_spam_content(title, summary):
     text = f"{title} {summary}".lower()
     return any(re.search(pattern, text) for pattern in spam_patterns)
 
+def parse_feed_bytes(content, content_type='', url=''):
+    """
+    Parse a downloaded feed body with feedparser
+    
+    Args:
+        content: Feed body (already decompressed)
+        content_type: Content-Type header of the response
+        url: Final URL of the response
+    
+    Returns:
+        feedparser result
+    """
+    # Only pass headers that affect parsing - the body is already decompressed
+    return feedparser.parse(content, response_headers={
+        'content-type': content_type,
+        'content-location': url
+    })
+
+def _cap_markup(text, budget):
+    """Cut raw entry HTML to budget characters without leaving a partial tag"""
+    if len(text) <= budget:
+        return text
+    
+    text = text[:budget]
+    cut = text.rfind('<')
+    if cut > text.rfind('>'):
+        text = text[:cut]
+    return text
+
+class _NotStreamable(Exception):
+    """Raised inside the streaming parser when a feed needs feedparser"""
+
+def _qualified_tag(name):
+    # expat reports namespaced names as 'uri tag'; use ElementTree's '{uri}tag'
+    uri, _, tag = name.rpartition(' ')
+    return f'{{{uri}}}{tag}' if uri else tag
+
+def stream_feed(content):
+    """
+    Parse a well-formed RSS 2.0 or Atom feed incrementally
+    
+    Only the fields parse_feed uses are kept. The body is fed to expat in
+    chunks and capped at FEED_MAX_BYTES. Element text is collected from
+    expat's character data callbacks, so an entry's HTML stops being kept
+    once FEED_SUMMARY_BUDGET characters are read (the rest is still
+    scanned, but never buffered), and full content is only read when an
+    entry has no summary. An RSS guid that is a permalink stands in for a
+    missing link, as in feedparser.
+    
+    Args:
+        content: Feed body (already decompressed)
+    
+    Returns:
+        Tuple of (feed title or None, list of entry dicts), or None when the
+        body is not well-formed RSS 2.0/Atom and needs feedparser
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    parser = expat.ParserCreate(namespace_separator=' ')
+    budget = Config.FEED_SUMMARY_BUDGET
+    state = {'depth': 0, 'entry': None, 'feed_title': None, 'capture': None}
+    entries = []
+    
+    def start(name, attrs):
+        tag = _qualified_tag(name)
+        if state['depth'] == 0 and tag not in ('rss', ATOM_NS + 'feed'):
+            raise _NotStreamable()
+        state['depth'] += 1
+        
+        entry = state['entry']
+        if tag in STREAM_ENTRY_TAGS:
+            state['entry'] = {}
+            return
+        
+        field = STREAM_FIELD_TAGS.get(tag)
+        if field is None or state['capture'] is not None:
+            return
+        
+        if entry is None:
+            if field != 'title' or state['feed_title'] is not None:
+                return
+        elif field == 'link':
+            # Atom links are attributes; the first alternate link wins
+            href = attrs.get('href')
+            if href is not None:
+                if attrs.get('rel', 'alternate') == 'alternate':
+                    entry.setdefault('link', href)
+                return
+            if 'link' in entry:
+                return
+        elif field in ('summary', 'content'):
+            if attrs.get('type') == 'xhtml':
+                # Inline XHTML needs feedparser's serializer
+                raise _NotStreamable()
+            if field in entry or 'summary' in entry:
+                return
+        elif field == 'guid':
+            if 'guid' in entry or attrs.get('isPermaLink', 'true').lower() != 'true':
+                return
+        elif field in entry:
+            return
+        
+        # One character over the budget tells _cap_markup the HTML was cut
+        limit = budget + 1 if field in ('summary', 'content') else None
+        state['capture'] = {'field': field, 'depth': state['depth'], 'chunks': [], 'left': limit}
+    
+    def text(data):
+        capture = state['capture']
+        # Like ElementTree's elem.text, only text directly inside the element counts
+        if capture is None or capture['depth'] != state['depth']:
+            return
+        if capture['left'] is None:
+            capture['chunks'].append(data)
+        elif capture['left'] > 0:
+            capture['chunks'].append(data[:capture['left']])
+            capture['left'] -= len(capture['chunks'][-1])
+    
+    def end(name):
+        capture = state['capture']
+        depth = state['depth']
+        state['depth'] -= 1
+        
+        if capture is not None and capture['depth'] == depth:
+            state['capture'] = None
+            value = ''.join(capture['chunks'])
+            entry = state['entry']
+            if entry is None:
+                state['feed_title'] = value.strip()
+            elif capture['field'] in ('summary', 'content'):
+                entry[capture['field']] = _cap_markup(value, budget)
+            else:
+                entry.setdefault(capture['field'], value.strip())
+            return
+        
+        if _qualified_tag(name) in STREAM_ENTRY_TAGS and state['entry'] is not None:
+            entry = state['entry']
+            # Like feedparser, content stands in for a missing summary and a
+            # permalink guid for a missing link
+            content_html = entry.pop('content', None)
+            if content_html is not None:
+                entry.setdefault('summary', content_html)
+            guid = entry.pop('guid', None)
+            if guid and not entry.get('link'):
+                entry['link'] = guid
+            entries.append(entry)
+            state['entry'] = None
+    
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text
+    
+    try:
+        limit = min(len(content), Config.FEED_MAX_BYTES)
+        for offset in range(0, limit, 65536):
+            parser.Parse(content[offset:min(offset + 65536, limit)], False)
+        
+        if limit == len(content):
+            parser.Parse(b'', True)
+    except (expat.ExpatError, _NotStreamable):
+        return None
+    
+    return state['feed_title'], entries
+
+def parse_feed(url, payload):
+    """
+    Normalize a downloaded RSS feed into articles
+    
+    Runs in a parse worker process, so it must not touch the network or cache.
+    
+    Args:
+        url: RSS feed URL
+        payload: RawPayload downloaded for the feed
+    
+    Returns:
+        List of normalized articles from this feed
+    """
+    articles = []
+    
+    # Streaming fast path, falling back to feedparser for anything else
+    parsed = stream_feed(payload.content)
+    if parsed is None:
+        feed = parse_feed_bytes(
+            payload.content[:Config.FEED_MAX_BYTES],
+            payload.headers.get('Content-Type', ''),
+            payload.url
+        )
+        parsed = (feed.feed.get('title'), feed.entries)
+    feed_title, entries = parsed
+    
+    # Extract source name from feed title or URL
+    source_title = feed_title if feed_title is not None else url.split('/')[2]
+    # Clean up source name (remove descriptions)
+    if ':' in source_title:
+        source = source_title.split(':')[0].strip()
+    elif ' - ' in source_title:
+        source = source_title.split(' - ')[0].strip()
+    elif ' is ' in source_title.lower():
+        source = source_title.split(' is ')[0].strip()
+    else:
+        source = source_title
+    
+    # Process each entry in the feed
+    for entry in entries:
+        raw_title = entry.get('title', 'No Title')
+        raw_summary = entry.get('summary', entry.get('description', ''))
+        
+        # Skip spam content
+        if is_spam_content(raw_title, raw_summary):
+            continue
+        
+        # Clean summary
+        clean_summary = strip_html_tags(raw_summary)
+        
+        # Truncate to 2 sentences for cleaner display
+        clean_summary = truncate_to_sentences(clean_summary, max_sentences=2)
+        
+        # Hacker News specific: extract only meaningful text before metadata
+        if 'hnrss.org' in url or 'Hacker News' in source:
+            # Remove metadata lines (Article URL, Comments URL, Points, # Comments)
+            lines = clean_summary.split('\n')
+            meaningful_lines = []
+            for line in lines:
+                line = line.strip()
+                if line and not any(x in line for x in ['Article URL:', 'Comments URL:', 'Points:', '# Comments:']):
+                    meaningful_lines.append(line)
+            clean_summary = ' '.join(meaningful_lines) if meaningful_lines else 'Discussion on Hacker News'
+        
+        # Get published date with fallback
+        published = entry.get('published', entry.get('updated', entry.get('pubDate', '')))
+        if not published:
+            from datetime import datetime
+            published = datetime.utcnow().isoformat()
+        
+        article = {
+            'title': strip_html_tags(raw_title),
+            'link': entry.get('link', ''),
+            'summary': clean_summary,
+            'source': source,
+            'published': published,
+            'type': 'rss'
+        }
+        articles.append(article)
+    
+    return articles
+
 def fetch_single_feed(url: str) -> List[dict]:
     """
     Fetch and parse a single RSS feed
@@ -44,70 +313,13 @@ def fetch_single_feed(url: str) -> List[dict]:
     Returns:
         List of normalized articles from this feed
     """
-    articles = []
+    from app.utils.fetch_engine import FetchJob, fetch_source
     
     try:
-        # Parse the RSS feed
-        feed = feedparser.parse(url)
-        
-        # Extract source name from feed title or URL
-        source_title = feed.feed.get('title', url.split('/')[2])
-        # Clean up source name (remove descriptions)
-        if ':' in source_title:
-            source = source_title.split(':')[0].strip()
-        elif ' - ' in source_title:
-            source = source_title.split(' - ')[0].strip()
-        elif ' is ' in source_title.lower():
-            source = source_title.split(' is ')[0].strip()
-        else:
-            source = source_title
-        
-        # Process each entry in the feed
-        for entry in feed.entries:
-            raw_title = entry.get('title', 'No Title')
-            raw_summary = entry.get('summary', entry.get('description', ''))
-            
-            # Skip spam content
-            if is_spam_content(raw_title, raw_summary):
-                continue
-            
-            # Clean summary
-            clean_summary = strip_html_tags(raw_summary)
-            
-            # Truncate to 2 sentences for cleaner display
-            clean_summary = truncate_to_sentences(clean_summary, max_sentences=2)
-            
-            # Hacker News specific: extract only meaningful text before metadata
-            if 'hnrss.org' in url or 'Hacker News' in source:
-                # Remove metadata lines (Article URL, Comments URL, Points, # Comments)
-                lines = clean_summary.split('\n')
-                meaningful_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not any(x in line for x in ['Article URL:', 'Comments URL:', 'Points:', '# Comments:']):
-                        meaningful_lines.append(line)
-                clean_summary = ' '.join(meaningful_lines) if meaningful_lines else 'Discussion on Hacker News'
-            
-            # Get published date with fallback
-            published = entry.get('published', entry.get('updated', entry.get('pubDate', '')))
-            if not published:
-                from datetime import datetime
-                published = datetime.utcnow().isoformat()
-            
-            article = {
-                'title': strip_html_tags(raw_title),
-                'link': entry.get('link', ''),
-                'summary': clean_summary,
-                'source': source,
-                'published': published,
-                'type': 'rss'
-            }
-            articles.append(article)
-                
+        return fetch_source(FetchJob('rss', url))
     except Exception as e:
         print(f"Error fetching {url}: {str(e)}")
-    
-    return articles
+        return []
 
 
 def fetch_rss_feeds(feed_urls: List[str]) -> List[dict]:
@@ -120,20 +332,7 @@ def fetch_rss_feeds(feed_urls: List[str]) -> List[dict]:
     Returns:
         List of normalized articles from all feeds
     """
-    all_articles = []
+    from app.services.source_service import skip_open_circuits
+    from app.utils.fetch_engine import build_fetch_jobs, run_fetch_jobs
     
-    # Use ThreadPoolExecutor to fetch feeds concurrently
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all feed fetching tasks
-        future_to_url = {executor.submit(fetch_single_feed, url): url for url in feed_urls}
-        
-        # Collect results as they complete
-        for future in concurrent.futures.as_completed(future_to_url):
-            try:
-                articles = future.result()
-                all_articles.extend(articles)
-            except Exception as e:
-                url = future_to_url[future]
-                print(f"Error processing {url}: {str(e)}")
-    
-    return all_articles
+    return run_fetch_jobs(skip_open_circuits(build_fetch_jobs(rss_feeds=feed_urls)))
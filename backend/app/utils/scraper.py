@@ -1,6 +1,45 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from app.utils.http_client import fetch_url
+
+def parse_techmeme(content):
+    """
+    Parse headlines from a downloaded Techmeme page
+    
+    Args:
+        content: Page body
+    
+    Returns:
+        List of normalized articles
+    """
+    articles = []
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Techmeme structure: items with class 'item'
+    items = soup.find_all('div', class_='item')
+    
+    for item in items:
+        # Find the main story link
+        story_link = item.find('a', class_='ourh')
+        if story_link:
+            title = story_link.get_text(strip=True)
+            link = story_link.get('href', '')
+            
+            # Make relative URLs absolute
+            if link.startswith('/'):
+                link = f"https://www.techmeme.com{link}"
+            
+            article = {
+                'title': title,
+                'link': link,
+                'summary': '',
+                'source': 'Techmeme',
+                'published': datetime.now().isoformat(),
+                'type': 'scrape'
+            }
+            articles.append(article)
+    
+    return articles
 
 def scrape_techmeme(url):
     """
@@ -15,43 +54,61 @@ def scrape_techmeme(url):
     articles = []
     
     try:
-        response = requests.get(url, timeout=10)
+        response = fetch_url(url)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Techmeme structure: items with class 'item'
-        items = soup.find_all('div', class_='item')
-        
-        for item in items:
-            # Find the main story link
-            story_link = item.find('a', class_='ourh')
-            if story_link:
-                title = story_link.get_text(strip=True)
-                link = story_link.get('href', '')
-                
-                # Make relative URLs absolute
-                if link.startswith('/'):
-                    link = f"https://www.techmeme.com{link}"
-                
-                article = {
-                    'title': title,
-                    'link': link,
-                    'summary': '',
-                    'source': 'Techmeme',
-                    'published': datetime.now().isoformat(),
-                    'type': 'scrape'
-                }
-                articles.append(article)
+        articles = parse_techmeme(response.content)
                 
     except Exception as e:
         print(f"Error scraping {url}: {str(e)}")
     
     return articles
 
+def website_url(url):
+    """URL to download for a scrape source, or None when no site scraper matches"""
+    if 'techmeme.com' in url:
+        return url
+    
+    return None
+
+def parse_website(url, payload):
+    """
+    Parse a downloaded page using the matching site scraper
+    
+    Runs in a parse worker process, so it must not touch the network or cache.
+    
+    Args:
+        url: Scraped URL
+        payload: RawPayload downloaded for the page
+    
+    Returns:
+        List of normalized articles
+    """
+    if 'techmeme.com' in url:
+        return parse_techmeme(payload.content)
+    
+    return []
+
+def scrape_website(url):
+    """
+    Scrape a single website using the matching site scraper
+    
+    Args:
+        url: URL to scrape
+    
+    Returns:
+        List of normalized articles
+    """
+    from app.utils.fetch_engine import FetchJob, fetch_source
+    
+    try:
+        return fetch_source(FetchJob('scrape', url))
+    except Exception as e:
+        print(f"Error scraping {url}: {str(e)}")
+        return []
+
 def scrape_websites(urls):
     """
-    Scrape multiple websites
+    Scrape multiple websites concurrently
     
     Args:
         urls: List of URLs to scrape
@@ -59,11 +116,7 @@ def scrape_websites(urls):
     Returns:
         List of normalized articles
     """
-    all_articles = []
-    
-    for url in urls:
-        if 'techmeme.com' in url:
-            articles = scrape_techmeme(url)
-            all_articles.extend(articles)
+    from app.services.source_service import skip_open_circuits
+    from app.utils.fetch_engine import build_fetch_jobs, run_fetch_jobs
     
-    return all_articles
+    return run_fetch_jobs(skip_open_circuits(build_fetch_jobs(scrape_urls=urls)))
@@ -1,4 +1,4 @@
-from datetime import datetime
+from app.utils.dates import article_timestamp, parse_timestamp
 
 def search_articles(articles, keyword):
     """
@@ -49,43 +49,40 @@ def filter_by_source(articles, source_name):
 def filter_by_date_range(articles, start_date=None, end_date=None):
     """
     Filter articles by date range
-    
+
     Args:
         articles: List of articles
-        start_date: Start date (ISO format string)
-        end_date: End date (ISO format string)
-        
+        start_date: Start date (ISO format string, UTC unless it has an offset)
+        end_date: End date (ISO format string, UTC unless it has an offset)
+
     Returns:
         Filtered list of articles
     """
     if not start_date and not end_date:
         return articles
-    
+
+    start = parse_timestamp(start_date) if start_date else None
+    end = parse_timestamp(end_date) if end_date else None
+
+    # An unparseable bound matches nothing
+    if (start_date and start is None) or (end_date and end is None):
+        return []
+
     filtered = []
-    
+
     for article in articles:
-        published = article.get('published', '')
-        if not published:
+        article_ts = article_timestamp(article)
+        if article_ts is None:
             continue
-        
-        try:
-            article_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
-            article_date = article_date.replace(tzinfo=None)
-            
-            # Check start date
-            if start_date:
-                start = datetime.fromisoformat(start_date)
-                if article_date < start:
-                    continue
-            
-            # Check end date
-            if end_date:
-                end = datetime.fromisoformat(end_date)
-                if article_date > end:
-                    continue
-            
-            filtered.append(article)
-        except Exception:
+
+        # Check start date
+        if start is not None and article_ts < start:
             continue
-    
+
+        # Check end date
+        if end is not None and article_ts > end:
+            continue
+
+        filtered.append(article)
+
     return filtered
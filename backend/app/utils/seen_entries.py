@@ -0,0 +1,107 @@
+"""Seen-entry store so only new or changed articles are reprocessed"""
+import hashlib
+from app.core.cache import cache_get_many, cache_set_many
+from app.core.config import Config
+
+SEEN_ENTRY_PREFIX = 'seen_entry'
+
+def _entry_key(link):
+    return f'{SEEN_ENTRY_PREFIX}:{link}'
+
+def entry_hash(article):
+    """
+    Hash the fields that processing results depend on
+    
+    Args:
+        article: Article dict
+    
+    Returns:
+        Hex digest of title and summary
+    """
+    content = f"{article.get('title', '')}\0{article.get('summary', '')}"
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+def get_seen_entries(articles):
+    """
+    Get stored processing results for a list of articles
+    
+    Args:
+        articles: List of articles
+    
+    Returns:
+        Dict mapping link to its stored record ('hash', 'keep', 'categories',
+        'content_score'); unseen links are omitted
+    """
+    links = [article.get('link') for article in articles if article.get('link')]
+    stored = cache_get_many([_entry_key(link) for link in links])
+    
+    return {
+        link: stored[_entry_key(link)]
+        for link in links
+        if stored.get(_entry_key(link)) is not None
+    }
+
+def split_changed(articles, seen):
+    """
+    Split articles into those needing processing and those already seen
+    
+    Args:
+        articles: List of articles
+        seen: Dict returned by get_seen_entries
+    
+    Returns:
+        Tuple of (new or changed articles, unchanged articles)
+    """
+    changed = []
+    unchanged = []
+    
+    for article in articles:
+        record = seen.get(article.get('link'))
+        if record and record.get('hash') == entry_hash(article):
+            unchanged.append(article)
+        else:
+            changed.append(article)
+    
+    return changed, unchanged
+
+def update_seen_categories(results):
+    """
+    Replace the stored categories of articles categorized after processing
+    
+    Records are only updated while their content hash still matches, so a
+    late result never overwrites those of a newer version of the article.
+    
+    Args:
+        results: List of (link, content hash, categories)
+    
+    Returns:
+        Dict mapping link to its new categories, for the records updated
+    """
+    stored = get_seen_entries([{'link': link} for link, _, _ in results])
+    
+    updated = {}
+    for link, content_hash, categories in results:
+        record = stored.get(link)
+        if record and record.get('keep') and record.get('hash') == content_hash:
+            updated[link] = {**record, 'categories': categories}
+    
+    save_seen_entries(updated)
+    return {link: record['categories'] for link, record in updated.items()}
+
+def save_seen_entries(records):
+    """
+    Store processing results for new or changed articles
+    
+    Args:
+        records: Dict mapping link to its record
+    
+    Returns:
+        True if stored
+    """
+    if not records:
+        return True
+    
+    return cache_set_many(
+        {_entry_key(link): record for link, record in records.items()},
+        ttl=Config.SEEN_ENTRY_TTL
+    )
@@ -1,67 +1,95 @@
-import requests
-import feedparser
+import json
 from datetime import datetime
+from app.utils.rss_parser import parse_feed_bytes
 from app.utils.reddit_filter import should_filter_reddit_post, enhance_reddit_metadata, calculate_reddit_quality_score
 
-def scrape_reddit(subreddits):
+def subreddit_url(subreddit):
+    """Listing URL fetched for a subreddit"""
+    return f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
+
+def parse_subreddit(subreddit, payload):
     """
-    Scrape posts from Reddit subreddits with quality filtering
+    Normalize a downloaded subreddit listing with quality filtering
+    
+    Runs in a parse worker process, so it must not touch the network or cache.
     
     Args:
-        subreddits: List of subreddit names
-        
+        subreddit: Subreddit name
+        payload: RawPayload downloaded for the listing
+    
     Returns:
         List of normalized high-quality articles
     """
     articles = []
     
-    for subreddit in subreddits:
-        try:
-            url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=25"
-            headers = {'User-Agent': 'ContentHub/1.0'}
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            posts = data.get('data', {}).get('children', [])
-            
-            for post in posts:
-                post_data = post.get('data', {})
-                
-                # Apply quality filter
-                if should_filter_reddit_post(post_data, subreddit):
-                    continue
-                
-                # Enhance metadata
-                metadata = enhance_reddit_metadata(post_data)
-                
-                # Calculate quality score
-                quality_score = calculate_reddit_quality_score(metadata)
-                
-                article = {
-                    'title': post_data.get('title', 'No Title'),
-                    'link': f"https://www.reddit.com{post_data.get('permalink', '')}",
-                    'summary': post_data.get('selftext', '')[:200] if post_data.get('selftext') else '',
-                    'source': f"r/{subreddit}",
-                    'published': datetime.fromtimestamp(post_data.get('created_utc', 0)).isoformat(),
-                    'type': 'reddit',
-                    'metadata': metadata,
-                    'reddit_quality_score': quality_score,
-                    'engagement': {
-                        'score': metadata.get('score', 0),
-                        'comments': metadata.get('num_comments', 0),
-                        'awards': metadata.get('total_awards_received', 0)
-                    }
-                }
-                articles.append(article)
-                
-        except Exception as e:
-            print(f"Error scraping r/{subreddit}: {str(e)}")
+    data = json.loads(payload.content)
+    posts = data.get('data', {}).get('children', [])
+    
+    for post in posts:
+        post_data = post.get('data', {})
+        
+        # Apply quality filter
+        if should_filter_reddit_post(post_data, subreddit):
             continue
+        
+        # Enhance metadata
+        metadata = enhance_reddit_metadata(post_data)
+        
+        # Calculate quality score
+        quality_score = calculate_reddit_quality_score(metadata)
+        
+        article = {
+            'title': post_data.get('title', 'No Title'),
+            'link': f"https://www.reddit.com{post_data.get('permalink', '')}",
+            'summary': post_data.get('selftext', '')[:200] if post_data.get('selftext') else '',
+            'source': f"r/{subreddit}",
+            'published': datetime.fromtimestamp(post_data.get('created_utc', 0)).isoformat(),
+            'type': 'reddit',
+            'metadata': metadata,
+            'reddit_quality_score': quality_score,
+            'engagement': {
+                'score': metadata.get('score', 0),
+                'comments': metadata.get('num_comments', 0),
+                'awards': metadata.get('total_awards_received', 0)
+            }
+        }
+        articles.append(article)
     
     return articles
 
+def scrape_subreddit(subreddit):
+    """
+    Scrape posts from a single subreddit with quality filtering
+    
+    Args:
+        subreddit: Subreddit name
+    
+    Returns:
+        List of normalized high-quality articles
+    """
+    from app.utils.fetch_engine import FetchJob, fetch_source
+    
+    try:
+        return fetch_source(FetchJob('reddit', subreddit))
+    except Exception as e:
+        print(f"Error scraping r/{subreddit}: {str(e)}")
+        return []
+
+def scrape_reddit(subreddits):
+    """
+    Scrape posts from Reddit subreddits concurrently
+    
+    Args:
+        subreddits: List of subreddit names
+        
+    Returns:
+        List of normalized high-quality articles
+    """
+    from app.services.source_service import skip_open_circuits
+    from app.utils.fetch_engine import build_fetch_jobs, run_fetch_jobs
+    
+    return run_fetch_jobs(skip_open_circuits(build_fetch_jobs(subreddits=subreddits)))
+
 def truncate_at_third_fullstop(text):
     """Truncate text at the third full stop"""
     if not text:
@@ -75,54 +103,86 @@ def truncate_at_third_fullstop(text):
                 return text[:i+1]
     return text
 
-def scrape_youtube(channel_ids):
+def youtube_feed_url(channel_id):
+    """RSS feed URL fetched for a YouTube channel"""
+    return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+
+def parse_youtube_feed(channel_id, payload):
     """
-    Scrape videos from YouTube channels via RSS
+    Normalize a downloaded YouTube channel feed
+    
+    Runs in a parse worker process, so it must not touch the network or cache.
     
     Args:
-        channel_ids: List of YouTube channel IDs
-        
+        channel_id: YouTube channel ID
+        payload: RawPayload downloaded for the channel feed
+    
     Returns:
         List of normalized articles
     """
     articles = []
+    feed = parse_feed_bytes(payload.content, payload.headers.get('Content-Type', ''), payload.url)
     
-    for channel_id in channel_ids:
-        try:
-            url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            
-            feed = feedparser.parse(url)
-            channel_name = feed.feed.get('title', channel_id)
-            
-            for entry in feed.entries:
-                summary = entry.get('summary', '')
-                # Truncate YouTube descriptions at third full stop
-                if summary:
-                    summary = truncate_at_third_fullstop(summary)
-                
-                article = {
-                    'title': entry.get('title', 'No Title'),
-                    'link': entry.get('link', ''),
-                    'summary': summary,
-                    'source': channel_name,
-                    'published': entry.get('published', ''),
-                    'type': 'youtube',
-                    'metadata': {
-                        'channel_id': channel_id,
-                        'video_id': entry.get('yt_videoid', '')
-                    }
-                }
-                articles.append(article)
-                
-        except Exception as e:
-            print(f"Error scraping YouTube channel {channel_id}: {str(e)}")
-            continue
+    channel_name = feed.feed.get('title', channel_id)
+    
+    for entry in feed.entries:
+        summary = entry.get('summary', '')
+        # Truncate YouTube descriptions at third full stop
+        if summary:
+            summary = truncate_at_third_fullstop(summary)
+        
+        article = {
+            'title': entry.get('title', 'No Title'),
+            'link': entry.get('link', ''),
+            'summary': summary,
+            'source': channel_name,
+            'published': entry.get('published', ''),
+            'type': 'youtube',
+            'metadata': {
+                'channel_id': channel_id,
+                'video_id': entry.get('yt_videoid', '')
+            }
+        }
+        articles.append(article)
     
     return articles
 
+def scrape_youtube_channel(channel_id):
+    """
+    Scrape videos from a single YouTube channel via RSS
+    
+    Args:
+        channel_id: YouTube channel ID
+    
+    Returns:
+        List of normalized articles
+    """
+    from app.utils.fetch_engine import FetchJob, fetch_source
+    
+    try:
+        return fetch_source(FetchJob('youtube', channel_id))
+    except Exception as e:
+        print(f"Error scraping YouTube channel {channel_id}: {str(e)}")
+        return []
+
+def scrape_youtube(channel_ids):
+    """
+    Scrape videos from YouTube channels concurrently
+    
+    Args:
+        channel_ids: List of YouTube channel IDs
+        
+    Returns:
+        List of normalized articles
+    """
+    from app.services.source_service import skip_open_circuits
+    from app.utils.fetch_engine import build_fetch_jobs, run_fetch_jobs
+    
+    return run_fetch_jobs(skip_open_circuits(build_fetch_jobs(youtube_channels=channel_ids)))
+
 def scrape_social_media(reddit_subs=None, youtube_channels=None):
     """
-    Scrape all social media sources
+    Scrape all social media sources concurrently
     
     Args:
         reddit_subs: List of subreddit names
@@ -131,16 +191,8 @@ def scrape_social_media(reddit_subs=None, youtube_channels=None):
     Returns:
         List of normalized articles from all sources
     """
-    all_articles = []
-    
-    # Scrape Reddit with quality filtering
-    if reddit_subs:
-        reddit_articles = scrape_reddit(reddit_subs)
-        all_articles.extend(reddit_articles)
-    
-    # Scrape YouTube
-    if youtube_channels:
-        youtube_articles = scrape_youtube(youtube_channels)
-        all_articles.extend(youtube_articles)
+    from app.services.source_service import skip_open_circuits
+    from app.utils.fetch_engine import build_fetch_jobs, run_fetch_jobs
     
-    return all_articles
+    jobs = build_fetch_jobs(subreddits=reddit_subs, youtube_channels=youtube_channels)
+    return run_fetch_jobs(skip_open_circuits(jobs))
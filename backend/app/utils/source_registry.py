@@ -0,0 +1,157 @@
+"""Process-local registry of Source rows for O(1) tier, tag and category lookups"""
+from collections import namedtuple
+from urllib.parse import urlparse
+from app.core.cache import VersionedLocalCache
+from app.core.config import Config
+from app.utils.quality_scorer import QUALITY_TIER_SCORES
+
+# Bumped whenever Source rows are added or edited; processes reload when it changes
+SOURCE_REGISTRY_VERSION_KEY = 'sources:version'
+
+# key is the fetch job key ('rss:<feed url>') articles from the source are stored under
+SourceEntry = namedtuple(
+    'SourceEntry',
+    ['name', 'host', 'type', 'tier', 'tags', 'category', 'is_active', 'success_rate', 'key'],
+    defaults=(None,)
+)
+
+def url_host(url):
+    """Get the lowercased host of a URL without a leading www."""
+    host = urlparse(url or '').hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+class SourceRegistry:
+    """Lookup tables built once from every Source row"""
+    
+    def __init__(self, entries):
+        self.entries = entries
+        self.by_name = {entry.name.lower(): entry for entry in entries}
+        self.by_key = {entry.key: entry for entry in entries if entry.key}
+        
+        by_host = {}
+        self.by_tag = {}
+        for entry in entries:
+            if entry.host:
+                by_host.setdefault(entry.host, []).append(entry)
+            for tag in entry.tags:
+                self.by_tag.setdefault(tag, []).append(entry)
+        
+        # Hosts shared by several sources (reddit.com, youtube.com) only resolve by name
+        self.by_host = {host: matches[0] for host, matches in by_host.items() if len(matches) == 1}
+    
+    def lookup(self, article, key=None):
+        """
+        Find the Source an article came from
+        
+        Config-synced feeds are named after their feed URL and served from a
+        feed host, so their articles only resolve by the fetch job key.
+        
+        Args:
+            article: Article dict
+            key: Fetch job key the article was stored under (optional)
+        
+        Returns:
+            SourceEntry matched by fetch job key, then by source name, then
+            by link host, or None
+        """
+        entry = self.by_key.get(key) if key else None
+        if entry is None:
+            entry = self.by_name.get((article.get('source') or '').lower())
+        if entry is None:
+            entry = self.by_host.get(url_host(article.get('link')))
+        return entry
+    
+    def tier_for(self, article, default='standard', key=None):
+        """Get the quality tier of an article's source (default when unknown)"""
+        entry = self.lookup(article, key)
+        return entry.tier if entry and entry.tier else default
+    
+    def tiers_by_link(self, articles, default='standard', source_keys=None):
+        """
+        Get source quality tiers for a batch of articles
+        
+        Args:
+            articles: List of articles
+            default: Tier for articles from unknown sources
+            source_keys: Fetch job keys keyed by article link (optional)
+        
+        Returns:
+            Dict mapping article link to its source tier
+        """
+        source_keys = source_keys or {}
+        return {
+            article.get('link'): self.tier_for(article, default, source_keys.get(article.get('link')))
+            for article in articles
+        }
+    
+    def sources_for_tags(self, tags, limit=20):
+        """
+        Get active sources sharing any of the given tags
+        
+        Args:
+            tags: Tag IDs or names
+            limit: Maximum number of sources
+        
+        Returns:
+            List of SourceEntry, best tier and most reliable first
+        """
+        matches = {}
+        for tag in tags:
+            for entry in self.by_tag.get(str(tag), []):
+                if entry.is_active:
+                    matches[entry.name] = entry
+        
+        ranked = sorted(
+            matches.values(),
+            key=lambda entry: (QUALITY_TIER_SCORES.get(entry.tier, 0.5), entry.success_rate or 0.0),
+            reverse=True
+        )
+        return ranked[:limit]
+
+def _entry_for_source(source):
+    from app.services.source_service import job_for_source, source_key
+    
+    return SourceEntry(
+        name=source.name,
+        host=url_host(source.url),
+        type=source.type,
+        tier=source.quality_tier,
+        tags=tuple(str(tag) for tag in source.tags or ()),
+        category=source.category,
+        is_active=bool(source.is_active),
+        success_rate=source.success_rate,
+        key=source_key(job_for_source(source))
+    )
+
+def _load_registry(db=None):
+    from app.models.source import Source
+    
+    if db is not None:
+        return SourceRegistry([_entry_for_source(source) for source in db.query(Source).all()])
+    
+    from app.core.database import get_db
+    with get_db() as session:
+        return SourceRegistry([_entry_for_source(source) for source in session.query(Source).all()])
+
+_registry = VersionedLocalCache(
+    SOURCE_REGISTRY_VERSION_KEY,
+    load=_load_registry,
+    empty=lambda: SourceRegistry([]),
+    check_interval=Config.SOURCE_REGISTRY_CHECK_INTERVAL
+)
+
+def get_source_registry(db=None):
+    """
+    Get the process-local Source registry, reloading it after a version bump
+    
+    Args:
+        db: Database session to load with (optional)
+    
+    Returns:
+        SourceRegistry (empty if sources could not be loaded)
+    """
+    return _registry.get(db)
+
+def bump_source_registry():
+    """Make every process reload its registry (call after committing Source changes)"""
+    _registry.invalidate()
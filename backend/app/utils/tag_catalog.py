@@ -0,0 +1,50 @@
+"""Versioned, process-local catalog of database tags and their keyword matcher"""
+from app.core.cache import VersionedLocalCache
+from app.core.config import Config
+from app.utils.keyword_matcher import get_keyword_matcher
+from app.utils.tag_matcher import TAG_KEYWORDS
+
+# Bumped whenever rows in the tags table change; processes reload when it changes
+TAG_CATALOG_VERSION_KEY = 'tags:version'
+
+class TagCatalog:
+    """Tag IDs by name and the keywords of tags that exist in the database"""
+    
+    def __init__(self, tag_ids):
+        self.tag_ids = tag_ids
+        # Only tags in the database are matched; the shared matcher covers them all
+        self.keywords = {name: keywords for name, keywords in TAG_KEYWORDS.items() if name in tag_ids}
+        self.matcher = get_keyword_matcher()
+
+def _load_catalog(db=None):
+    from app.models.tag import Tag
+    
+    if db is not None:
+        return TagCatalog({name: tag_id for name, tag_id in db.query(Tag.name, Tag.id).all()})
+    
+    from app.core.database import get_db
+    with get_db() as session:
+        return TagCatalog({name: tag_id for name, tag_id in session.query(Tag.name, Tag.id).all()})
+
+_catalog = VersionedLocalCache(
+    TAG_CATALOG_VERSION_KEY,
+    load=_load_catalog,
+    empty=lambda: TagCatalog({}),
+    check_interval=Config.TAG_CATALOG_CHECK_INTERVAL
+)
+
+def get_tag_catalog(db=None):
+    """
+    Get the process-local tag catalog, reloading it after a version bump
+    
+    Args:
+        db: Database session to load with (optional)
+    
+    Returns:
+        TagCatalog (empty if tags could not be loaded)
+    """
+    return _catalog.get(db)
+
+def invalidate_tag_catalog():
+    """Make every process reload its tag catalog (call after committing changes to tags)"""
+    _catalog.invalidate()
@@ -1,5 +1,5 @@
 """Keyword-based tag matching for articles"""
-import re
+from app.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
 
 # Tag keyword mappings (more granular than categories)
 TAG_KEYWORDS = {
@@ -167,20 +167,19 @@ def add_tags_to_articles(articles, db):
     Returns:
         Articles with tags added
     """
-    from app.models.tag import Tag
-    
-    # Get all tags from database
-    all_tags_dict = {tag.name: tag.id for tag in db.query(Tag).all()}
+    from app.utils.tag_catalog import get_tag_catalog
     
-    # Filter TAG_KEYWORDS to only include tags that exist in database
-    available_keywords = {name: keywords for name, keywords in TAG_KEYWORDS.items() if name in all_tags_dict}
+    # Tags in the database and their matcher, cached until the tags table changes
+    catalog = get_tag_catalog(db)
+    all_tags_dict = catalog.tag_ids
     
     for article in articles:
         # Match tags using only available tags
         matched_tags = match_tags_from_dict(
             article.get('title', ''),
             article.get('summary', ''),
-            available_keywords
+            catalog.keywords,
+            matcher=catalog.matcher
         )
         
         # Convert to tag objects with IDs
@@ -197,7 +196,13 @@ def add_tags_to_articles(articles, db):
     
     return articles
 
-def match_tags_from_dict(title, summary='', keywords_dict=None, max_tags=3, min_confidence=0.5):
+def _matcher_for(keywords_dict):
+    """Get the shared matcher when keywords_dict is a subset of TAG_KEYWORDS, else compile one"""
+    if all(TAG_KEYWORDS.get(tag_name) is keywords for tag_name, keywords in keywords_dict.items()):
+        return get_keyword_matcher()
+    return KeywordMatcher({'tag': keywords_dict})
+
+def match_tags_from_dict(title, summary='', keywords_dict=None, max_tags=3, min_confidence=0.5, matcher=None):
     """
     Match article to tags based on provided keywords dictionary
     
@@ -207,6 +212,7 @@ def match_tags_from_dict(title, summary='', keywords_dict=None, max_tags=3, min_
         keywords_dict: Dictionary of tag names to keywords
         max_tags: Maximum number of tags to return
         min_confidence: Minimum confidence threshold (increased to 0.5)
+        matcher: KeywordMatcher covering keywords_dict (compiled or looked up if omitted)
         
     Returns:
         List of tuples (tag_name, confidence_score)
@@ -214,33 +220,27 @@ def match_tags_from_dict(title, summary='', keywords_dict=None, max_tags=3, min_
     if keywords_dict is None:
         keywords_dict = TAG_KEYWORDS
     
-    title_lower = title.lower()
-    summary_lower = summary.lower()
+    if matcher is None:
+        matcher = _matcher_for(keywords_dict)
+    title_hits = matcher.scan(title.lower())
+    summary_hits = matcher.scan(summary.lower())
     
-    tag_scores = {}
+    scores = {}
+    for hits, points in ((title_hits, 2.0), (summary_hits, 0.5)):
+        for keyword, whole_word in hits.items():
+            # ONLY exact word boundary matches; title matches worth more
+            if not whole_word:
+                continue
+            for tag_name in matcher.labels[keyword].get('tag', ()):
+                if tag_name in keywords_dict:
+                    scores[tag_name] = scores.get(tag_name, 0.0) + points
     
-    for tag_name, keywords in keywords_dict.items():
-        score = 0.0
-        has_match = False
-        
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            
-            # Title matches worth more (ONLY exact word boundary matches)
-            if keyword_lower in title_lower:
-                if re.search(rf'\b{re.escape(keyword_lower)}\b', title_lower):
-                    has_match = True
-                    score += 2.0  # Increased weight for title matches
-            
-            # Summary matches (ONLY exact word boundary matches)
-            if keyword_lower in summary_lower:
-                if re.search(rf'\b{re.escape(keyword_lower)}\b', summary_lower):
-                    has_match = True
-                    score += 0.5
-        
-        if has_match and score > 0:
+    tag_scores = {}
+    # Keep keywords_dict order so ties rank as before
+    for tag_name in keywords_dict:
+        if scores.get(tag_name, 0.0) > 0:
             # Stricter normalization
-            confidence = min(score / 3.0, 1.0)
+            confidence = min(scores[tag_name] / 3.0, 1.0)
             if confidence >= min_confidence:
                 tag_scores[tag_name] = confidence
     
@@ -0,0 +1,89 @@
+"""URL canonicalization shared by ingest dedup, read history, bookmarks and feedback"""
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Distinct URLs remembered by canonicalize_url
+CANONICAL_CACHE_SIZE = 16384
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref_src', 'ref_url', 'cmpid', '_hsenc', '_hsmi', 'mkt_tok'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def _keep_param(name, value):
+    name = name.lower()
+    if name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES):
+        return False
+    # AMP switches: ?amp, ?amp=1, ?outputType=amp
+    if name == 'amp' or (name == 'outputtype' and value.lower() == 'amp'):
+        return False
+    return True
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonicalize_url(url):
+    """
+    Get the canonical form of an article URL
+    
+    Lowercases the scheme and host, drops default ports, fragments,
+    tracking parameters and AMP variants, sorts the remaining query
+    parameters and removes trailing slashes from the path.
+    
+    Args:
+        url: Article URL
+    
+    Returns:
+        Canonical URL (non-HTTP values are only stripped of whitespace)
+    """
+    if not url or not isinstance(url, str):
+        return url
+    url = url.strip()
+    
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+    
+    host = parts.hostname.lower()
+    if ':' in host:
+        host = f'[{host}]'
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f'{host}:{port}'
+    if parts.username or parts.password:
+        host = f'{parts.netloc.rsplit("@", 1)[0]}@{host}'
+    
+    path = parts.path
+    if path.endswith('.amp.html'):
+        path = path[:-len('.amp.html')] + '.html'
+    path = path.rstrip('/')
+    if path.endswith('/amp'):
+        path = path[:-len('/amp')]
+    path = path or '/'
+    
+    params = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if _keep_param(name, value)]
+    query = urlencode(sorted(params))
+    
+    return urlunsplit((scheme, host, path, query, ''))
+
+def canonicalize_links(articles):
+    """
+    Replace each article's link with its canonical URL
+    
+    Args:
+        articles: List of article dicts (modified in place)
+    
+    Returns:
+        The same list
+    """
+    for article in articles:
+        if article.get('link'):
+            article['link'] = canonicalize_url(article['link'])
+    return articles